@@ -16,22 +16,54 @@ Selenium.
 :license: MIT, see LICENSE for more details.
 """
 
+from typing import TYPE_CHECKING
+
 from . import abilities, actions, questions, resolutions
-from .abilities import *  # noqa: F403
-from .actions import *  # noqa: F403
-from .configuration import settings
-from .exceptions import BrowsingError, TargetingError
-from .protocols import Chainable
-from .questions import *  # noqa: F403
-from .resolutions import *  # noqa: F403
-from .target import Target
+from .common import lazy_attributes
+
+if TYPE_CHECKING:
+    from .abilities import *  # noqa: F403
+    from .actions import *  # noqa: F403
+    from .configuration import settings
+    from .exceptions import BrowsingError, TargetingError
+    from .instrumentation import command_recorder
+    from .pool import BrowserPool
+    from .profiling import target_profiler
+    from .protocols import Chainable
+    from .questions import *  # noqa: F403
+    from .resolutions import *  # noqa: F403
+    from .target import Target
+    from .writer import background_writer
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "background_writer": ".writer",
+        "BrowserPool": ".pool",
+        "BrowsingError": ".exceptions",
+        "Chainable": ".protocols",
+        "command_recorder": ".instrumentation",
+        "settings": ".configuration",
+        "Target": ".target",
+        "TargetingError": ".exceptions",
+        "target_profiler": ".profiling",
+        **dict.fromkeys(abilities.__all__, ".abilities"),
+        **dict.fromkeys(actions.__all__, ".actions"),
+        **dict.fromkeys(questions.__all__, ".questions"),
+        **dict.fromkeys(resolutions.__all__, ".resolutions"),
+    },
+)
 
 __all__ = [
+    "background_writer",
+    "BrowserPool",
     "BrowsingError",
     "Chainable",
+    "command_recorder",
     "settings",
     "Target",
     "TargetingError",
+    "target_profiler",
 ]
 
 __all__ += abilities.__all__ + actions.__all__ + questions.__all__ + resolutions.__all__
@@ -1,7 +1,23 @@
 """Abilities that enable an Actor to use Selenium."""
 
-from .browse_the_web import BrowseTheWeb
+from typing import TYPE_CHECKING
+
+from ..common import lazy_attributes
+
+if TYPE_CHECKING:
+    from .browse_the_web import BrowseTheWeb
+    from .keep_recent_screenshots import KeepRecentScreenshots
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BrowseTheWeb": ".browse_the_web",
+        "KeepRecentScreenshots": ".keep_recent_screenshots",
+    },
+)
+
 
 __all__ = [
     "BrowseTheWeb",
+    "KeepRecentScreenshots",
 ]
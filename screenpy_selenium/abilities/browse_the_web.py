@@ -2,19 +2,55 @@
 
 from __future__ import annotations
 
+import atexit
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Union
 
-from selenium.webdriver import Chrome, Firefox, Remote, Safari
+from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException
 
+from ..configuration import settings
 from ..exceptions import BrowsingError
+from ..instrumentation import instrument
+from ..pool import BrowserLauncher
 
 if TYPE_CHECKING:
+    from selenium.webdriver.remote.errorhandler import ErrorHandler
     from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
     from typing_extensions import Self
 
+    from ..pool import BrowserPool
+
+    CachedElements = Union[WebElement, list[WebElement]]
+
 DEFAULT_APPIUM_HUB_URL = "http://localhost:4723/wd/hub"
 
+_prewarmed: dict[str, BrowserLauncher] = {}
+
+
+class _StaleElementWatcher:
+    """Wrap a browser's error handler to notice stale element references.
+
+    Every response from the browser passes through its error handler, so this
+    is the one place we can learn that a cached element has gone stale without
+    spending another round trip to ask.
+    """
+
+    def __init__(
+        self, error_handler: ErrorHandler, on_stale: Callable[[], None]
+    ) -> None:
+        self.error_handler = error_handler
+        self.on_stale = on_stale
+
+    def check_response(self, response: dict[str, Any]) -> None:
+        """Check the response, clearing the cache if an element went stale."""
+        try:
+            self.error_handler.check_response(response)
+        except StaleElementReferenceException:
+            self.on_stale()
+            raise
+
 
 class BrowseTheWeb:
     """Use Selenium to enable browsing the web with a web browser.
@@ -28,24 +64,71 @@ class BrowseTheWeb:
         Perry = AnActor.named("Perry").who_can(
             BrowseTheWeb.using(driver)
         )
+
+        Perry = AnActor.named("Perry").who_can(
+            BrowseTheWeb.from_pool(chrome_pool)
+        )
     """
 
     browser: WebDriver
+    pool: BrowserPool | None
+    element_cache: dict[Hashable, CachedElements]
+    window_handle: str | None
+    frame: Hashable | None
+
+    @classmethod
+    def prewarm(cls, browser_name: str, count: int = 1) -> None:
+        """Keep default browsers launching in the background.
+
+        Afterward, :meth:`using_chrome` or :meth:`using_firefox` hand back a
+        browser which has already started, and start launching its
+        replacement. Any browsers left over are quit when Python exits.
+
+        Args:
+            browser_name: "chrome" or "firefox".
+            count: how many browsers to keep ready.
+
+        Raises:
+            BrowsingError: if the browser can't be prewarmed.
+        """
+        browser_factories = {"chrome": webdriver.Chrome, "firefox": webdriver.Firefox}
+        if browser_name not in browser_factories:
+            msg = (
+                f'"{browser_name}" cannot be prewarmed; choose one of '
+                f"{', '.join(browser_factories)}."
+            )
+            raise BrowsingError(msg)
+
+        cls.stop_prewarming(browser_name)
+        launcher = BrowserLauncher(browser_factories[browser_name], count)
+        _prewarmed[browser_name] = launcher
+        atexit.register(launcher.close)
+
+    @classmethod
+    def stop_prewarming(cls, browser_name: str) -> None:
+        """Stop launching browsers, quitting any which are ready."""
+        launcher = _prewarmed.pop(browser_name, None)
+        if launcher is not None:
+            launcher.close()
 
     @classmethod
     def using_chrome(cls) -> Self:
         """Create and use a default Chrome Selenium webdriver instance."""
-        return cls.using(browser=Chrome())
+        if "chrome" in _prewarmed:
+            return cls.using(browser=_prewarmed["chrome"].take())
+        return cls.using(browser=webdriver.Chrome())
 
     @classmethod
     def using_firefox(cls) -> Self:
         """Create and use a default Firefox Selenium webdriver instance."""
-        return cls.using(browser=Firefox())
+        if "firefox" in _prewarmed:
+            return cls.using(browser=_prewarmed["firefox"].take())
+        return cls.using(browser=webdriver.Firefox())
 
     @classmethod
     def using_safari(cls) -> Self:
         """Create and use a default Safari Selenium webdriver instance."""
-        return cls.using(browser=Safari())
+        return cls.using(browser=webdriver.Safari())
 
     @classmethod
     def using_ios(cls) -> Self:
@@ -78,7 +161,7 @@ class BrowseTheWeb:
             msg = "IOS_DEVICE_VERSION Environment variable must be set."
             raise BrowsingError(msg)
 
-        return cls.using(browser=Remote(hub_url, IOS_CAPABILITIES))
+        return cls.using(browser=webdriver.Remote(hub_url, IOS_CAPABILITIES))
 
     @classmethod
     def using_android(cls) -> Self:
@@ -111,16 +194,74 @@ class BrowseTheWeb:
             msg = "ANDROID_DEVICE_VERSION environment variable must be set."
             raise BrowsingError(msg)
 
-        return cls.using(browser=Remote(hub_url, ANDROID_CAPABILITIES))
+        return cls.using(browser=webdriver.Remote(hub_url, ANDROID_CAPABILITIES))
 
     @classmethod
     def using(cls, browser: WebDriver) -> Self:
         """Provide an already-set-up WebDriver to use to browse the web."""
         return cls(browser=browser)
 
+    @classmethod
+    def from_pool(cls, pool: BrowserPool) -> Self:
+        """Borrow a browser from a pool, which gets it back when forgotten.
+
+        Borrowed browsers are not quit when the Actor exits; they are reset
+        and returned to the pool for the next Actor to use.
+        """
+        browse_the_web = cls.using(browser=pool.acquire())
+        browse_the_web.pool = pool
+        return browse_the_web
+
+    @property
+    def browsing_context(self) -> tuple[str | None, str | None, Hashable | None]:
+        """Describe the session, window, and frame the browser is looking at."""
+        session_id = getattr(self.browser, "session_id", None)
+        return (session_id, self.window_handle, self.frame)
+
+    def cache_element(self, key: Hashable, element: CachedElements) -> None:
+        """Remember the element(s) found for a key in the current context.
+
+        The cache is cleared whenever the browser reports a stale element
+        reference, so entries never outlive the page they were found on.
+        """
+        error_handler = getattr(self.browser, "error_handler", None)
+        if error_handler is not None and not isinstance(
+            error_handler, _StaleElementWatcher
+        ):
+            self.browser.error_handler = _StaleElementWatcher(  # type: ignore[assignment]
+                error_handler, self.clear_element_cache
+            )
+        self.element_cache[(self.browsing_context, key)] = element
+
+    def cached_element(self, key: Hashable) -> CachedElements | None:
+        """Recall the element(s) remembered for a key, if there are any."""
+        return self.element_cache.get((self.browsing_context, key))
+
+    def clear_element_cache(self) -> None:
+        """Forget all remembered elements, probably because the page changed."""
+        self.element_cache.clear()
+
+    def switched_to(
+        self, window_handle: str | None = None, frame: Hashable | None = None
+    ) -> None:
+        """Record a change of window or frame, which invalidates the cache."""
+        if window_handle is not None:
+            self.window_handle = window_handle
+        self.frame = frame
+        self.clear_element_cache()
+
     def forget(self) -> None:
-        """Quit the attached browser."""
-        self.browser.quit()
+        """Quit the attached browser, or return it to its pool."""
+        self.clear_element_cache()
+        if self.pool is None:
+            self.browser.quit()
+            return
+
+        error_handler = getattr(self.browser, "error_handler", None)
+        if isinstance(error_handler, _StaleElementWatcher):
+            self.browser.error_handler = error_handler.error_handler
+        self.pool.release(self.browser)
+        self.pool = None
 
     def __repr__(self) -> str:
         """Repr."""
@@ -129,4 +270,10 @@ class BrowseTheWeb:
     __str__ = __repr__
 
     def __init__(self, browser: WebDriver) -> None:
+        if settings.INSTRUMENT_COMMANDS:
+            instrument(browser)
         self.browser = browser
+        self.pool = None
+        self.element_cache = {}
+        self.window_handle = None
+        self.frame = None
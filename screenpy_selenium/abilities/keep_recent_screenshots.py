@@ -0,0 +1,154 @@
+"""Enable the actor to keep their most recent screenshots in memory."""
+
+from __future__ import annotations
+
+import collections
+import os
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, NamedTuple
+
+from ..configuration import settings
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+    from typing_extensions import Self
+
+
+class KeptScreenshot(NamedTuple):
+    """A screenshot waiting in memory, and where to save it."""
+
+    path: str
+    screenshot: bytes
+    console_log: str | None
+
+
+class KeepRecentScreenshots:
+    """Keep the most recent screenshots in memory, saving them only if needed.
+
+    While an Actor has this Ability,
+    :class:`~screenpy_selenium.actions.SaveScreenshot` keeps each screenshot
+    in memory instead of writing it (unless it is to be attached). Only the
+    most recent screenshots are kept, up to a number of them and a number of
+    bytes, so long scenarios can't use up the memory. They are written to
+    their paths when the scenario fails, or when asked.
+
+    Examples::
+
+        Perry = AnActor.named("Perry").who_can(
+            BrowseTheWeb.using_firefox(),
+            KeepRecentScreenshots.up_to(20).using_at_most(50_000_000),
+        )
+
+        with Perry.ability_to(KeepRecentScreenshots).saved_on_failure():
+            Perry.attempts_to(
+                Click.on_the(LOGIN_BUTTON),
+                SaveScreenshot.as_("after_login.png"),
+            )
+
+        Perry.ability_to(KeepRecentScreenshots).save_all()
+    """
+
+    count: int
+    max_bytes: int
+    console_logs: bool
+    kept: collections.deque[KeptScreenshot]
+
+    @classmethod
+    def up_to(cls, count: int) -> Self:
+        """Keep up to this many of the most recent screenshots."""
+        return cls(count=count)
+
+    def using_at_most(self, max_bytes: int) -> Self:
+        """Keep no more than this many bytes, dropping the oldest first."""
+        self.max_bytes = max_bytes
+        self._make_room()
+        return self
+
+    def and_console_logs(self) -> Self:
+        """Keep the browser's console log along with each screenshot.
+
+        Only some browsers (like Chrome) can give their console log. For the
+        others (like Firefox), only the screenshot is kept.
+        """
+        self.console_logs = True
+        return self
+
+    @property
+    def size(self) -> int:
+        """How many bytes are being kept."""
+        return self._size
+
+    def keep(
+        self, path: str, screenshot: bytes, console_log: str | None = None
+    ) -> None:
+        """Keep a screenshot (and console log), dropping the oldest if full."""
+        kept = KeptScreenshot(path, screenshot, console_log)
+        self.kept.append(kept)
+        self._size += self._size_of(kept)
+        self._make_room()
+
+    def save_all(self) -> list[str]:
+        """Write every kept screenshot (and console log) to its path.
+
+        Console logs are written next to their screenshots, with a ``.log``
+        extension. The screenshots are no longer kept afterward.
+
+        Returns:
+            The paths of the files which were written.
+        """
+        written = []
+        while self.kept:
+            kept = self.kept.popleft()
+            self._size -= self._size_of(kept)
+            with open(kept.path, "wb+") as screenshot_file:
+                screenshot_file.write(kept.screenshot)
+            written.append(kept.path)
+
+            if kept.console_log is not None:
+                log_path = f"{os.path.splitext(kept.path)[0]}.log"
+                with open(log_path, "w+", encoding="utf-8") as log_file:
+                    log_file.write(kept.console_log)
+                written.append(log_path)
+        return written
+
+    @contextmanager
+    def saved_on_failure(self) -> Iterator[None]:
+        """Save the kept screenshots if anything in the ``with`` block fails."""
+        try:
+            yield
+        except BaseException:
+            self.save_all()
+            raise
+
+    def forget(self) -> None:
+        """Let go of the kept screenshots, without saving them."""
+        self.kept.clear()
+        self._size = 0
+
+    def _make_room(self) -> None:
+        """Drop the oldest screenshots until the rest are within the limits."""
+        while self.kept and (
+            len(self.kept) > self.count or self._size > self.max_bytes
+        ):
+            self._size -= self._size_of(self.kept.popleft())
+
+    @staticmethod
+    def _size_of(kept: KeptScreenshot) -> int:
+        """Count the bytes a kept screenshot takes up."""
+        return len(kept.screenshot) + len(kept.console_log or "")
+
+    def __repr__(self) -> str:
+        """Repr."""
+        return "Keep Recent Screenshots"
+
+    __str__ = __repr__
+
+    def __init__(self, count: int | None = None, max_bytes: int | None = None) -> None:
+        self.count = settings.KEPT_SCREENSHOTS if count is None else count
+        self.max_bytes = (
+            settings.KEPT_SCREENSHOTS_MAX_BYTES if max_bytes is None else max_bytes
+        )
+        self.console_logs = False
+        self.kept = collections.deque()
+        self._size = 0
@@ -1,69 +1,180 @@
 """Actions an Actor can perform using their ability to BrowseTheWeb."""
 
-from .accept_alert import AcceptAlert
-from .chain import Chain
-from .clear import Clear
-from .click import Click
-from .dismiss_alert import DismissAlert
-from .double_click import DoubleClick
-from .enter import Enter
-from .enter_2fa_token import Enter2FAToken
-from .go_back import GoBack
-from .go_forward import GoForward
-from .hold_down import HoldDown
-from .move_mouse import MoveMouse
-from .open import Open
-from .pause import Pause
-from .refresh_page import RefreshPage
-from .release import Release
-from .respond_to_the_prompt import RespondToThePrompt
-from .right_click import RightClick
-from .save_console_log import SaveConsoleLog
-from .save_screenshot import SaveScreenshot
-from .select import Select, SelectByIndex, SelectByText, SelectByValue
-from .switch_to import SwitchTo
-from .switch_to_tab import SwitchToTab
-from .wait import Wait
+from typing import TYPE_CHECKING
+
+from ..common import lazy_attributes
+
+if TYPE_CHECKING:
+    from .accept_alert import AcceptAlert
+    from .chain import Chain
+    from .clear import Clear
+    from .click import Click
+    from .dismiss_alert import DismissAlert
+    from .double_click import DoubleClick
+    from .enter import Enter
+    from .enter_2fa_token import Enter2FAToken
+    from .fill_form import FillForm
+    from .go_back import GoBack
+    from .go_forward import GoForward
+    from .hold_down import HoldDown
+    from .move_mouse import MoveMouse
+    from .open import Open
+    from .pause import Pause
+    from .refresh_page import RefreshPage
+    from .release import Release
+    from .respond_to_the_prompt import RespondToThePrompt
+    from .right_click import RightClick
+    from .save_console_log import SaveConsoleLog
+    from .save_screenshot import SaveScreenshot
+    from .select import (
+        Deselect,
+        Select,
+        SelectByIndex,
+        SelectByText,
+        SelectByValue,
+        SelectOptions,
+    )
+    from .switch_to import SwitchTo
+    from .switch_to_tab import SwitchToTab
+    from .wait import Wait
+    from .within_command_budget import WithinCommandBudget
+
+    # Natural-language-enabling syntactic sugar
+    AcceptsAlert = AcceptAlert
+    Chains = Chain
+    Clears = Clear
+    Clicks = Click
+    ContextClick = ContextClicks = RightClick
+    DismissesAlert = DismissAlert
+    DismissTheAlert = DismissesTheAlert = DismissAlert
+    DoubleClicks = DoubleClick
+    Enters = Enter
+    Enters2FAToken = Enter2FAToken
+    FillsForm = FillForm
+    GoesBack = GoBack
+    GoesForward = GoForward
+    HoldsDown = HoldDown
+    Hover = Hovers = MoveMouse
+    MovesMouse = MoveMouse
+    Press = Presses = Enter
+    Pauses = Pause
+    Refresh = Refreshes = RefreshPage
+    Reload = Reloads = RefreshPage
+    ReloadPage = ReloadsPage = RefreshPage
+    RefreshesPage = RefreshPage
+    Releases = Release
+    RespondToPrompt = RespondsToPrompt = RespondToThePrompt
+    RespondsToThePrompt = RespondToThePrompt
+    RightClicks = RightClick
+    SavesConsoleLog = SaveConsoleLog
+    SavesScreenshot = SaveScreenshot
+    Selects = Select
+    SelectsByIndex = SelectByIndex
+    SelectsByText = SelectByText
+    SelectsByValue = SelectByValue
+    SelectsOptions = SelectOptions
+    Deselects = Deselect
+    SwitchesTo = SwitchTo
+    SwitchesToTab = SwitchToTab
+    SwitchToWindow = SwitchesToWindow = SwitchToTab
+    TakeScreenshot = TakesScreenshot = SaveScreenshot
+    Visit = Visits = Open
+    Opens = Open
+    Waits = Wait
+    StaysWithinCommandBudget = WithinCommandBudget
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AcceptAlert": ".accept_alert",
+        "Chain": ".chain",
+        "Clear": ".clear",
+        "Click": ".click",
+        "DismissAlert": ".dismiss_alert",
+        "DoubleClick": ".double_click",
+        "Enter": ".enter",
+        "Enter2FAToken": ".enter_2fa_token",
+        "FillForm": ".fill_form",
+        "GoBack": ".go_back",
+        "GoForward": ".go_forward",
+        "HoldDown": ".hold_down",
+        "MoveMouse": ".move_mouse",
+        "Open": ".open",
+        "Pause": ".pause",
+        "RefreshPage": ".refresh_page",
+        "Release": ".release",
+        "RespondToThePrompt": ".respond_to_the_prompt",
+        "RightClick": ".right_click",
+        "SaveConsoleLog": ".save_console_log",
+        "SaveScreenshot": ".save_screenshot",
+        "Select": ".select",
+        "SelectByIndex": ".select",
+        "SelectByText": ".select",
+        "SelectByValue": ".select",
+        "SelectOptions": ".select",
+        "Deselect": ".select",
+        "SwitchTo": ".switch_to",
+        "SwitchToTab": ".switch_to_tab",
+        "Wait": ".wait",
+        "WithinCommandBudget": ".within_command_budget",
+    },
+    {
+        "AcceptsAlert": "AcceptAlert",
+        "Chains": "Chain",
+        "Clears": "Clear",
+        "Clicks": "Click",
+        "ContextClick": "RightClick",
+        "ContextClicks": "RightClick",
+        "DismissesAlert": "DismissAlert",
+        "DismissTheAlert": "DismissAlert",
+        "DismissesTheAlert": "DismissAlert",
+        "DoubleClicks": "DoubleClick",
+        "Enters": "Enter",
+        "Enters2FAToken": "Enter2FAToken",
+        "FillsForm": "FillForm",
+        "GoesBack": "GoBack",
+        "GoesForward": "GoForward",
+        "HoldsDown": "HoldDown",
+        "Hover": "MoveMouse",
+        "Hovers": "MoveMouse",
+        "MovesMouse": "MoveMouse",
+        "Press": "Enter",
+        "Presses": "Enter",
+        "Pauses": "Pause",
+        "Refresh": "RefreshPage",
+        "Refreshes": "RefreshPage",
+        "Reload": "RefreshPage",
+        "Reloads": "RefreshPage",
+        "ReloadPage": "RefreshPage",
+        "ReloadsPage": "RefreshPage",
+        "RefreshesPage": "RefreshPage",
+        "Releases": "Release",
+        "RespondToPrompt": "RespondToThePrompt",
+        "RespondsToPrompt": "RespondToThePrompt",
+        "RespondsToThePrompt": "RespondToThePrompt",
+        "RightClicks": "RightClick",
+        "SavesConsoleLog": "SaveConsoleLog",
+        "SavesScreenshot": "SaveScreenshot",
+        "Selects": "Select",
+        "SelectsByIndex": "SelectByIndex",
+        "SelectsByText": "SelectByText",
+        "SelectsByValue": "SelectByValue",
+        "SelectsOptions": "SelectOptions",
+        "Deselects": "Deselect",
+        "SwitchesTo": "SwitchTo",
+        "SwitchesToTab": "SwitchToTab",
+        "SwitchToWindow": "SwitchToTab",
+        "SwitchesToWindow": "SwitchToTab",
+        "TakeScreenshot": "SaveScreenshot",
+        "TakesScreenshot": "SaveScreenshot",
+        "Visit": "Open",
+        "Visits": "Open",
+        "Opens": "Open",
+        "Waits": "Wait",
+        "StaysWithinCommandBudget": "WithinCommandBudget",
+    },
+)
 
-# Natural-language-enabling syntactic sugar
-AcceptsAlert = AcceptAlert
-Chains = Chain
-Clears = Clear
-Clicks = Click
-ContextClick = ContextClicks = RightClick
-DismissesAlert = DismissAlert
-DismissTheAlert = DismissesTheAlert = DismissAlert
-DoubleClicks = DoubleClick
-Enters = Enter
-Enters2FAToken = Enter2FAToken
-GoesBack = GoBack
-GoesForward = GoForward
-HoldsDown = HoldDown
-Hover = Hovers = MoveMouse
-MovesMouse = MoveMouse
-Press = Presses = Enter
-Pauses = Pause
-Refresh = Refreshes = RefreshPage
-Reload = Reloads = RefreshPage
-ReloadPage = ReloadsPage = RefreshPage
-RefreshesPage = RefreshPage
-Releases = Release
-RespondToPrompt = RespondsToPrompt = RespondToThePrompt
-RespondsToThePrompt = RespondToThePrompt
-RightClicks = RightClick
-SavesConsoleLog = SaveConsoleLog
-SavesScreenshot = SaveScreenshot
-Selects = Select
-SelectsByIndex = SelectByIndex
-SelectsByText = SelectByText
-SelectsByValue = SelectByValue
-SwitchesTo = SwitchTo
-SwitchesToTab = SwitchToTab
-SwitchToWindow = SwitchesToWindow = SwitchToTab
-TakeScreenshot = TakesScreenshot = SaveScreenshot
-Visit = Visits = Open
-Opens = Open
-Waits = Wait
 
 __all__ = [
     "AcceptAlert",
@@ -76,6 +187,8 @@ __all__ = [
     "Clicks",
     "ContextClick",
     "ContextClicks",
+    "Deselect",
+    "Deselects",
     "DismissAlert",
     "DismissesAlert",
     "DoubleClick",
@@ -84,6 +197,8 @@ __all__ = [
     "Enter2FAToken",
     "Enters",
     "Enters2FAToken",
+    "FillForm",
+    "FillsForm",
     "GoBack",
     "GoesBack",
     "GoesForward",
@@ -124,10 +239,13 @@ __all__ = [
     "SelectByIndex",
     "SelectByText",
     "SelectByValue",
+    "SelectOptions",
     "Selects",
     "SelectsByIndex",
     "SelectsByText",
     "SelectsByValue",
+    "SelectsOptions",
+    "StaysWithinCommandBudget",
     "SwitchesTo",
     "SwitchesToTab",
     "SwitchesToWindow",
@@ -140,4 +258,5 @@ __all__ = [
     "Visits",
     "Wait",
     "Waits",
+    "WithinCommandBudget",
 ]
@@ -2,18 +2,153 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterable
 
 from screenpy.exceptions import UnableToAct
 from screenpy.pacing import beat
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
 
 from ..abilities import BrowseTheWeb
 from ..configuration import settings
 from ..protocols import Chainable
+from ..target import Target
+from .click import Click
+from .double_click import DoubleClick
+from .enter import Enter
+from .hold_down import HoldDown
+from .move_mouse import MoveMouse
+from .pause import Pause
+from .release import Release
+from .right_click import RightClick
 
 if TYPE_CHECKING:
     from screenpy.actor import Actor
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from typing_extensions import Self
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+"""The key the W3C WebDriver protocol uses to refer to an element."""
+
+COMPILABLE_ACTIONS = (
+    Click,
+    DoubleClick,
+    Enter,
+    HoldDown,
+    MoveMouse,
+    Pause,
+    Release,
+    RightClick,
+)
+"""Chainable Actions which add the same steps to every chain they are in."""
+
+MODIFIER_KEYS = frozenset((Keys.SHIFT, Keys.CONTROL, Keys.ALT, Keys.META))
+"""Keys which only change other input, so pressing them again does nothing."""
+
+
+def _placeholder_id(index: int) -> str:
+    """Name the stand-in for the element of a compiled chain's nth Target."""
+    return f"screenpy-chain-target-{index}"
+
+
+def _nudge_offset(action: object) -> tuple[int, int] | None:
+    """Get the offset of an Action which moves the mouse from where it is."""
+    if isinstance(action, MoveMouse) and action.target is None:
+        return action.offset
+    return None
+
+
+def _modifier_key(action: object) -> str | None:
+    """Get the modifier key the Action holds down or releases, if any."""
+    if isinstance(action, (HoldDown, Release)) and action.key in MODIFIER_KEYS:
+        return None if action.lmb else action.key
+    return None
+
+
+def optimize(actions: Iterable[Chainable]) -> list[Chainable]:
+    """Remove the steps of a chain which don't change where it ends up.
+
+    * Consecutive :meth:`MoveMouse.by_offset` moves become one move.
+    * Pauses of no time at all are dropped.
+    * Modifier keys which are held, released and immediately held down
+      again, or held down while they are already held, stay held instead.
+
+    Returns:
+        The Actions to chain instead. The Actions given are not changed.
+    """
+    plan: list[Chainable] = []
+    held: set[str] = set()
+    # the key the last step of the plan released, if it was held before that
+    released_held_key: str | None = None
+    for action in actions:
+        previous = plan[-1] if plan else None
+        if isinstance(action, Pause) and action.time == 0:
+            continue
+        offset, previous_offset = _nudge_offset(action), _nudge_offset(previous)
+        if offset is not None and previous_offset is not None:
+            (x_offset, y_offset), (more_x, more_y) = previous_offset, offset
+            plan[-1] = MoveMouse.by_offset(x_offset + more_x, y_offset + more_y)
+            continue
+
+        key = _modifier_key(action)
+        if isinstance(action, HoldDown) and key is not None:
+            if key in held:
+                continue
+            if released_held_key == key:
+                plan.pop()
+                held.add(key)
+                released_held_key = None
+                continue
+            held.add(key)
+            plan.append(action)
+            released_held_key = None
+        elif isinstance(action, Release) and key is not None:
+            released_held_key = key if key in held else None
+            held.discard(key)
+            plan.append(action)
+        else:
+            plan.append(action)
+            released_held_key = None
+    return plan
+
+
+def _substitute(payload: Any, element_ids: dict[str, str]) -> Any:  # noqa: ANN401
+    """Copy the payload, swapping the placeholder element IDs for real ones."""
+    if isinstance(payload, dict):
+        if ELEMENT_KEY in payload and payload[ELEMENT_KEY] in element_ids:
+            return {ELEMENT_KEY: element_ids[payload[ELEMENT_KEY]]}
+        return {key: _substitute(value, element_ids) for key, value in payload.items()}
+    if isinstance(payload, list):
+        return [_substitute(value, element_ids) for value in payload]
+    return payload
+
+
+class CompiledChain:
+    """A Chain's W3C actions payload, waiting for the elements it acts on.
+
+    Each of the ``targets`` is referred to by a placeholder in the payload,
+    which is replaced with the real element when the chain is performed.
+    """
+
+    payload: dict[str, Any]
+    targets: list[Target]
+    duration: int
+
+    def bind(self, elements: list[WebElement]) -> dict[str, Any]:
+        """Fill in the payload with the element found for each Target."""
+        element_ids = {
+            _placeholder_id(index): element.id for index, element in enumerate(elements)
+        }
+        return _substitute(self.payload, element_ids)
+
+    def __init__(
+        self, payload: dict[str, Any], targets: list[Target], duration: int
+    ) -> None:
+        self.payload = payload
+        self.targets = targets
+        self.duration = duration
 
 
 class Chain:
@@ -22,6 +157,19 @@ class Chain:
     A Chain Action is expected to be instantiated with a list of Actions to
     perform in a series.
 
+    All of the Targets in the chain are found together, in one round trip,
+    before any of the steps are taken. The first time a Chain is performed,
+    its Actions are compiled into the steps to send to the browser, which are
+    remembered for the next time. Performing it again only finds the elements
+    and sends the steps, so the chained Actions are only narrated the first
+    time. Chains which contain Actions whose steps can change, like
+    :class:`~screenpy_selenium.actions.Enter2FAToken`, are built anew each
+    time.
+
+    Chains recorded from real input can be
+    :meth:`~screenpy_selenium.actions.Chain.optimized` before they are sent,
+    which takes out the steps that don't change the outcome.
+
     *Note*: Several Actions cannot be Chained, and will raise an exception.
 
     Abilities Required:
@@ -32,8 +180,42 @@ class Chain:
         the_actor.attempts_to(
             Chain(Hover.on_the(MENU_ICON), Click.on_the(SUBMENU_LINK))
         )
+
+        the_actor.attempts_to(Chain(*recorded_drag_and_drop).optimized())
     """
 
+    compiled: CompiledChain | None
+    optimizing: bool
+
+    def optimized(self) -> Self:
+        """Remove the steps which don't change where the chain ends up.
+
+        See :func:`~screenpy_selenium.actions.chain.optimize` for what is
+        removed, and :attr:`~screenpy_selenium.actions.Chain.plan` to see the
+        Actions which will be chained.
+        """
+        self.optimizing = True
+        self.compiled = None
+        return self
+
+    @property
+    def plan(self) -> list[Chainable]:
+        """The Actions which will be chained, once they are optimized."""
+        if self.optimizing:
+            return optimize(self.actions)
+        return list(self.actions)
+
+    @property
+    def compilable(self) -> bool:
+        """Whether the chained Actions add the same steps every time."""
+        return all(isinstance(action, COMPILABLE_ACTIONS) for action in self.actions)
+
+    @property
+    def targets(self) -> list[Target]:
+        """The Targets the chained Actions act on, each listed once."""
+        targets = (getattr(action, "target", None) for action in self.plan)
+        return list(dict.fromkeys(t for t in targets if isinstance(t, Target)))
+
     def describe(self) -> str:
         """Describe the Action in present tense."""
         return "Perform a thrilling chain of actions."
@@ -41,15 +223,44 @@ class Chain:
     @beat("{} performs a thrilling chain of Actions!")
     def perform_as(self, the_actor: Actor) -> None:
         """Choreograph the Actions and direct the Actor to perform the chain."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        the_chain = ActionChains(browser, duration=settings.CHAIN_DURATION)
-
         for action in self.actions:
             if not isinstance(action, Chainable):
                 msg = f"The {action.__class__.__name__} Action cannot be chained."
                 raise UnableToAct(msg)
-            action.add_to_chain(the_actor, the_chain)
-        the_chain.perform()
+
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        if not self.compilable:
+            targets = self.targets
+            elements = Target.resolve_all(the_actor, *targets)
+            the_chain = ActionChains(browser, duration=settings.CHAIN_DURATION)
+            with Target.bound_to(dict(zip(targets, elements))):
+                for action in self.plan:
+                    action.add_to_chain(the_actor, the_chain)
+            the_chain.perform()
+            return
+
+        if self.compiled is None or self.compiled.duration != settings.CHAIN_DURATION:
+            self.compiled = self._compile(the_actor, browser)
+        elements = Target.resolve_all(the_actor, *self.compiled.targets)
+        browser.execute(Command.W3C_ACTIONS, self.compiled.bind(elements))
+
+    def _compile(self, the_actor: Actor, browser: WebDriver) -> CompiledChain:
+        """Build the chain once, with placeholders in place of the elements."""
+        targets = self.targets
+        placeholders = {
+            target: WebElement(browser, _placeholder_id(index))
+            for index, target in enumerate(targets)
+        }
+        the_chain = ActionChains(browser, duration=settings.CHAIN_DURATION)
+        with Target.bound_to(placeholders):
+            for action in self.plan:
+                action.add_to_chain(the_actor, the_chain)
+
+        encoded = (device.encode() for device in the_chain.w3c_actions.devices)
+        payload = {"actions": [device for device in encoded if device["actions"]]}
+        return CompiledChain(payload, targets, settings.CHAIN_DURATION)
 
     def __init__(self, *actions: Chainable) -> None:
         self.actions = actions
+        self.compiled = None
+        self.optimizing = False
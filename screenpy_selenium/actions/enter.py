@@ -10,12 +10,15 @@ from screenpy.pacing import aside, beat
 from screenpy.speech_tools import represent_prop
 from selenium.common.exceptions import WebDriverException
 
+from ..abilities import BrowseTheWeb
 from ..common import pos_args_deprecated
+from ..scripts import SET_VALUE
 from ..speech_tools import KEY_NAMES
 
 if TYPE_CHECKING:
     from screenpy import Actor
     from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.webdriver.remote.webelement import WebElement
     from typing_extensions import Self
 
     from ..target import Target
@@ -32,12 +35,17 @@ class Enter:
         the_actor.attempts_to(
             Enter.the_text("Hello world!").into_the(COMMENT_FIELD)
         )
+
+        the_actor.attempts_to(
+            Enter.the_text(LARGE_JSON_PAYLOAD).into_the(REQUEST_BODY).instantly()
+        )
     """
 
     target: Target | None
     following_keys: list[str]
     text: str
     mask: bool
+    instant: bool
 
     @classmethod
     def the_text(cls, text: str) -> Self:
@@ -110,6 +118,23 @@ class Enter:
         """Alias for :meth:`~screenpy_selenium.actions.Enter.then_hit`."""
         return self.then_hit(*keys)
 
+    def instantly(self) -> Self:
+        """Set the text all at once, instead of typing it key by key.
+
+        Typing sends every character to the browser separately, which can
+        take many seconds for a large amount of text. This sets the field's
+        value in the page instead, then fires the ``input`` and ``change``
+        events, so don't use it for fields which listen for key presses.
+
+        The text is still typed if it contains special keys, or if the
+        element is not a textarea or a text input (so file inputs still get
+        their files). Keys from
+        :meth:`~screenpy_selenium.actions.Enter.then_hit` are always typed.
+        This has no effect in a :class:`~screenpy_selenium.actions.Chain`.
+        """
+        self.instant = True
+        return self
+
     @property
     def text_to_log(self) -> str:
         """Get a proper representation of the text."""
@@ -138,7 +163,8 @@ class Enter:
         element = self.target.found_by(the_actor)
 
         try:
-            element.send_keys(self.text)
+            if not (self.instant and self._set_instantly(the_actor, element)):
+                element.send_keys(self.text)
             for key in self.following_keys:
                 aside(f"then hits the {KEY_NAMES[key]} key")
                 element.send_keys(key)
@@ -149,6 +175,17 @@ class Enter:
             )
             raise DeliveryError(msg) from e
 
+    def _set_instantly(self, the_actor: Actor, element: WebElement) -> bool:
+        """Set the element's value in the page, if the text can be set that way.
+
+        Returns:
+            Whether the text was set.
+        """
+        if any(key in self.text for key in KEY_NAMES):
+            return False
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        return bool(browser.execute_script(SET_VALUE, element, self.text))
+
     @beat("  Enter {text_to_log} into the {target}!")
     def add_to_chain(self, the_actor: Actor, the_chain: ActionChains) -> None:
         """Add the Enter Action to a Chain of Actions."""
@@ -168,3 +205,4 @@ class Enter:
         self.target = None
         self.following_keys = []
         self.mask = mask
+        self.instant = False
@@ -0,0 +1,145 @@
+"""Fill in many form fields at once."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Mapping, Union
+
+from screenpy.exceptions import DeliveryError
+from screenpy.pacing import beat
+from selenium.common.exceptions import WebDriverException
+
+from ..abilities import BrowseTheWeb
+from ..scripts import FILL_FORM
+from ..target import Target
+from .clear import Clear
+from .click import Click
+from .enter import Enter
+from .select import SelectByText
+
+if TYPE_CHECKING:
+    from screenpy import Actor, Performable
+    from typing_extensions import Self
+
+FieldValue = Union[str, bool]
+
+
+class FillForm:
+    """Fill in many form fields, given the value for each field's Target.
+
+    Text is entered into inputs and textareas (replacing what was there), or
+    picks the option with that text from a dropdown. ``True`` or ``False``
+    checks or unchecks a checkbox or radio button.
+
+    All of the fields are found in one round trip to the browser and filled
+    in with one more. Fields which listen for real key presses can be filled
+    in one at a time instead, with
+    :meth:`~screenpy_selenium.actions.FillForm.field_by_field`.
+
+    Abilities Required:
+        :class:`~screenpy_selenium.abilities.BrowseTheWeb`
+
+    Examples::
+
+        the_actor.attempts_to(
+            FillForm.with_the(
+                {
+                    FIRST_NAME_FIELD: "Perry",
+                    COUNTRY_DROPDOWN: "Canada",
+                    NEWSLETTER_CHECKBOX: False,
+                }
+            )
+        )
+
+        the_actor.attempts_to(
+            FillForm.with_the({SEARCH_BAR: "screenpy"}).field_by_field()
+        )
+    """
+
+    fields: dict[Target, FieldValue]
+    one_at_a_time: bool
+
+    @classmethod
+    def with_the(cls, fields: Mapping[Target, FieldValue]) -> Self:
+        """Provide the value to fill in for each field.
+
+        Aliases:
+            * :meth:`~screenpy_selenium.actions.FillForm.using`
+        """
+        return cls(fields)
+
+    @classmethod
+    def using(cls, fields: Mapping[Target, FieldValue]) -> Self:
+        """Alias for :meth:`~screenpy_selenium.actions.FillForm.with_the`."""
+        return cls.with_the(fields)
+
+    def field_by_field(self) -> Self:
+        """Fill in each field with its own Actions, as a person would.
+
+        Each field is filled using :class:`~screenpy_selenium.actions.Enter`,
+        :class:`~screenpy_selenium.actions.Select`, or
+        :class:`~screenpy_selenium.actions.Click`. This is slower, but sends
+        the keystrokes that some fields (like autocompleting search bars)
+        need to notice the text.
+        """
+        self.one_at_a_time = True
+        return self
+
+    @property
+    def field_names(self) -> str:
+        """Get the names of the fields, for logging. Values may be secret."""
+        return ", ".join(f"the {target}" for target in self.fields)
+
+    def describe(self) -> str:
+        """Describe the Action in present tense."""
+        return f"Fill in {self.field_names}."
+
+    @beat("{} fills in {field_names}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        """Direct the Actor to fill in each of the fields.
+
+        Raises:
+            DeliveryError: if any of the fields could not be filled in.
+        """
+        if self.one_at_a_time:
+            for target, value in self.fields.items():
+                the_actor.attempts_to(*self._actions_for(the_actor, target, value))
+            return
+
+        targets = list(self.fields)
+        elements = Target.resolve_all(the_actor, *targets)
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        try:
+            problems = browser.execute_script(
+                FILL_FORM, [list(pair) for pair in zip(elements, self.fields.values())]
+            )
+        except WebDriverException as e:
+            msg = (
+                "Encountered an issue while attempting to fill in "
+                f"{self.field_names}: {e.__class__.__name__}"
+            )
+            raise DeliveryError(msg) from e
+
+        unfilled = [
+            f"the {target} ({problem})"
+            for target, problem in zip(targets, problems)
+            if problem is not None
+        ]
+        if unfilled:
+            msg = f"Could not fill in {', '.join(unfilled)}."
+            raise DeliveryError(msg)
+
+    @staticmethod
+    def _actions_for(
+        the_actor: Actor, target: Target, value: FieldValue
+    ) -> list[Performable]:
+        """Choose the Actions which fill in one field."""
+        element = target.found_by(the_actor)
+        if isinstance(value, bool):
+            return [Click.on_the(target)] if element.is_selected() != value else []
+        if element.tag_name.lower() == "select":
+            return [SelectByText(value, target)]
+        return [Clear.the_text_from_the(target), Enter.the_text(value).into_the(target)]
+
+    def __init__(self, fields: Mapping[Target, FieldValue]) -> None:
+        self.fields = dict(fields)
+        self.one_at_a_time = False
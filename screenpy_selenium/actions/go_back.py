@@ -30,5 +30,6 @@ class GoBack:
     @beat("{} goes back.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to press their browser's back button."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        browser.back()
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        browse_the_web.browser.back()
+        browse_the_web.clear_element_cache()
@@ -30,5 +30,6 @@ class GoForward:
     @beat("{} goes forward.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to press their browser's forward button."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        browser.forward()
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        browse_the_web.browser.forward()
+        browse_the_web.clear_element_cache()
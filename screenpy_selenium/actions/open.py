@@ -62,8 +62,9 @@ class Open:
     @beat("{} visits {url}")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to visit the specified URL."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        browser.get(self.url)
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        browse_the_web.browser.get(self.url)
+        browse_the_web.clear_element_cache()
 
     def __init__(self, location: str | object) -> None:
         url = getattr(location, "url", location)
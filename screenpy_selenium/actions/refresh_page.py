@@ -30,5 +30,6 @@ class RefreshPage:
     @beat("{} refreshes the page.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to refresh the page."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        browser.refresh()
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        browse_the_web.browser.refresh()
+        browse_the_web.clear_element_cache()
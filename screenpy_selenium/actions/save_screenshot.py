@@ -8,7 +8,9 @@ from typing import TYPE_CHECKING, Any
 from screenpy.actions import AttachTheFile
 from screenpy.pacing import beat
 
-from ..abilities import BrowseTheWeb
+from ..abilities import BrowseTheWeb, KeepRecentScreenshots
+from ..configuration import settings
+from ..writer import background_writer
 
 if TYPE_CHECKING:
     from screenpy import Actor
@@ -23,6 +25,16 @@ class SaveScreenshot:
     through the Narrator's adapters. This method also accepts any keyword
     arguments those adapters might require.
 
+    Screenshots can be written in the background, while the Actor carries on,
+    using :meth:`~screenpy_selenium.actions.SaveScreenshot.in_the_background`
+    or the ``SAVE_SCREENSHOTS_IN_BACKGROUND`` setting. Screenshots which are
+    attached are still written before they are attached.
+
+    If the Actor can
+    :class:`~screenpy_selenium.abilities.KeepRecentScreenshots`, screenshots
+    which are not attached are kept in memory instead, and only written if
+    they are needed.
+
     Abilities Required:
         :class:`~screenpy_selenium.abilities.BrowseTheWeb`
 
@@ -42,11 +54,14 @@ class SaveScreenshot:
                 attachment_type=AttachmentTypes.PNG,
             ),
         )
+
+        the_actor.attempts_to(SaveScreenshot.as_(filepath).in_the_background())
     """
 
     attach_kwargs: dict | None
     path: str
     filename: str
+    in_background: bool
 
     def describe(self) -> str:
         """Describe the Action in present tense."""
@@ -72,14 +87,41 @@ class SaveScreenshot:
 
     and_attach_it_with = and_attach_it
 
+    def in_the_background(self) -> Self:
+        """Write the screenshot on a background thread.
+
+        The file is written by the
+        :class:`~screenpy_selenium.writer.BackgroundWriter`, which
+        writes everything it is given before Python exits.
+        """
+        self.in_background = True
+        return self
+
     @beat("{} saves a screenshot as {filename}")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to save a screenshot."""
         browser = the_actor.ability_to(BrowseTheWeb).browser
         screenshot = browser.get_screenshot_as_png()
 
-        with open(self.path, "wb+") as screenshot_file:
-            screenshot_file.write(screenshot)
+        if self.attach_kwargs is None and the_actor.has_ability_to(
+            KeepRecentScreenshots
+        ):
+            keeper = the_actor.ability_to(KeepRecentScreenshots)
+            console_log = None
+            if keeper.console_logs and hasattr(browser, "get_log"):
+                log = browser.get_log("browser")
+                console_log = "\n".join([str(entry) for entry in log])
+            keeper.keep(self.path, screenshot, console_log)
+            return
+
+        if self.in_background:
+            written = background_writer.write(self.path, screenshot)
+            if self.attach_kwargs is not None:
+                # the adapters can only attach a file which is there.
+                written.result()
+        else:
+            with open(self.path, "wb+") as screenshot_file:
+                screenshot_file.write(screenshot)
 
         if self.attach_kwargs is not None:
             the_actor.attempts_to(AttachTheFile(self.path, **self.attach_kwargs))
@@ -88,3 +130,4 @@ class SaveScreenshot:
         self.path = path
         self.filename = path.split(os.path.sep)[-1]
         self.attach_kwargs = None
+        self.in_background = settings.SAVE_SCREENSHOTS_IN_BACKGROUND
@@ -9,6 +9,9 @@ from screenpy.pacing import beat
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.support.ui import Select as SeleniumSelect
 
+from ..abilities import BrowseTheWeb
+from ..scripts import SELECT_OPTIONS
+
 if TYPE_CHECKING:
     from screenpy import Actor
     from typing_extensions import Self
@@ -16,6 +19,45 @@ if TYPE_CHECKING:
     from ..target import Target
 
 
+def _select_in_browser(
+    the_actor: Actor,
+    target: Target,
+    how: str,
+    wanted: list[int] | list[str],
+    *,
+    selecting: bool = True,
+) -> None:
+    """Choose the options inside the page, with a single command.
+
+    Args:
+        the_actor: the Actor who is choosing the options.
+        target: the dropdown or multi-select field.
+        how: match options by their "text", "value", or "index".
+        wanted: the texts, values, or indexes of the options.
+        selecting: whether to select the options, or deselect them.
+
+    Raises:
+        DeliveryError: if the options could not be chosen.
+    """
+    element = target.found_by(the_actor)
+    browser = the_actor.ability_to(BrowseTheWeb).browser
+    action = "select" if selecting else "deselect"
+    try:
+        problem = browser.execute_script(
+            SELECT_OPTIONS, element, how, wanted, selecting
+        )
+    except WebDriverException as e:
+        msg = (
+            f"Encountered an issue while attempting to {action} options from "
+            f"{target}: {e.__class__.__name__}"
+        )
+        raise DeliveryError(msg) from e
+
+    if problem is not None:
+        msg = f"Could not {action} the options from {target}: {problem}."
+        raise DeliveryError(msg)
+
+
 class Select:
     """Select an option from a dropdown menu.
 
@@ -38,6 +80,16 @@ class Select:
         the_actor.attempts_to(
             Select.the_option_with_value("jan").from_the(MONTH_DROPDOWN)
         )
+
+        the_actor.attempts_to(
+            Select.the_option_named("Canada")
+            .from_the(COUNTRY_DROPDOWN)
+            .in_the_browser()
+        )
+
+        the_actor.attempts_to(
+            Select.the_options_named("Retail", "Banking").from_the(INDUSTRIES)
+        )
     """
 
     @staticmethod
@@ -55,6 +107,60 @@ class Select:
         """Select the option by its value."""
         return SelectByValue(value)
 
+    @staticmethod
+    def the_options_named(*texts: str) -> SelectOptions:
+        """Select many options in a multi-select field by their texts."""
+        return SelectOptions("text", list(texts))
+
+    @staticmethod
+    def the_options_at_indexes(*indexes: int | str) -> SelectOptions:
+        """Select many options in a multi-select field by their 0-based indexes."""
+        return SelectOptions("index", [int(index) for index in indexes])
+
+    @staticmethod
+    def the_options_with_values(*values: int | str) -> SelectOptions:
+        """Select many options in a multi-select field by their values."""
+        return SelectOptions("value", [str(value) for value in values])
+
+
+class Deselect:
+    """Deselect options from a multi-select field.
+
+    This is an entry point that will create a
+    :class:`~screenpy_selenium.actions.SelectOptions` Action which deselects
+    the options, depending on how the options need to be found.
+
+    Abilities Required:
+        :class:`~screenpy_selenium.abilities.BrowseTheWeb`
+
+    Examples::
+
+        the_actor.attempts_to(
+            Deselect.the_options_named("Retail", "Banking").from_the(INDUSTRIES)
+        )
+
+        the_actor.attempts_to(
+            Deselect.the_options_with_values("ret", "bank").from_the(INDUSTRIES)
+        )
+    """
+
+    @staticmethod
+    def the_options_named(*texts: str) -> SelectOptions:
+        """Deselect the options by their texts."""
+        return SelectOptions("text", list(texts), selecting=False)
+
+    @staticmethod
+    def the_options_at_indexes(*indexes: int | str) -> SelectOptions:
+        """Deselect the options by their 0-based indexes."""
+        return SelectOptions(
+            "index", [int(index) for index in indexes], selecting=False
+        )
+
+    @staticmethod
+    def the_options_with_values(*values: int | str) -> SelectOptions:
+        """Deselect the options by their values."""
+        return SelectOptions("value", [str(value) for value in values], selecting=False)
+
 
 class SelectByText:
     """Select an option in a dropdown or multi-select field by its text.
@@ -68,6 +174,7 @@ class SelectByText:
 
     target: Target | None
     text: str
+    in_browser: bool
 
     def from_the(self, target: Target) -> Self:
         """Target the dropdown or multi-select field to select the option from."""
@@ -76,6 +183,17 @@ class SelectByText:
 
     from_ = from_the_first_of_the = from_the
 
+    def in_the_browser(self) -> Self:
+        """Find and select the option inside the page, with one command.
+
+        Selenium's ``Select`` asks the browser about each option in turn,
+        which is slow for long dropdowns. This selects the option with a
+        script and fires the ``input`` and ``change`` events, but doesn't
+        click the option like a person would.
+        """
+        self.in_browser = True
+        return self
+
     def describe(self) -> str:
         """Describe the Action in present tense."""
         return f'Select the option "{self.text}" from the {self.target}.'
@@ -90,6 +208,10 @@ class SelectByText:
             )
             raise UnableToAct(msg)
 
+        if self.in_browser:
+            _select_in_browser(the_actor, self.target, "text", [self.text])
+            return
+
         element = self.target.found_by(the_actor)
         select = SeleniumSelect(element)
         try:
@@ -103,6 +225,7 @@ class SelectByText:
 
     def __init__(self, text: str, target: Target | None = None) -> None:
         self.target = target
+        self.in_browser = False
         self.text = text
 
 
@@ -118,6 +241,7 @@ class SelectByIndex:
 
     target: Target | None
     index: int
+    in_browser: bool
 
     def from_the(self, target: Target) -> Self:
         """Target the dropdown or multi-select field to select the option from."""
@@ -126,6 +250,17 @@ class SelectByIndex:
 
     from_ = from_the_first_of_the = from_the
 
+    def in_the_browser(self) -> Self:
+        """Find and select the option inside the page, with one command.
+
+        Selenium's ``Select`` asks the browser about each option in turn,
+        which is slow for long dropdowns. This selects the option with a
+        script and fires the ``input`` and ``change`` events, but doesn't
+        click the option like a person would.
+        """
+        self.in_browser = True
+        return self
+
     def describe(self) -> str:
         """Describe the Action in present tense."""
         return f"Select the option at index {self.index} from the {self.target}."
@@ -140,6 +275,10 @@ class SelectByIndex:
             )
             raise UnableToAct(msg)
 
+        if self.in_browser:
+            _select_in_browser(the_actor, self.target, "index", [self.index])
+            return
+
         element = self.target.found_by(the_actor)
         select = SeleniumSelect(element)
         try:
@@ -153,6 +292,7 @@ class SelectByIndex:
 
     def __init__(self, index: int | str, target: Target | None = None) -> None:
         self.target = target
+        self.in_browser = False
         self.index = int(index)
 
 
@@ -168,6 +308,7 @@ class SelectByValue:
 
     target: Target | None
     value: str
+    in_browser: bool
 
     def from_the(self, target: Target) -> Self:
         """Target the dropdown or multi-select field to select the option from."""
@@ -176,6 +317,17 @@ class SelectByValue:
 
     from_ = from_the_first_of_the = from_the
 
+    def in_the_browser(self) -> Self:
+        """Find and select the option inside the page, with one command.
+
+        Selenium's ``Select`` asks the browser about each option in turn,
+        which is slow for long dropdowns. This selects the option with a
+        script and fires the ``input`` and ``change`` events, but doesn't
+        click the option like a person would.
+        """
+        self.in_browser = True
+        return self
+
     def describe(self) -> str:
         """Describe the Action in present tense."""
         return f'Select the option with value "{self.value}" from the {self.target}.'
@@ -190,6 +342,10 @@ class SelectByValue:
             )
             raise UnableToAct(msg)
 
+        if self.in_browser:
+            _select_in_browser(the_actor, self.target, "value", [self.value])
+            return
+
         element = self.target.found_by(the_actor)
         select = SeleniumSelect(element)
         try:
@@ -203,4 +359,82 @@ class SelectByValue:
 
     def __init__(self, value: int | str, target: Target | None = None) -> None:
         self.target = target
+        self.in_browser = False
         self.value = str(value)
+
+
+class SelectOptions:
+    """Select or deselect many options in a multi-select field at once.
+
+    The field is found once, and all of the options are chosen inside the
+    page with a single command, which fires one ``change`` event. If any of
+    the options can't be found, none of them are chosen.
+
+    This Action will probably not be used directly, rather it will be returned
+    by calling :meth:`~screenpy_selenium.actions.Select.the_options_named` or
+    :meth:`~screenpy_selenium.actions.Deselect.the_options_named` (or their
+    siblings, for values and indexes).
+
+    Abilities Required:
+        :class:`~screenpy_selenium.abilities.BrowseTheWeb`
+    """
+
+    target: Target | None
+    how: str
+    options: list[int] | list[str]
+    selecting: bool
+
+    def from_the(self, target: Target) -> Self:
+        """Target the multi-select field to choose the options from."""
+        self.target = target
+        return self
+
+    from_ = from_the_first_of_the = from_the
+
+    @property
+    def verb(self) -> str:
+        """Get the verb for logging."""
+        return "select" if self.selecting else "deselect"
+
+    @property
+    def options_to_log(self) -> str:
+        """Get a proper representation of the options."""
+        if self.how == "index":
+            indexes = ", ".join(str(index) for index in self.options)
+            return f"at indexes {indexes}"
+        options = ", ".join(f'"{option}"' for option in self.options)
+        return f"with values {options}" if self.how == "value" else options
+
+    def describe(self) -> str:
+        """Describe the Action in present tense."""
+        return (
+            f"{self.verb.capitalize()} the options {self.options_to_log} "
+            f"from the {self.target}."
+        )
+
+    @beat("{} {verb}s the options {options_to_log} from the {target}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        """Direct the Actor to choose all of the options."""
+        if self.target is None:
+            msg = (
+                "Target was not provided for SelectOptions. Provide a Target using "
+                "the .from_() or .from_the() methods."
+            )
+            raise UnableToAct(msg)
+
+        _select_in_browser(
+            the_actor, self.target, self.how, self.options, selecting=self.selecting
+        )
+
+    def __init__(
+        self,
+        how: str,
+        options: list[int] | list[str],
+        target: Target | None = None,
+        *,
+        selecting: bool = True,
+    ) -> None:
+        self.how = how
+        self.options = options
+        self.target = target
+        self.selecting = selecting
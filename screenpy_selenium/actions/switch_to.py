@@ -47,11 +47,12 @@ class SwitchTo:
     @beat("{} switches to the {frame_to_log}.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to switch to an element or back to default."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
         if self.target is None:
-            browser.switch_to.default_content()
+            browse_the_web.browser.switch_to.default_content()
         else:
-            browser.switch_to.frame(self.target.found_by(the_actor))
+            browse_the_web.browser.switch_to.frame(self.target.found_by(the_actor))
+        browse_the_web.switched_to(frame=self.target)
 
     def __init__(self, target: Target | None, frame_to_log: str) -> None:
         self.target = target
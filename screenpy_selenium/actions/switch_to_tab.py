@@ -30,8 +30,11 @@ class SwitchToTab:
     @beat("{} switches to tab #{number}.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to switch to the specified tab."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        browser.switch_to.window(browser.window_handles[self.number - 1])
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        browser = browse_the_web.browser
+        window_handle = browser.window_handles[self.number - 1]
+        browser.switch_to.window(window_handle)
+        browse_the_web.switched_to(window_handle=window_handle)
 
     def __init__(self, number: int) -> None:
         self.number = number
@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 from screenpy import settings
 from screenpy.exceptions import DeliveryError
 from screenpy.pacing import beat
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import (
+    JavascriptException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from ..abilities import BrowseTheWeb
+from ..configuration import settings as selenium_settings
+from ..scripts import to_script_locator
+from ..target import Target
+from ..waiting import poll_until, wait_in_browser
 
 if TYPE_CHECKING:
     from screenpy import Actor
+    from selenium.webdriver.remote.webdriver import WebDriver
     from typing_extensions import Self
 
-    from ..target import Target
-
 
 class Wait:
     """Wait for the application to fulfill a given condition.
@@ -36,6 +44,8 @@ class Wait:
 
         the_actor.attempts_to(Wait.for(CONFETTI).to_disappear())
 
+        the_actor.attempts_to(Wait.for_the(LOGIN_FORM).to_appear().in_the_browser())
+
         the_actor.attempts_to(
             Wait(10).seconds_for_the(PARADE_FLOATS).to(float_on_by)
         )
@@ -54,6 +64,7 @@ class Wait:
     args: Iterable[Any]
     timeout: float
     log_detail: str | None
+    in_browser: bool
 
     @classmethod
     def for_the(cls, target: Target) -> Self:
@@ -120,6 +131,50 @@ class Wait:
             EC.text_to_be_present_in_element, 'for "{1}" to appear in the {0}...'
         ).with_(*self.args, text)
 
+    def in_the_browser(self) -> Self:
+        """Wait inside the browser, rather than by polling it.
+
+        The condition is sent into the page, which watches for changes and
+        answers as soon as the condition is met. This saves a round trip for
+        every poll, and reacts without waiting for the next poll.
+
+        Only the :meth:`to_appear`, :meth:`to_disappear`,
+        :meth:`to_be_clickable`, and :meth:`to_contain_text` strategies can
+        be waited for in the browser; other strategies will poll as usual.
+        If the page navigates away during the wait, the rest of the wait
+        polls as usual, too.
+        """
+        self.in_browser = True
+        return self
+
+    @property
+    def browser_condition(self) -> tuple[list[tuple[str, str]], str, str] | None:
+        """Translate the strategy into one the page can wait for, if possible."""
+        conditions = {
+            EC.visibility_of_element_located: "appear",
+            EC.invisibility_of_element_located: "disappear",
+            EC.element_to_be_clickable: "clickable",
+            EC.text_to_be_present_in_element: "contain_text",
+        }
+        condition = conditions.get(self.condition)
+        args = list(self.args)
+        if condition is None or not args:
+            return None
+
+        locator = args[0]
+        if isinstance(locator, Target):
+            script_locator = locator.script_locator
+        elif isinstance(locator, tuple):
+            single_locator = to_script_locator(locator)
+            script_locator = None if single_locator is None else [single_locator]
+        else:
+            return None
+        if script_locator is None:
+            return None
+
+        text = str(args[1]) if condition == "contain_text" else ""
+        return (script_locator, condition, text)
+
     @property
     def log_message(self) -> str:
         """Format the nice log message, or give back the default."""
@@ -136,11 +191,13 @@ class Wait:
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to wait for the condition to be satisfied."""
         browser = the_actor.ability_to(BrowseTheWeb).browser
+        browser_condition = self.browser_condition if self.in_browser else None
 
         try:
-            WebDriverWait(browser, self.timeout, settings.POLLING).until(
-                self.condition(*self.args)
-            )
+            if browser_condition is None:
+                self._poll(browser, self.timeout)
+            else:
+                self._wait_in_browser(browser, *browser_condition)
         except WebDriverException as e:
             msg = (
                 f"Encountered an exception using {self.condition.__name__} with "
@@ -148,6 +205,38 @@ class Wait:
             )
             raise DeliveryError(msg) from e
 
+    def _poll(self, browser: WebDriver, timeout: float) -> None:
+        """Ask the browser whether the condition is met until it is."""
+        if selenium_settings.POLLING_POLICY == "fixed":
+            WebDriverWait(browser, timeout, settings.POLLING).until(
+                self.condition(*self.args)
+            )
+        else:
+            poll_until(browser, self.condition(*self.args), timeout, settings.POLLING)
+
+    def _wait_in_browser(
+        self,
+        browser: WebDriver,
+        script_locator: list[tuple[str, str]],
+        condition: str,
+        text: str,
+    ) -> None:
+        """Let the page tell us when the condition is met."""
+        start = time.monotonic()
+        try:
+            met = wait_in_browser(
+                browser, self.timeout, script_locator, condition, text
+            )
+        except JavascriptException:
+            # the page probably navigated away, taking the script with it.
+            remaining = max(0, self.timeout - (time.monotonic() - start))
+            self._poll(browser, remaining)
+            return
+
+        if not met:
+            msg = f"Waited {self.timeout} seconds in the browser."
+            raise TimeoutException(msg)
+
     def __init__(
         self, seconds: float | None = None, args: Iterable[Any] | None = None
     ) -> None:
@@ -155,3 +244,4 @@ class Wait:
         self.timeout = seconds if seconds is not None else settings.TIMEOUT
         self.condition = EC.visibility_of_element_located
         self.log_detail = None
+        self.in_browser = False
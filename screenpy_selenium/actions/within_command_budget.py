@@ -0,0 +1,74 @@
+"""Perform Actions, failing if they send the browser too many commands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from screenpy.exceptions import UnableToAct
+from screenpy.pacing import aside, beat
+
+from ..abilities import BrowseTheWeb
+from ..instrumentation import instrument
+
+if TYPE_CHECKING:
+    from screenpy import Actor, Performable
+
+
+class WithinCommandBudget:
+    """Perform some Actions, which must send no more than a number of commands.
+
+    Every WebDriver command is a round trip to the browser. Wrapping a Task
+    in a budget catches the extra lookup someone adds in a loop, when the
+    test fails in review instead of when the suite gets slower.
+
+    Abilities Required:
+        :class:`~screenpy_selenium.abilities.BrowseTheWeb`
+
+    Examples::
+
+        the_actor.attempts_to(WithinCommandBudget(20, LogIn.using(CREDENTIALS)))
+
+        the_actor.attempts_to(
+            WithinCommandBudget(
+                5,
+                Enter.the_text("spam").into_the(SEARCH_BAR),
+                Click.on_the(SEARCH_BUTTON),
+            )
+        )
+    """
+
+    budget: int
+
+    def describe(self) -> str:
+        """Describe the Action in present tense."""
+        return f"Perform {len(self.actions)} Actions within {self.budget} commands."
+
+    @beat("{} keeps to a budget of {budget} commands.")
+    def perform_as(self, the_actor: Actor) -> None:
+        """Direct the Actor to perform the Actions, counting commands sent.
+
+        Raises:
+            UnableToAct: if the browser's commands can't be counted.
+            AssertionError: if the Actions sent more commands than budgeted.
+        """
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        executor = instrument(browser)
+        if executor is None:
+            msg = "The browser has no command executor to count commands with."
+            raise UnableToAct(msg)
+
+        commands_before = executor.commands_sent
+        the_actor.attempts_to(*self.actions)
+        commands_sent = executor.commands_sent - commands_before
+
+        aside(f"{commands_sent} of {self.budget} commands were sent.")
+        if commands_sent > self.budget:
+            msg = (
+                f"{the_actor} sent {commands_sent} commands, which is over the "
+                f"budget of {self.budget}."
+            )
+            raise AssertionError(msg)
+
+    def __init__(self, budget: int, *actions: Performable) -> None:
+        self.budget = budget
+        self.actions = actions
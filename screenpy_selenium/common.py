@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import importlib
+import sys
 import warnings
 from functools import wraps
-from typing import TYPE_CHECKING, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 if TYPE_CHECKING:
     from typing_extensions import ParamSpec
@@ -44,3 +46,37 @@ def pos_args_deprecated(*keywords: str) -> Function:
         return wrapper
 
     return deprecated
+
+
+def lazy_attributes(
+    package: str, locations: dict[str, str], aliases: dict[str, str] | None = None
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Make a package's ``__getattr__`` and ``__dir__``, which import on demand.
+
+    Each name in ``locations`` is imported from its module (relative to the
+    package) the first time it is asked for, as described in :pep:`562`. This
+    way, importing one Action doesn't also import every browser driver and
+    support module Selenium has. Each name in ``aliases`` is another name for
+    one of those.
+    """
+    aliases = aliases or {}
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401
+        module = sys.modules[package]
+        if name in aliases:
+            value = getattr(module, aliases[name])
+        elif name in locations:
+            value = getattr(importlib.import_module(locations[name], package), name)
+        else:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        # keep it, so the next lookup doesn't come back through here.
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        names = set(vars(sys.modules[package])) | locations.keys() | aliases.keys()
+        return sorted(names)
+
+    return __getattr__, __dir__
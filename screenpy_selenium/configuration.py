@@ -1,5 +1,7 @@
 """Define settings for the StdOutAdapter."""
 
+from typing import Literal, Optional
+
 from pydantic_settings import SettingsConfigDict
 from screenpy.configuration import ScreenPySettings
 
@@ -19,6 +21,65 @@ class ScreenPySeleniumSettings(ScreenPySettings):
     CHAIN_DURATION: int = 10
     """Default duration of ActionChains in milleseconds"""
 
+    POLLING_POLICY: Literal["fixed", "backoff", "fast_then_slow"] = "fixed"
+    """
+    How often Wait asks the browser whether its condition is met:
+
+    * ``"fixed"`` waits ScreenPy's ``POLLING`` seconds between every poll.
+    * ``"backoff"`` starts at ``POLLING`` and multiplies the interval by
+      ``POLLING_BACKOFF_FACTOR`` after each poll, up to ``POLLING_MAX``.
+    * ``"fast_then_slow"`` polls every ``POLLING`` seconds for the first
+      ``POLLING_FAST_FOR`` seconds, then every ``POLLING_MAX`` seconds.
+    """
+
+    POLLING_MAX: float = 2.0
+    """Longest interval between polls, in seconds, for the non-fixed policies"""
+
+    POLLING_BACKOFF_FACTOR: float = 2.0
+    """How much longer each interval is than the last, for the backoff policy"""
+
+    POLLING_FAST_FOR: float = 2.0
+    """Seconds to poll quickly before slowing down, for the fast_then_slow policy"""
+
+    INSTRUMENT_COMMANDS: bool = False
+    """
+    Whether to time, count, and weigh every command sent to the browser. Only
+    browsers given to BrowseTheWeb after this is turned on are instrumented.
+    """
+
+    INSTRUMENT_COMMANDS_REPORT: Optional[str] = None  # noqa: FA100
+    """
+    Path to save the command report to when Python exits, if any. Use
+    ``{pid}`` in the path to keep parallel workers from overwriting each other.
+    """
+
+    SAVE_SCREENSHOTS_IN_BACKGROUND: bool = False
+    """
+    Whether SaveScreenshot hands screenshots to the background writer instead
+    of writing them before the Actor moves on
+    """
+
+    BACKGROUND_WRITER_THREADS: int = 2
+    """How many threads the background writer writes files with"""
+
+    BACKGROUND_WRITER_MAX_PENDING: int = 32
+    """How many files may wait to be written before the next one waits too"""
+
+    KEPT_SCREENSHOTS: int = 20
+    """How many screenshots KeepRecentScreenshots keeps, by default"""
+
+    KEPT_SCREENSHOTS_MAX_BYTES: int = 100_000_000
+    """How many bytes of screenshots KeepRecentScreenshots keeps, by default"""
+
+    PROFILE_TARGETS: bool = False
+    """Whether to record how long it takes to find each Target"""
+
+    PROFILE_TARGETS_REPORT: Optional[str] = None  # noqa: FA100
+    """
+    Path to save the Target profile report to when Python exits, if any. Use
+    ``{pid}`` in the path to keep parallel workers from overwriting each other.
+    """
+
 
 # initialized instance
 settings = ScreenPySeleniumSettings()
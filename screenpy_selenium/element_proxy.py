@@ -0,0 +1,209 @@
+"""
+Elements which can fetch their properties ahead of time.
+
+Asking for the text of 200 elements one at a time costs 200 round trips to the
+browser. Prefetching asks for all of them with a single script.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from .scripts import selenium_atom
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from typing_extensions import Self
+
+T = TypeVar("T")
+
+ATTRIBUTE_PREFIX = "attribute:"
+PREFETCHABLE = ("text", "is_displayed", "rect")
+
+_PREFETCH_TEMPLATE = """
+var properties = arguments[1];
+var visibleText = function (element) {
+    if (!isDisplayed(element)) {
+        return "";
+    }
+    return element.innerText.replace(/\\u00a0/g, " ").trim();
+};
+return arguments[0].map(function (element) {
+    var values = {};
+    properties.forEach(function (property) {
+        if (property === "text") {
+            values[property] = visibleText(element);
+        } else if (property === "is_displayed") {
+            values[property] = isDisplayed(element);
+        } else if (property === "rect") {
+            var rect = element.getBoundingClientRect();
+            values[property] = {
+                x: rect.left + window.pageXOffset,
+                y: rect.top + window.pageYOffset,
+                width: rect.width,
+                height: rect.height
+            };
+        } else {
+            values[property] = getAttribute(
+                element, property.slice("ATTRIBUTE_PREFIX".length)
+            );
+        }
+    });
+    return values;
+});
+"""
+
+PREFETCH = _PREFETCH_TEMPLATE.replace("ATTRIBUTE_PREFIX", ATTRIBUTE_PREFIX)
+"""Collect the requested properties of every element given."""
+
+
+def prefetch_script(properties: Iterable[str]) -> str:
+    """Build the script which prefetches the given properties.
+
+    Selenium's own ``getAttribute`` and ``isDisplayed`` scripts are included
+    only when needed, so the answers match what the element would give.
+    """
+    properties = list(properties)
+    wants_attributes = any(p.startswith(ATTRIBUTE_PREFIX) for p in properties)
+    wants_displayed = "text" in properties or "is_displayed" in properties
+
+    get_attribute = selenium_atom("getAttribute.js") if wants_attributes else "null"
+    is_displayed = selenium_atom("isDisplayed.js") if wants_displayed else "null"
+    return (
+        f"var getAttribute = ({get_attribute});\n"
+        f"var isDisplayed = ({is_displayed});\n"
+        f"{PREFETCH}"
+    )
+
+
+class ElementProxy(WebElement):
+    """A |WebElement| which may have already fetched some of its properties.
+
+    Prefetched properties are answered from memory; they are a snapshot of
+    the element from when they were fetched. Anything else is asked of the
+    browser as usual, when it is needed.
+
+    Examples::
+
+        proxies = prefetch(browser, elements, ["text", "attribute:href"])
+        [(proxy.text, proxy.get_attribute("href")) for proxy in proxies]
+    """
+
+    prefetched: dict[str, Any]
+
+    @classmethod
+    def of(cls, element: WebElement, prefetched: dict[str, Any] | None = None) -> Self:
+        """Wrap an element found by the browser."""
+        return cls(element.parent, element.id, prefetched)
+
+    @property
+    def text(self) -> str:
+        """The text of the element."""
+        if "text" in self.prefetched:
+            return self.prefetched["text"]
+        return super().text
+
+    def get_attribute(self, name: str) -> str | None:
+        """Get the given attribute or property of the element."""
+        if f"{ATTRIBUTE_PREFIX}{name}" in self.prefetched:
+            return self.prefetched[f"{ATTRIBUTE_PREFIX}{name}"]
+        return super().get_attribute(name)
+
+    def is_displayed(self) -> bool:
+        """Whether the element is visible to a user."""
+        if "is_displayed" in self.prefetched:
+            return self.prefetched["is_displayed"]
+        return super().is_displayed()
+
+    @property
+    def rect(self) -> dict:
+        """The size and location of the element."""
+        if "rect" in self.prefetched:
+            return self.prefetched["rect"]
+        return super().rect
+
+    def __init__(
+        self, parent: WebDriver, id_: str, prefetched: dict[str, Any] | None = None
+    ) -> None:
+        super().__init__(parent, id_)
+        self.prefetched = prefetched if prefetched is not None else {}
+
+
+class RefindingElement(WebElement):
+    """A remembered |WebElement| which finds itself again if it goes stale.
+
+    Clicking a link or submitting a form replaces the page, and every element
+    which was found on the old page goes stale. Instead of failing, the first
+    command which finds this element stale finds it again and is retried.
+
+    Examples::
+
+        element = RefindingElement.of(found, lambda: browser.find_element(*locator))
+    """
+
+    refind: Callable[[], WebElement]
+
+    @classmethod
+    def of(cls, element: WebElement, refind: Callable[[], WebElement]) -> Self:
+        """Wrap an element found by the browser, with a way to find it again."""
+        return cls(element.parent, element.id, refind)
+
+    def get_attribute(self, name: str) -> str | None:
+        """Get the given attribute or property of the element."""
+        return self._retrying_if_stale(partial(super().get_attribute, name))
+
+    def is_displayed(self) -> bool:
+        """Whether the element is visible to a user."""
+        return self._retrying_if_stale(super().is_displayed)
+
+    def _execute(self, command: str, params: dict | None = None) -> dict:
+        """Send a command about the element, finding it again if it's stale."""
+        return self._retrying_if_stale(partial(super()._execute, command, params))
+
+    def _retrying_if_stale(self, attempt: Callable[[], T]) -> T:
+        """Make the attempt, finding the element and trying again if stale."""
+        try:
+            return attempt()
+        except StaleElementReferenceException:
+            self._id = self.refind().id
+            return attempt()
+
+    def __init__(
+        self, parent: WebDriver, id_: str, refind: Callable[[], WebElement]
+    ) -> None:
+        super().__init__(parent, id_)
+        self.refind = refind
+
+
+def prefetch(
+    browser: WebDriver, elements: list[WebElement], properties: Iterable[str]
+) -> list[ElementProxy]:
+    """Fetch properties for all of the elements in one round trip.
+
+    Args:
+        browser: the browser the elements were found in.
+        elements: the elements to inspect.
+        properties: any of "text", "is_displayed", "rect", or
+            "attribute:<name>" for the value of an attribute.
+
+    Raises:
+        ValueError: if a property can't be prefetched.
+    """
+    properties = list(properties)
+    for prop in properties:
+        if prop not in PREFETCHABLE and not prop.startswith(ATTRIBUTE_PREFIX):
+            msg = f'"{prop}" cannot be prefetched.'
+            raise ValueError(msg)
+
+    if not elements or not properties:
+        return [ElementProxy.of(element) for element in elements]
+
+    values = browser.execute_script(prefetch_script(properties), elements, properties)
+    return [
+        ElementProxy.of(element, prefetched)
+        for element, prefetched in zip(elements, values)
+    ]
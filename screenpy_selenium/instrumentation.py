@@ -0,0 +1,217 @@
+"""
+Count, time, and weigh every command the browser is sent.
+
+Turn this on with the ``INSTRUMENT_COMMANDS`` setting to learn which Actions
+and Questions make the most round trips, and where the time goes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import inspect
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from .configuration import settings
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.remote_connection import RemoteConnection
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    CommandKey = tuple[str, str]
+
+NO_PERFORMER = "(none)"
+PERFORMING_METHODS = ("perform_as", "answered_by")
+
+PROMETHEUS_METRICS = (
+    ("count", "commands_total", "WebDriver commands sent."),
+    ("seconds", "command_seconds_total", "Time spent waiting on commands."),
+    ("bytes_out", "command_bytes_sent_total", "Bytes of command parameters."),
+    ("bytes_in", "command_bytes_received_total", "Bytes of command responses."),
+)
+
+
+def current_performer() -> str:
+    """Name the Action or Question being performed, innermost first.
+
+    The call stack is searched for a ``perform_as`` or ``answered_by`` method,
+    so commands sent by a Target found during a Click are attributed to the
+    Click, even when that Click is part of a larger Task.
+    """
+    frame = inspect.currentframe()
+    while frame is not None:
+        if frame.f_code.co_name in PERFORMING_METHODS:
+            performer = frame.f_locals.get("self")
+            if performer is not None:
+                return type(performer).__name__
+        frame = frame.f_back
+    return NO_PERFORMER
+
+
+def _size_of(payload: Any) -> int:  # noqa: ANN401
+    """Estimate the size of a payload as it was sent over the wire."""
+    return len(json.dumps(payload, default=str))
+
+
+def _prometheus_label(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class CommandRecorder:
+    """Record the WebDriver commands sent while performing.
+
+    Commands are grouped by the Action or Question which sent them and by
+    the name of the command (like ``findElement`` or ``executeScript``).
+
+    Examples::
+
+        from screenpy_selenium import command_recorder, settings
+
+        settings.INSTRUMENT_COMMANDS = True
+
+        # ... run some tests ...
+
+        print(command_recorder.prometheus())
+        command_recorder.save("commands.json")
+    """
+
+    totals: dict[CommandKey, dict[str, float]]
+
+    def record(
+        self, key: CommandKey, duration: float, bytes_out: int, bytes_in: int
+    ) -> None:
+        """Record one command, which took ``duration`` seconds."""
+        with self._lock:
+            totals = self.totals.setdefault(
+                key, {"count": 0, "seconds": 0.0, "bytes_out": 0, "bytes_in": 0}
+            )
+            totals["count"] += 1
+            totals["seconds"] += duration
+            totals["bytes_out"] += bytes_out
+            totals["bytes_in"] += bytes_in
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Summarize the recorded commands, slowest first."""
+        with self._lock:
+            recorded = {key: dict(totals) for key, totals in self.totals.items()}
+
+        summary = [
+            {
+                "performer": performer,
+                "command": command,
+                "count": int(totals["count"]),
+                "total_ms": round(totals["seconds"] * 1000, 3),
+                "bytes_out": int(totals["bytes_out"]),
+                "bytes_in": int(totals["bytes_in"]),
+            }
+            for (performer, command), totals in recorded.items()
+        ]
+        return sorted(summary, key=lambda row: row["total_ms"], reverse=True)
+
+    def prometheus(self) -> str:
+        """Lay out the totals in the Prometheus text exposition format."""
+        with self._lock:
+            recorded = {key: dict(totals) for key, totals in self.totals.items()}
+
+        lines = []
+        for field, name, description in PROMETHEUS_METRICS:
+            metric = f"screenpy_selenium_{name}"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for (performer, command), totals in sorted(recorded.items()):
+                labels = (
+                    f'performer="{_prometheus_label(performer)}",'
+                    f'command="{_prometheus_label(command)}"'
+                )
+                lines.append(f"{metric}{{{labels}}} {totals[field]:g}")
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: str) -> None:
+        """Write the summary as JSON, and the Prometheus metrics alongside it.
+
+        The metrics are written to the same path with a ``.prom`` extension.
+        """
+        with open(path, "w") as json_file:
+            json.dump(self.stats(), json_file, indent=2)
+        with open(f"{os.path.splitext(path)[0]}.prom", "w") as prometheus_file:
+            prometheus_file.write(self.prometheus())
+
+    def reset(self) -> None:
+        """Forget all recorded commands."""
+        with self._lock:
+            self.totals.clear()
+
+    def __init__(self) -> None:
+        self.totals = {}
+        self._lock = threading.Lock()
+
+
+# initialized instance
+command_recorder = CommandRecorder()
+
+
+class InstrumentedExecutor:
+    """Wrap a browser's command executor to watch every command it sends.
+
+    Every command is counted in ``commands_sent``. When the
+    ``INSTRUMENT_COMMANDS`` setting is on, each is also timed, weighed, and
+    recorded in the :class:`CommandRecorder`.
+    """
+
+    executor: RemoteConnection
+    commands_sent: int
+
+    def execute(self, command: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send the command through the wrapped executor."""
+        self.commands_sent += 1
+        if not settings.INSTRUMENT_COMMANDS:
+            return self.executor.execute(command, params)
+
+        key = (current_performer(), command)
+        start = time.perf_counter()
+        try:
+            response = self.executor.execute(command, params)
+        except Exception:
+            command_recorder.record(
+                key, time.perf_counter() - start, _size_of(params), 0
+            )
+            raise
+        duration = time.perf_counter() - start
+        command_recorder.record(key, duration, _size_of(params), _size_of(response))
+        return response
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Pass along anything else to the wrapped executor."""
+        if name == "executor":
+            raise AttributeError(name)
+        return getattr(self.executor, name)
+
+    def __init__(self, executor: RemoteConnection) -> None:
+        self.executor = executor
+        self.commands_sent = 0
+
+
+def instrument(browser: WebDriver) -> InstrumentedExecutor | None:
+    """Watch the commands sent by the browser, if they can be watched.
+
+    Returns:
+        The browser's instrumented executor, or None if it has none.
+    """
+    executor = getattr(browser, "command_executor", None)
+    if executor is None or isinstance(executor, InstrumentedExecutor):
+        return executor
+    instrumented = InstrumentedExecutor(executor)
+    browser.command_executor = instrumented  # type: ignore[assignment]
+    return instrumented
+
+
+@atexit.register
+def _save_report_at_exit() -> None:
+    """Save the report at the end of the run, if one was asked for."""
+    if settings.INSTRUMENT_COMMANDS_REPORT is None or not command_recorder.totals:
+        return
+    command_recorder.save(settings.INSTRUMENT_COMMANDS_REPORT.format(pid=os.getpid()))
@@ -0,0 +1,282 @@
+"""
+Keep browser sessions ready, instead of launching one when an Actor needs it.
+
+Launching a browser takes seconds; clearing one out takes milliseconds. A pool
+keeps finished sessions around so the next Actor can pick up where the last
+one left off, with a clean slate. A launcher starts new sessions in the
+background, while the previous test is still running.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable
+
+from .exceptions import BrowsingError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from typing_extensions import Self
+
+CLEAR_STORAGE = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+"""Clear web storage, which some pages (like about:blank) don't allow."""
+
+
+def is_healthy(browser: WebDriver) -> bool:
+    """Check that the browser is still answering, with one cheap command."""
+    try:
+        browser.window_handles  # noqa: B018
+    except Exception:  # noqa: BLE001
+        # a crashed session may not even be able to say what went wrong.
+        return False
+    return True
+
+
+def quit_quietly(browser: WebDriver) -> None:
+    """Quit the session, which may have already crashed."""
+    with contextlib.suppress(Exception):
+        browser.quit()
+
+
+def reset_browser(browser: WebDriver) -> None:
+    """Return the browser to a blank state, ready for the next Actor.
+
+    Closes every window but the first, deletes cookies, clears local and
+    session storage, and navigates to ``about:blank``. Chromium browsers
+    delete cookies for every domain; others can only delete the cookies for
+    the page they are on.
+    """
+    handles = browser.window_handles
+    for handle in handles[1:]:
+        browser.switch_to.window(handle)
+        browser.close()
+    browser.switch_to.window(handles[0])
+
+    browser.delete_all_cookies()
+    if hasattr(browser, "execute_cdp_cmd"):
+        browser.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    browser.execute_script(CLEAR_STORAGE)
+    browser.get("about:blank")
+
+
+class BrowserPool:
+    """A bounded, thread-safe pool of browser sessions.
+
+    Sessions are launched on demand, up to ``max_size`` at a time. Sessions
+    which are handed back are reset and kept for the next Actor; sessions
+    which fail to reset or stop answering are quit and replaced.
+
+    Examples::
+
+        chrome_pool = BrowserPool(Chrome, max_size=4)
+
+        Perry = AnActor.named("Perry").who_can(BrowseTheWeb.from_pool(chrome_pool))
+
+        # ... at the end of the run ...
+        chrome_pool.close()
+    """
+
+    factory: Callable[[], WebDriver]
+    max_size: int
+    timeout: float | None
+    health_check: Callable[[WebDriver], bool]
+    _idle: list[WebDriver]
+    _size: int
+    _closed: bool
+    _condition: threading.Condition
+
+    @property
+    def size(self) -> int:
+        """How many sessions the pool is keeping, in use or not."""
+        with self._condition:
+            return self._size
+
+    def acquire(self) -> WebDriver:
+        """Take a session from the pool, launching one if needed.
+
+        Raises:
+            BrowsingError: if the pool is closed, or no session was handed
+                back before the pool's timeout.
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            with self._condition:
+                browser = self._take_or_reserve(deadline)
+            if browser is None:
+                return self._launch()
+            if self.health_check(browser):
+                return browser
+            self._discard(browser)
+
+    def release(self, browser: WebDriver) -> None:
+        """Hand a session back to the pool, resetting it for the next Actor."""
+        try:
+            reset_browser(browser)
+        except Exception:  # noqa: BLE001
+            self._discard(browser)
+            return
+
+        with self._condition:
+            if self._closed:
+                self._size -= 1
+            else:
+                self._idle.append(browser)
+                self._condition.notify()
+                return
+        quit_quietly(browser)
+
+    def close(self) -> None:
+        """Quit all idle sessions. Sessions in use are quit when handed back."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for browser in idle:
+            quit_quietly(browser)
+
+    def _take_or_reserve(self, deadline: float | None) -> WebDriver | None:
+        """Take an idle session, or reserve room to launch one (as None).
+
+        Must be called while holding the lock.
+        """
+        while True:
+            if self._closed:
+                msg = "The browser pool has been closed."
+                raise BrowsingError(msg)
+            if self._idle:
+                return self._idle.pop()
+            if self._size < self.max_size:
+                self._size += 1
+                return None
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                msg = (
+                    f"No browser was returned to the pool within {self.timeout}"
+                    f" seconds; all {self.max_size} are in use."
+                )
+                raise BrowsingError(msg)
+            self._condition.wait(remaining)
+
+    def _launch(self) -> WebDriver:
+        """Launch a session into a slot which was already reserved."""
+        try:
+            return self.factory()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def _discard(self, browser: WebDriver) -> None:
+        """Throw away a broken session, making room for a new one."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+        quit_quietly(browser)
+
+    def __enter__(self) -> Self:
+        """Use the pool for the duration of a ``with`` block."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the pool at the end of the ``with`` block."""
+        self.close()
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        max_size: int = 4,
+        timeout: float | None = None,
+        health_check: Callable[[WebDriver], bool] = is_healthy,
+    ) -> None:
+        self.factory = factory
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check = health_check
+        self._idle = []
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+
+class BrowserLauncher:
+    """Keep some browsers launching in the background, ready to be taken.
+
+    Each browser taken is immediately replaced by launching another, so
+    startup happens while the previous test runs instead of on the critical
+    path of the next one. If a launch failed, the error is raised when that
+    browser would have been taken.
+
+    Usually used through :meth:`~screenpy_selenium.abilities.BrowseTheWeb.prewarm`,
+    but it can also feed a :class:`BrowserPool`.
+
+    Examples::
+
+        launcher = BrowserLauncher(Chrome, count=2)
+        browser = launcher.take()
+
+        chrome_pool = BrowserPool(launcher.take)
+    """
+
+    factory: Callable[[], WebDriver]
+    count: int
+    _launching: collections.deque[Future[WebDriver]]
+    _executor: ThreadPoolExecutor
+    _lock: threading.Lock
+    _closed: bool
+
+    def take(self) -> WebDriver:
+        """Take a launched browser, waiting for one if none are ready yet.
+
+        Raises:
+            BrowsingError: if the launcher has been closed.
+        """
+        with self._lock:
+            if self._closed:
+                msg = "The browser launcher has been closed."
+                raise BrowsingError(msg)
+            launching = self._launching.popleft()
+            self._launching.append(self._executor.submit(self.factory))
+        return launching.result()
+
+    def close(self) -> None:
+        """Stop launching browsers, and quit any which are not taken."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            launching, self._launching = self._launching, collections.deque()
+        for future in launching:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+        for future in launching:
+            if not future.cancelled() and future.exception() is None:
+                quit_quietly(future.result())
+
+    def __init__(self, factory: Callable[[], WebDriver], count: int = 1) -> None:
+        if count < 1:
+            msg = f"A launcher must keep at least one browser ready, not {count}."
+            raise ValueError(msg)
+
+        self.factory = factory
+        self.count = count
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="screenpy_selenium_launcher"
+        )
+        self._launching = collections.deque(
+            self._executor.submit(factory) for _ in range(count)
+        )
+        self._lock = threading.Lock()
+        self._closed = False
@@ -0,0 +1,175 @@
+"""
+Measure how long it takes to find each Target.
+
+Turn this on with the ``PROFILE_TARGETS`` setting to learn which locators are
+costing your suite the most time.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, ContextManager, Iterator
+
+from .configuration import settings
+
+if TYPE_CHECKING:
+    from .target import Target
+
+    ProfileKey = tuple[str, str, str]
+
+BATCHED_LOOKUP_KEY = ("(batched lookup)", "script", "")
+"""Where lookups which find many Targets in one round trip are recorded."""
+
+TABLE_COLUMNS = (
+    ("target", "Target", "<"),
+    ("strategy", "Strategy", "<"),
+    ("count", "Count", ">"),
+    ("failures", "Failures", ">"),
+    ("total_ms", "Total (ms)", ">"),
+    ("p50_ms", "p50 (ms)", ">"),
+    ("p95_ms", "p95 (ms)", ">"),
+    ("max_ms", "Max (ms)", ">"),
+)
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Find the nearest-rank percentile of an already-sorted list."""
+    rank = max(1, math.ceil(len(ordered) * percent / 100))
+    return ordered[rank - 1]
+
+
+class TargetProfiler:
+    """Record the time spent finding each Target.
+
+    Timings are attributed to the Target's name and locator, so the worst
+    offenders can be found and rewritten. Only lookups which actually ask the
+    browser are recorded; cached elements cost nothing.
+
+    Examples::
+
+        from screenpy_selenium import settings, target_profiler
+
+        settings.PROFILE_TARGETS = True
+
+        # ... run some tests ...
+
+        print(target_profiler.report())
+        target_profiler.save("target_profile.json")
+    """
+
+    durations: dict[ProfileKey, list[float]]
+    failures: dict[ProfileKey, int]
+
+    def timing(self, target: Target) -> ContextManager[None]:
+        """Time the lookup of the given Target, if profiling is turned on."""
+        how, what = target.get_locator()
+        return self._timing((str(target), how, what))
+
+    def timing_batch(self) -> ContextManager[None]:
+        """Time a lookup of many Targets at once, if profiling is turned on.
+
+        The round trip is recorded once, under ``BATCHED_LOOKUP_KEY``, rather
+        than against each of the Targets.
+        """
+        return self._timing(BATCHED_LOOKUP_KEY)
+
+    @contextmanager
+    def _timing(self, key: ProfileKey) -> Iterator[None]:
+        """Time the lookup, recording it under the key."""
+        if not settings.PROFILE_TARGETS:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.record(key, time.perf_counter() - start, failed=True)
+            raise
+        self.record(key, time.perf_counter() - start, failed=False)
+
+    def record(self, key: ProfileKey, duration: float, *, failed: bool) -> None:
+        """Record one lookup of a Target, in seconds."""
+        with self._lock:
+            self.durations.setdefault(key, []).append(duration)
+            self.failures.setdefault(key, 0)
+            if failed:
+                self.failures[key] += 1
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Summarize the recorded lookups, slowest Targets first."""
+        with self._lock:
+            recorded = {key: sorted(times) for key, times in self.durations.items()}
+            failures = dict(self.failures)
+
+        summary = []
+        for (name, how, what), times in recorded.items():
+            summary.append(
+                {
+                    "target": name,
+                    "strategy": how,
+                    "locator": what,
+                    "count": len(times),
+                    "failures": failures[(name, how, what)],
+                    "total_ms": round(sum(times) * 1000, 3),
+                    "p50_ms": round(_percentile(times, 50) * 1000, 3),
+                    "p95_ms": round(_percentile(times, 95) * 1000, 3),
+                    "max_ms": round(times[-1] * 1000, 3),
+                }
+            )
+        return sorted(summary, key=lambda row: row["total_ms"], reverse=True)
+
+    def report(self) -> str:
+        """Lay out the summary as a human-readable table."""
+        rows = [
+            [str(row[column]) for column, _, _ in TABLE_COLUMNS] for row in self.stats()
+        ]
+        headers = [header for _, header, _ in TABLE_COLUMNS]
+        widths = [max(len(cell) for cell in column) for column in zip(headers, *rows)]
+        lines = []
+        for cells in [headers, *rows]:
+            line = "  ".join(
+                f"{cell:{align}{width}}"
+                for cell, width, (_, _, align) in zip(cells, widths, TABLE_COLUMNS)
+            )
+            lines.append(line.rstrip())
+        return "\n".join(lines)
+
+    def save(self, path: str) -> None:
+        """Write the summary as JSON, and the table alongside it as text.
+
+        The table is written to the same path with a ``.txt`` extension.
+        """
+        with open(path, "w") as json_file:
+            json.dump(self.stats(), json_file, indent=2)
+        with open(f"{os.path.splitext(path)[0]}.txt", "w") as table_file:
+            table_file.write(self.report() + "\n")
+
+    def reset(self) -> None:
+        """Forget all recorded lookups."""
+        with self._lock:
+            self.durations.clear()
+            self.failures.clear()
+
+    def __init__(self) -> None:
+        self.durations = {}
+        self.failures = {}
+        self._lock = threading.Lock()
+
+
+# initialized instance
+target_profiler = TargetProfiler()
+
+
+@atexit.register
+def _save_report_at_exit() -> None:
+    """Save the report at the end of the run, if one was asked for."""
+    if settings.PROFILE_TARGETS_REPORT is None or not target_profiler.durations:
+        return
+    target_profiler.save(settings.PROFILE_TARGETS_REPORT.format(pid=os.getpid()))
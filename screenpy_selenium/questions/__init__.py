@@ -1,27 +1,60 @@
 """Questions an Actor can ask about the state of a web application."""
 
-from .attribute import Attribute
-from .browser_title import BrowserTitle
-from .browser_url import BrowserURL
-from .cookies import Cookies
-from .element import Element
-from .list import List
-from .number import Number
-from .selected import Selected
-from .text import Text
-from .text_of_the_alert import TextOfTheAlert
+from typing import TYPE_CHECKING
 
-# Natural-language-enabling syntactic sugar
-TheAttribute = Attribute
-TheBrowserTitle = BrowserTitle
-TheBrowserURL = BrowserURL
-TheCookies = Cookies
-TheElement = Element
-TheList = List
-TheNumber = Number
-TheSelected = Selected
-TheText = Text
-TheTextOfTheAlert = TextOfTheAlert
+from ..common import lazy_attributes
+
+if TYPE_CHECKING:
+    from .attribute import Attribute
+    from .browser_title import BrowserTitle
+    from .browser_url import BrowserURL
+    from .cookies import Cookies
+    from .element import Element
+    from .list import List
+    from .number import Number
+    from .selected import Selected
+    from .text import Text
+    from .text_of_the_alert import TextOfTheAlert
+
+    # Natural-language-enabling syntactic sugar
+    TheAttribute = Attribute
+    TheBrowserTitle = BrowserTitle
+    TheBrowserURL = BrowserURL
+    TheCookies = Cookies
+    TheElement = Element
+    TheList = List
+    TheNumber = Number
+    TheSelected = Selected
+    TheText = Text
+    TheTextOfTheAlert = TextOfTheAlert
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Attribute": ".attribute",
+        "BrowserTitle": ".browser_title",
+        "BrowserURL": ".browser_url",
+        "Cookies": ".cookies",
+        "Element": ".element",
+        "List": ".list",
+        "Number": ".number",
+        "Selected": ".selected",
+        "Text": ".text",
+        "TextOfTheAlert": ".text_of_the_alert",
+    },
+    {
+        "TheAttribute": "Attribute",
+        "TheBrowserTitle": "BrowserTitle",
+        "TheBrowserURL": "BrowserURL",
+        "TheCookies": "Cookies",
+        "TheElement": "Element",
+        "TheList": "List",
+        "TheNumber": "Number",
+        "TheSelected": "Selected",
+        "TheText": "Text",
+        "TheTextOfTheAlert": "TextOfTheAlert",
+    },
+)
 
 
 __all__ = [
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 from screenpy.exceptions import UnableToAnswer
 from screenpy.pacing import beat
 
+from ..element_proxy import ATTRIBUTE_PREFIX
+
 if TYPE_CHECKING:
     from screenpy import Actor
 
@@ -29,6 +31,13 @@ class Attribute:
                 Attribute("aria-label").of_the(BALLOONS), ContainsTheText("balloon")),
             ),
         )
+
+        the_actor.should(
+            See.the(
+                Attribute("href").of_all(LINKS).all_at_once(),
+                ContainsTheItem("/home"),
+            ),
+        )
     """
 
     target: Target | None
@@ -46,6 +55,16 @@ class Attribute:
         self.multi = True
         return self
 
+    def all_at_once(self) -> Attribute:
+        """Read the attribute of all the elements in a single round trip.
+
+        Rather than asking the browser for each element's attribute in turn,
+        a script collects the attribute of every element at once, using the
+        same lookup Selenium uses for ``get_attribute``.
+        """
+        self.batched = True
+        return self
+
     def describe(self) -> str:
         """Describe the Question."""
         return f'The "{self.attribute}" attribute of the {self.target}.'
@@ -60,6 +79,10 @@ class Attribute:
             )
             raise UnableToAnswer(msg)
 
+        if self.multi and self.batched:
+            prefetch = [f"{ATTRIBUTE_PREFIX}{self.attribute}"]
+            elements = self.target.all_found_by(the_actor, prefetch=prefetch)
+            return [element.get_attribute(self.attribute) for element in elements]
         if self.multi:
             elements = self.target.all_found_by(the_actor)
             return [element.get_attribute(self.attribute) for element in elements]
@@ -68,4 +91,5 @@ class Attribute:
     def __init__(self, attribute: str) -> None:
         self.attribute = attribute
         self.multi = False
+        self.batched = False
         self.target = None
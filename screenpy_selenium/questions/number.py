@@ -36,7 +36,7 @@ class Number:
     @beat("{} counts the number of {target}.")
     def answered_by(self, the_actor: Actor) -> int:
         """Direct the Actor to count the elements."""
-        return len(self.target.all_found_by(the_actor))
+        return self.target.number_found_by(the_actor)
 
     def __init__(self, target: Target) -> None:
         self.target = target
@@ -30,10 +30,18 @@ class Text:
         the_actor.should(
             See.the(Text.of_all(SEARCH_RESULTS), ContainsTheItem("Rear Window"))
         )
+
+        the_actor.should(
+            See.the(
+                Text.of_all(SEARCH_RESULTS).all_at_once(),
+                ContainsTheItem("Rear Window"),
+            )
+        )
     """
 
     target: Target
     multi: bool
+    batched: bool
 
     @classmethod
     def of_the(cls, target: Target) -> Self:
@@ -60,6 +68,19 @@ class Text:
         """Target the elements, plural, to extract the text from."""
         return cls(target=multi_target, multi=True)
 
+    def all_at_once(self) -> Self:
+        """Read the text of all the elements in a single round trip.
+
+        Rather than asking the browser for each element's text in turn, a
+        script collects the visible text of every element at once. This uses
+        the page's ``innerText``, which is close to, but not always the same
+        as, the text Selenium reports. For example, text hidden with
+        ``opacity: 0`` is included, and some whitespace is collapsed
+        differently. If the text must match exactly, leave this off.
+        """
+        self.batched = True
+        return self
+
     def describe(self) -> str:
         """Describe the Question."""
         return f"The text from the {self.target}."
@@ -67,6 +88,9 @@ class Text:
     @beat("{} reads the text from the {target}.")
     def answered_by(self, the_actor: Actor) -> str | list[str]:
         """Direct the Actor to read off the text of the element(s)."""
+        if self.multi and self.batched:
+            elements = self.target.all_found_by(the_actor, prefetch=["text"])
+            return [e.text for e in elements]
         if self.multi:
             return [e.text for e in self.target.all_found_by(the_actor)]
         return self.target.found_by(the_actor).text
@@ -77,3 +101,4 @@ class Text:
     ) -> None:
         self.target = target
         self.multi = multi
+        self.batched = False
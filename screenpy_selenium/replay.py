@@ -0,0 +1,198 @@
+"""
+Record a browser's conversation, then replay it without a browser.
+
+A replayed run answers every command instantly and identically, which makes
+it possible to benchmark and profile ScreenPy Selenium's own overhead on
+machines which have no browsers at all.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from typing import TYPE_CHECKING, Any
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .exceptions import BrowsingError
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.remote_connection import RemoteConnection
+    from typing_extensions import Self
+
+SESSION_COMMANDS = (Command.NEW_SESSION, Command.QUIT)
+"""Commands which are answered by the replay itself, rather than recorded."""
+
+
+class Recording:
+    """The commands a browser was sent, and the responses it gave.
+
+    Examples::
+
+        recording = Recording.load("login.json")
+        the_actor.who_can(BrowseTheWeb.using(ReplayDriver(recording)))
+    """
+
+    commands: list[dict[str, Any]]
+    capabilities: dict[str, Any]
+
+    @classmethod
+    def load(cls, path: str) -> Self:
+        """Load a recording saved with :meth:`save`."""
+        with open(path) as recording_file:
+            saved = json.load(recording_file)
+        return cls(saved["commands"], saved["capabilities"])
+
+    def add(
+        self, command: str, params: dict[str, Any], response: dict[str, Any]
+    ) -> None:
+        """Add one command and its response to the recording."""
+        # WebDriver unwraps the response in place, so keep our own copy.
+        entry = copy.deepcopy(
+            {"command": command, "params": params, "response": response}
+        )
+        with self._lock:
+            self.commands.append(entry)
+
+    def save(self, path: str) -> None:
+        """Save the recording as JSON."""
+        with self._lock:
+            saved = {"capabilities": self.capabilities, "commands": self.commands}
+            with open(path, "w") as recording_file:
+                json.dump(saved, recording_file, default=str)
+
+    def __len__(self) -> int:
+        """How many commands were recorded."""
+        return len(self.commands)
+
+    def __init__(
+        self,
+        commands: list[dict[str, Any]] | None = None,
+        capabilities: dict[str, Any] | None = None,
+    ) -> None:
+        self.commands = commands if commands is not None else []
+        self.capabilities = capabilities if capabilities is not None else {}
+        self._lock = threading.Lock()
+
+
+class RecordingExecutor:
+    """Wrap a browser's command executor to record every command it sends."""
+
+    executor: RemoteConnection
+    recording: Recording
+
+    def execute(self, command: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send the command through the wrapped executor, recording it."""
+        response = self.executor.execute(command, params)
+        if command not in SESSION_COMMANDS:
+            self.recording.add(command, params, response)
+        return response
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Pass along anything else to the wrapped executor."""
+        if name == "executor":
+            raise AttributeError(name)
+        return getattr(self.executor, name)
+
+    def __init__(self, executor: RemoteConnection, recording: Recording) -> None:
+        self.executor = executor
+        self.recording = recording
+
+
+def record(browser: WebDriver) -> Recording:
+    """Start recording the commands the browser sends.
+
+    Examples::
+
+        browser = Chrome()
+        recording = record(browser)
+        the_actor.who_can(BrowseTheWeb.using(browser))
+
+        # ... perform the test ...
+
+        recording.save("login.json")
+
+    Raises:
+        BrowsingError: if the browser has no command executor to record.
+    """
+    executor = getattr(browser, "command_executor", None)
+    if executor is None:
+        msg = "The browser has no command executor to record."
+        raise BrowsingError(msg)
+
+    recording = Recording(capabilities=dict(getattr(browser, "caps", None) or {}))
+    browser.command_executor = RecordingExecutor(executor, recording)  # type: ignore[assignment]
+    return recording
+
+
+class ReplayExecutor:
+    """Answer commands from a recording, in the order they were recorded."""
+
+    recording: Recording
+    position: int
+
+    def execute(self, command: str, _: dict[str, Any]) -> dict[str, Any]:
+        """Give the recorded response to the next command.
+
+        Only the command's name is checked against the recording, not its
+        parameters, so a recording still replays if a URL or a timeout
+        changes between environments.
+
+        Raises:
+            BrowsingError: if the command is not the one which was recorded
+                next, or the recording has run out.
+        """
+        if command == Command.NEW_SESSION:
+            return {
+                "value": {
+                    "sessionId": "replay",
+                    "capabilities": self.recording.capabilities,
+                }
+            }
+        if command == Command.QUIT:
+            return {"value": None}
+
+        with self._lock:
+            if self.position >= len(self.recording):
+                msg = f'The recording ran out before the "{command}" command.'
+                raise BrowsingError(msg)
+            recorded = self.recording.commands[self.position]
+            if recorded["command"] != command:
+                msg = (
+                    f'Expected a "{recorded["command"]}" command at position '
+                    f'{self.position} of the recording, but got "{command}".'
+                )
+                raise BrowsingError(msg)
+            self.position += 1
+        return copy.deepcopy(recorded["response"])
+
+    def close(self) -> None:
+        """Close the connection to the browser, of which there is none."""
+
+    def __init__(self, recording: Recording) -> None:
+        self.recording = recording
+        self.position = 0
+        self._lock = threading.Lock()
+
+
+class ReplayDriver(WebDriver):
+    """A WebDriver which replays a recording instead of driving a browser.
+
+    Commands must be sent in the same order they were recorded, so the test
+    being replayed must be the test which was recorded.
+
+    Examples::
+
+        the_actor.who_can(
+            BrowseTheWeb.using(ReplayDriver(Recording.load("login.json")))
+        )
+    """
+
+    def __init__(self, recording: Recording) -> None:
+        super().__init__(
+            command_executor=ReplayExecutor(recording),  # type: ignore[arg-type]
+            options=ArgOptions(),
+        )
@@ -1,15 +1,44 @@
 """Additional Resolutions to provide expected answers for Selenium tests."""
 
-from .is_clickable import IsClickable
-from .is_invisible import IsInvisible
-from .is_present import IsPresent
-from .is_visible import IsVisible
+from typing import TYPE_CHECKING
 
-# Natural-language-enabling syntactic sugar
-IsEnabled = Enabled = Clickable = IsClickable
-IsDisplayed = Displayed = Visible = IsVisible
-IsNotDisplayed = NotDisplayed = Invisible = IsInvisible
-Exist = Exists = Present = IsPresent
+from ..common import lazy_attributes
+
+if TYPE_CHECKING:
+    from .is_clickable import IsClickable
+    from .is_invisible import IsInvisible
+    from .is_present import IsPresent
+    from .is_visible import IsVisible
+
+    # Natural-language-enabling syntactic sugar
+    IsEnabled = Enabled = Clickable = IsClickable
+    IsDisplayed = Displayed = Visible = IsVisible
+    IsNotDisplayed = NotDisplayed = Invisible = IsInvisible
+    Exist = Exists = Present = IsPresent
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "IsClickable": ".is_clickable",
+        "IsInvisible": ".is_invisible",
+        "IsPresent": ".is_present",
+        "IsVisible": ".is_visible",
+    },
+    {
+        "IsEnabled": "IsClickable",
+        "Enabled": "IsClickable",
+        "Clickable": "IsClickable",
+        "IsDisplayed": "IsVisible",
+        "Displayed": "IsVisible",
+        "Visible": "IsVisible",
+        "IsNotDisplayed": "IsInvisible",
+        "NotDisplayed": "IsInvisible",
+        "Invisible": "IsInvisible",
+        "Exist": "IsPresent",
+        "Exists": "IsPresent",
+        "Present": "IsPresent",
+    },
+)
 
 
 __all__ = [
@@ -0,0 +1,305 @@
+"""
+JavaScript the Actor can ask the browser to run.
+
+Running a script in the page can replace many WebDriver commands with one,
+which matters a great deal when every command is a round trip to a remote
+browser.
+"""
+
+from __future__ import annotations
+
+import pkgutil
+
+from selenium.webdriver.common.by import By
+
+LOCATE = """
+var screenpyFind = function (root, how, what, all) {
+    if (how === "xpath") {
+        if (!all) {
+            return document.evaluate(
+                what, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        }
+        var snapshot = document.evaluate(
+            what, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes;
+    }
+    if (!all) {
+        return root.querySelector(what);
+    }
+    return Array.prototype.slice.call(root.querySelectorAll(what));
+};
+var screenpyLocate = function (chain, all) {
+    var root = document;
+    for (var i = 0; i < chain.length - 1; i++) {
+        root = screenpyFind(root, chain[i][0], chain[i][1], false);
+        if (root === null) {
+            return all ? [] : null;
+        }
+    }
+    var last = chain[chain.length - 1];
+    return screenpyFind(root, last[0], last[1], all);
+};
+"""
+"""Define ``screenpyLocate(chain, all)``, which finds elements like a Target."""
+
+RESOLVE_ALL = (
+    LOCATE
+    + """
+return arguments[0].map(function (chain) { return screenpyLocate(chain, false); });
+"""
+)
+"""Find the first element for each of many locator chains, or null."""
+
+COUNT = (
+    LOCATE
+    + """
+return screenpyLocate(arguments[0], true).length;
+"""
+)
+"""Count the elements a locator chain finds, without sending them back."""
+
+WAIT_FOR = (
+    LOCATE
+    + """
+var chain = arguments[0];
+var condition = arguments[1];
+var text = arguments[2];
+var timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var isMet = function () {
+    var element = screenpyLocate(chain, false);
+    if (condition === "disappear") {
+        return element === null || !isDisplayed(element);
+    }
+    if (element === null || !isDisplayed(element)) {
+        return false;
+    }
+    if (condition === "clickable") {
+        return !element.disabled;
+    }
+    if (condition === "contain_text") {
+        return element.innerText.replace(/\u00a0/g, " ").indexOf(text) !== -1;
+    }
+    return true;
+};
+if (isMet()) {
+    done(true);
+    return;
+}
+var finished = false;
+var observer, interval, timer;
+var finish = function (result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+};
+var check = function () {
+    if (isMet()) {
+        finish(true);
+    }
+};
+observer = new MutationObserver(check);
+observer.observe(document, {
+    attributes: true, characterData: true, childList: true, subtree: true
+});
+interval = setInterval(check, 250);
+timer = setTimeout(function () { finish(isMet()); }, timeoutMs);
+"""
+)
+"""
+Wait inside the page until a condition is met, or the timeout passes.
+
+Changes to the page are watched with a MutationObserver, so the wait ends as
+soon as the page changes, without any polling over the wire. A slow check
+also runs in the page to catch changes a MutationObserver can't see, like
+stylesheets finishing loading. Needs ``isDisplayed`` to be defined first.
+"""
+
+SET_VALUE = """
+var element = arguments[0];
+var text = arguments[1];
+var textTypes = ["text", "search", "url", "tel", "email", "password"];
+var prototype = null;
+if (element instanceof HTMLTextAreaElement) {
+    prototype = HTMLTextAreaElement.prototype;
+} else if (
+    element instanceof HTMLInputElement && textTypes.indexOf(element.type) !== -1
+) {
+    prototype = HTMLInputElement.prototype;
+}
+if (prototype === null || element.disabled || element.readOnly) {
+    return false;
+}
+element.focus();
+var setValue = Object.getOwnPropertyDescriptor(prototype, "value").set;
+setValue.call(element, element.value + text);
+element.dispatchEvent(new Event("input", {bubbles: true}));
+element.dispatchEvent(new Event("change", {bubbles: true}));
+return true;
+"""
+"""
+Add text to the end of an input or textarea's value, all at once.
+
+The value is set through the element's native setter, which frameworks like
+React watch for, and then ``input`` and ``change`` events are fired. Returns
+false if the element can't be typed into this way, which includes inputs that
+don't hold text (like file inputs, whose value can't be set).
+"""
+
+FILL_FORM = """
+var fields = arguments[0];
+var fire = function (element, type) {
+    element.dispatchEvent(new Event(type, {bubbles: true}));
+};
+var fill = function (element, value) {
+    var tag = element.tagName.toLowerCase();
+    if (element.disabled || element.readOnly) {
+        return "it is disabled or read-only";
+    }
+    if (typeof value === "boolean") {
+        var checkable = element.type === "checkbox" || element.type === "radio";
+        if (tag !== "input" || !checkable) {
+            return "only checkboxes and radio buttons can be checked";
+        }
+        if (element.checked !== value) {
+            element.click();
+        }
+        if (element.checked !== value) {
+            return "it could not be " + (value ? "checked" : "unchecked");
+        }
+        return null;
+    }
+    if (tag === "select") {
+        for (var i = 0; i < element.options.length; i++) {
+            var option = element.options[i];
+            if (option.text === value) {
+                if (!option.selected) {
+                    option.selected = true;
+                    fire(element, "input");
+                    fire(element, "change");
+                }
+                return null;
+            }
+        }
+        return "it has no option named " + JSON.stringify(value);
+    }
+    var prototype = null;
+    if (tag === "textarea") {
+        prototype = HTMLTextAreaElement.prototype;
+    } else if (tag === "input") {
+        prototype = HTMLInputElement.prototype;
+    }
+    if (prototype === null) {
+        return "it is not a form field";
+    }
+    element.focus();
+    Object.getOwnPropertyDescriptor(prototype, "value").set.call(element, value);
+    fire(element, "input");
+    fire(element, "change");
+    return null;
+};
+return fields.map(function (field) { return fill(field[0], field[1]); });
+"""
+"""
+Fill in many form fields at once, from a list of ``[element, value]`` pairs.
+
+Text replaces the value of an input or textarea, or picks the option with
+that text from a dropdown; true or false checks or unchecks a checkbox or
+radio button. Returns, for each field, null or why it couldn't be filled.
+"""
+
+SELECT_OPTIONS = """
+var select = arguments[0];
+var how = arguments[1];
+var wanted = arguments[2];
+var selecting = arguments[3];
+if (select.tagName.toLowerCase() !== "select") {
+    return "it is not a dropdown or multi-select field";
+}
+if (!select.multiple && (!selecting || wanted.length > 1)) {
+    return "only one option can be selected, and none deselected, in a dropdown";
+}
+var matches = function (option, want) {
+    if (how === "index") {
+        return option.index === want;
+    }
+    return (how === "value" ? option.value : option.text) === want;
+};
+var chosen = [];
+for (var i = 0; i < wanted.length; i++) {
+    var found = false;
+    for (var j = 0; j < select.options.length; j++) {
+        var option = select.options[j];
+        if (matches(option, wanted[i])) {
+            if (selecting && option.disabled) {
+                return "the option " + JSON.stringify(wanted[i]) + " is disabled";
+            }
+            found = true;
+            chosen.push(option);
+            if (!select.multiple) {
+                break;
+            }
+        }
+    }
+    if (!found) {
+        return "it has no option with " + how + " " + JSON.stringify(wanted[i]);
+    }
+}
+var changed = false;
+for (var k = 0; k < chosen.length; k++) {
+    if (chosen[k].selected !== selecting) {
+        chosen[k].selected = selecting;
+        changed = true;
+    }
+}
+if (changed) {
+    select.dispatchEvent(new Event("input", {bubbles: true}));
+    select.dispatchEvent(new Event("change", {bubbles: true}));
+}
+return null;
+"""
+"""
+Select or deselect options by their text, value, or index, all at once.
+
+Options are matched the way Selenium's ``Select`` matches them, but without
+asking the browser about each option in turn. Returns null, or why the
+options couldn't be chosen, in which case nothing was changed.
+"""
+
+
+def selenium_atom(name: str) -> str:
+    """Load one of the scripts Selenium itself uses to inspect elements."""
+    return pkgutil.get_data("selenium.webdriver.remote", name).decode("utf8")  # type: ignore[union-attr]
+
+
+def to_script_locator(locator: tuple[str, str]) -> tuple[str, str] | None:
+    """Translate a Selenium locator into one the page can evaluate.
+
+    Selenium itself rewrites ID, NAME, and CLASS_NAME locators into CSS
+    selectors before sending them, so we do the same. Locators which can't be
+    expressed as CSS or XPath (like link text) return None, and the caller
+    should fall back to asking the browser the usual way.
+    """
+    how, what = locator
+    if how == By.XPATH:
+        return ("xpath", what)
+    if how in (By.CSS_SELECTOR, By.TAG_NAME):
+        return ("css", what)
+    if how == By.ID:
+        return ("css", f'[id="{what}"]')
+    if how == By.NAME:
+        return ("css", f'[name="{what}"]')
+    if how == By.CLASS_NAME:
+        return ("css", f".{what}")
+    return None
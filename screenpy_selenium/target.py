@@ -8,19 +8,29 @@ will be used by Actors to find elements.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Iterator, Mapping
 
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 
 from .abilities.browse_the_web import BrowseTheWeb
+from .element_proxy import RefindingElement, prefetch as prefetch_properties
 from .exceptions import TargetingError
+from .profiling import target_profiler
+from .scripts import COUNT, RESOLVE_ALL, to_script_locator
 
 if TYPE_CHECKING:
     from screenpy.actor import Actor
-    from selenium.webdriver.remote.webdriver import WebElement
+    from selenium.webdriver.remote.webdriver import WebDriver
     from typing_extensions import Self
 
+_bound_elements: ContextVar[Mapping[Target, WebElement] | None] = ContextVar(
+    "_bound_elements", default=None
+)
+
 
 class Target:
     """Describe an element with a human-readable string and a locator.
@@ -35,10 +45,16 @@ class Target:
         Target.the("welcome message").located_by('//h2[@name = "welcome"]')
 
         Target().located_by((By.ID, "username-field"))
+
+        Target.the("login button").located_by("#login").cached()
+
+        Target.the("first row").located_by("tr").inside_the(RESULTS_TABLE)
     """
 
     _description: str | None = None
     locator: tuple[str, str] | None = None
+    cache: bool = False
+    parent: Target | None = None
 
     @property
     def target_name(self) -> str | None:
@@ -68,7 +84,7 @@ class Target:
 
         Possible values for locator:
             * A tuple of a By classifier and a string (e.g. ``(By.ID, "welcome")``)
-            * An XPATH string (e.g. ``"//div/h3"``)
+            * An XPATH string (e.g. ``"//div/h3"`` or ``".//h3"``)
             * A CSS selector string (e.g. ``"div.confetti"``)
 
         Aliases:
@@ -83,7 +99,7 @@ class Target:
                 msg = "locator tuple length should be 2"
                 raise ValueError(msg)
             self.locator = locator
-        elif locator[0] in ("(", "/"):
+        elif locator[0] in ("(", "/") or locator.startswith("./"):
             self.locator = (By.XPATH, locator)
         else:
             self.locator = (By.CSS_SELECTOR, locator)
@@ -94,6 +110,77 @@ class Target:
         """Alias for :meth:~screenpy_selenium.Target.located_by."""
         return self.located_by(locator)
 
+    def inside_the(self, parent: Target) -> Self:
+        """Search for this Target only inside the parent Target's element.
+
+        The parent's element is found first (or recalled, if the parent is
+        :meth:`cached`), then this Target's locator is used to search only
+        within it. This keeps locators short and saves the browser from
+        searching the entire page.
+
+        Note that XPath locators starting with ``//`` still search the whole
+        document; start them with ``.//`` to search inside the parent.
+
+        Aliases:
+            * :meth:`~screenpy_selenium.Target.inside`
+            * :meth:`~screenpy_selenium.Target.within`
+        """
+        self.parent = parent
+        return self
+
+    def inside(self, parent: Target) -> Self:
+        """Alias for :meth:`~screenpy_selenium.Target.inside_the`."""
+        return self.inside_the(parent)
+
+    def within(self, parent: Target) -> Self:
+        """Alias for :meth:`~screenpy_selenium.Target.inside_the`."""
+        return self.inside_the(parent)
+
+    def cached(self) -> Self:
+        """Remember the found element(s) until the page changes.
+
+        A cached Target only asks the browser to find its element(s) the first
+        time; afterward, the Actor's |BrowseTheWeb| Ability hands back the same
+        element(s). The cache is cleared when the Actor navigates (``Open``,
+        ``GoBack``, ``GoForward``, ``RefreshPage``), switches windows or frames
+        (``SwitchTo``, ``SwitchToTab``), or when the browser reports a stale
+        element reference.
+
+        Aliases:
+            * :meth:`~screenpy_selenium.Target.remembered`
+        """
+        self.cache = True
+        return self
+
+    def remembered(self) -> Self:
+        """Alias for :meth:`~screenpy_selenium.Target.cached`."""
+        return self.cached()
+
+    @property
+    def cache_key(self) -> Hashable:
+        """Identify the element(s) this Target finds, for caching."""
+        if self.parent is None:
+            return self.get_locator()
+        return (self.parent.cache_key, self.get_locator())
+
+    @property
+    def script_locator(self) -> list[tuple[str, str]] | None:
+        """Describe how to find this Target from inside the page, if possible.
+
+        Returns None if the locator can't be evaluated by a script, like
+        locators using link text.
+        """
+        script_locator = to_script_locator(self.get_locator())
+        if script_locator is None:
+            return None
+        if self.parent is None:
+            return [script_locator]
+
+        parent_script_locator = self.parent.script_locator
+        if parent_script_locator is None:
+            return None
+        return [*parent_script_locator, script_locator]
+
     def get_locator(self) -> tuple[str, str]:
         """Return the stored locator.
 
@@ -108,23 +195,237 @@ class Target:
             raise TargetingError(msg)
         return self.locator
 
+    def search_context_for(self, the_actor: Actor) -> WebDriver | WebElement:
+        """Get the browser, or the parent's element, to search within."""
+        if self.parent is None:
+            return the_actor.ability_to(BrowseTheWeb).browser
+        return self.parent.found_by(the_actor)
+
     def found_by(self, the_actor: Actor) -> WebElement:
         """Retrieve the |WebElement| as viewed by the Actor."""
+        bound = _bound_elements.get()
+        if bound is not None and self in bound:
+            return bound[self]
+
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        key = (self.cache_key, "one")
+        if self.cache:
+            element = browse_the_web.cached_element(key)
+            if element is not None:
+                return element  # type: ignore[return-value]
+
+        element = self._find(the_actor)
+        if self.cache:
+            return self._remember(the_actor, element)
+        return element
+
+    def _find(self, the_actor: Actor) -> WebElement:
+        """Ask the browser for the element, without looking in the cache."""
+        search_context = self.search_context_for(the_actor)
+        with target_profiler.timing(self):
+            try:
+                return search_context.find_element(*self)
+            except WebDriverException as e:
+                msg = f"{e} raised while trying to find {self}."
+                raise TargetingError(msg) from e
+
+    def _remember(self, the_actor: Actor, element: WebElement) -> WebElement:
+        """Cache the element, which finds itself again if it goes stale."""
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        key = (self.cache_key, "one")
+        if type(element) is not WebElement:
+            # other kinds of elements (like Appium's) are kept as they are.
+            browse_the_web.cache_element(key, element)
+            return element
+
+        def refind() -> WebElement:
+            found = self._find(the_actor)
+            browse_the_web.cache_element(key, remembered)
+            return found
+
+        remembered = RefindingElement.of(element, refind)
+        browse_the_web.cache_element(key, remembered)
+        return remembered
+
+    def all_found_by(
+        self, the_actor: Actor, *, prefetch: Iterable[str] = ()
+    ) -> list[WebElement]:
+        """Retrieve a list of |WebElement| objects as viewed by the Actor.
+
+        Args:
+            the_actor: the Actor who is looking for the elements.
+            prefetch: properties to fetch for every element in one round trip;
+                any of "text", "is_displayed", "rect", or "attribute:<name>".
+                If given, the elements are returned as
+                :class:`~screenpy_selenium.element_proxy.ElementProxy` objects
+                which already know those properties.
+        """
+        elements = self._all_found_by(the_actor)
+        if not prefetch:
+            return elements
         browser = the_actor.ability_to(BrowseTheWeb).browser
-        try:
-            return browser.find_element(*self)
-        except WebDriverException as e:
-            msg = f"{e} raised while trying to find {self}."
-            raise TargetingError(msg) from e
+        return prefetch_properties(browser, elements, prefetch)  # type: ignore[return-value]
+
+    def _all_found_by(self, the_actor: Actor) -> list[WebElement]:
+        """Find all the elements, or recall them from the cache."""
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        key = (self.cache_key, "all")
+        if self.cache:
+            elements = browse_the_web.cached_element(key)
+            if elements is not None:
+                return elements  # type: ignore[return-value]
+
+        elements = self._find_all(the_actor)
+        if self.cache and elements:
+            return self._remember_all(the_actor, elements)
+        return elements
+
+    def _find_all(self, the_actor: Actor) -> list[WebElement]:
+        """Ask the browser for all the elements, without looking in the cache."""
+        search_context = self.search_context_for(the_actor)
+        with target_profiler.timing(self):
+            try:
+                return search_context.find_elements(*self)
+            except WebDriverException as e:
+                msg = f"{e} raised while trying to find {self}."
+                raise TargetingError(msg) from e
+
+    def _remember_all(
+        self, the_actor: Actor, elements: list[WebElement]
+    ) -> list[WebElement]:
+        """Cache the elements, each of which finds itself again if it goes stale."""
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        key = (self.cache_key, "all")
+        if any(type(element) is not WebElement for element in elements):
+            # other kinds of elements (like Appium's) are kept as they are.
+            browse_the_web.cache_element(key, elements)
+            return elements
+
+        def refinder(index: int) -> Callable[[], WebElement]:
+            def refind() -> WebElement:
+                found = self._find_all(the_actor)
+                if index >= len(found):
+                    msg = f"{self} no longer has an element number {index + 1}."
+                    raise TargetingError(msg)
+                if len(found) == len(remembered):
+                    browse_the_web.cache_element(key, remembered)
+                return found[index]
+
+            return refind
+
+        remembered: list[WebElement] = [
+            RefindingElement.of(element, refinder(index))
+            for index, element in enumerate(elements)
+        ]
+        browse_the_web.cache_element(key, remembered)
+        return remembered
+
+    def number_found_by(self, the_actor: Actor) -> int:
+        """Count the elements the Actor can find, without retrieving them.
+
+        The elements are counted inside the page, so only a number travels
+        back from the browser. Targets whose locators can't be run in the page
+        (like link text) are counted by finding all of their elements, as are
+        Targets the script finds none of, to give them the browser's implicit
+        wait to appear.
+        """
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        script_locator = self.script_locator
+        if script_locator is None:
+            return len(self.all_found_by(the_actor))
+        if self.cache:
+            elements = browse_the_web.cached_element((self.cache_key, "all"))
+            if elements is not None:
+                return len(elements)  # type: ignore[arg-type]
+
+        with target_profiler.timing(self):
+            try:
+                count = browse_the_web.browser.execute_script(COUNT, script_locator)
+            except WebDriverException as e:
+                msg = f"{e} raised while trying to count {self}."
+                raise TargetingError(msg) from e
+
+        if count == 0:
+            return len(self.all_found_by(the_actor))
+        return count
+
+    @staticmethod
+    def resolve_all(the_actor: Actor, *targets: Target) -> list[WebElement]:
+        """Retrieve the |WebElement| for each Target in a single round trip.
+
+        All of the lookups are run inside the page by one script, rather than
+        asking the browser to find each element in turn. Cached Targets which
+        are already remembered are not looked up again, and Targets whose
+        locators can't be run in the page (like link text) are found the usual
+        way. So are any Targets the script could not find, which gives them
+        the browser's implicit wait to appear.
+
+        Examples::
+
+            username, password = Target.resolve_all(
+                the_actor, USERNAME_FIELD, PASSWORD_FIELD
+            )
 
-    def all_found_by(self, the_actor: Actor) -> list[WebElement]:
-        """Retrieve a list of |WebElement| objects as viewed by the Actor."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
+        Raises:
+            TargetingError: if any of the Targets could not be found.
+        """
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        elements: dict[int, WebElement] = {}
+        to_locate: dict[int, list[tuple[str, str]]] = {}
+        for index, target in enumerate(targets):
+            if target.cache:
+                element = browse_the_web.cached_element((target.cache_key, "one"))
+                if element is not None:
+                    elements[index] = element  # type: ignore[assignment]
+                    continue
+            script_locator = target.script_locator
+            if script_locator is None:
+                elements[index] = target.found_by(the_actor)
+            else:
+                to_locate[index] = script_locator
+
+        if to_locate:
+            with target_profiler.timing_batch():
+                try:
+                    located = browse_the_web.browser.execute_script(
+                        RESOLVE_ALL, list(to_locate.values())
+                    )
+                except WebDriverException as e:
+                    names = ", ".join(str(targets[index]) for index in to_locate)
+                    msg = f"{e} raised while trying to find {names}."
+                    raise TargetingError(msg) from e
+
+            for index, element in zip(to_locate, located):
+                target = targets[index]
+                if element is None:
+                    # it may not be there yet, so wait for it the usual way.
+                    elements[index] = target.found_by(the_actor)
+                elif target.cache:
+                    elements[index] = target._remember(the_actor, element)
+                else:
+                    elements[index] = element
+
+        return [elements[index] for index in range(len(targets))]
+
+    @staticmethod
+    @contextmanager
+    def bound_to(elements: Mapping[Target, WebElement]) -> Iterator[None]:
+        """Have each Target find the given element, inside the ``with`` block.
+
+        Lets a group of Actions share elements which were already found (for
+        example, by :meth:`resolve_all`) without asking the browser again.
+
+        Examples::
+
+            elements = Target.resolve_all(the_actor, *targets)
+            with Target.bound_to(dict(zip(targets, elements))):
+                the_actor.attempts_to(*actions)
+        """
+        token = _bound_elements.set({**(_bound_elements.get() or {}), **elements})
         try:
-            return browser.find_elements(*self)
-        except WebDriverException as e:
-            msg = f"{e} raised while trying to find {self}."
-            raise TargetingError(msg) from e
+            yield
+        finally:
+            _bound_elements.reset(token)
 
     def __repr__(self) -> str:
         """A Target is represented by its name."""
@@ -0,0 +1,124 @@
+"""
+Ways to wait for the browser which spend fewer round trips.
+
+Polling asks the browser "is it ready yet?" over and over. These helpers let
+the page itself do the waiting, or space out the asking.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from typing import TYPE_CHECKING, Callable, Iterator, TypeVar
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from .configuration import settings
+from .scripts import WAIT_FOR, selenium_atom
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+T = TypeVar("T")
+
+SCRIPT_TIMEOUT_MARGIN = 5
+"""Seconds of leeway between the wait's timeout and the script timeout."""
+
+MIN_POLLING_INTERVAL = 0.01
+"""The shortest pause between polls, so a ``POLLING`` of 0 still backs off."""
+
+
+def wait_in_browser(
+    browser: WebDriver,
+    timeout: float,
+    script_locator: list[tuple[str, str]],
+    condition: str,
+    text: str = "",
+) -> bool:
+    """Wait inside the page for the condition to be met.
+
+    The session's script timeout is raised for the duration of the wait if
+    it is too short, then put back afterward. It is read from the browser for
+    every wait, in case it was changed since the last one.
+
+    Args:
+        browser: the browser to wait in.
+        timeout: how many seconds to wait before giving up.
+        script_locator: the locator chain for the element to watch.
+        condition: one of "appear", "disappear", "clickable", or
+            "contain_text".
+        text: the text to look for, for the "contain_text" condition.
+
+    Returns:
+        Whether the condition was met before the timeout.
+    """
+    script = f"var isDisplayed = ({selenium_atom('isDisplayed.js')});\n{WAIT_FOR}"
+    script_timeout = browser.timeouts.script
+    needed_timeout = timeout + SCRIPT_TIMEOUT_MARGIN
+    if script_timeout < needed_timeout:
+        browser.set_script_timeout(needed_timeout)
+
+    try:
+        return browser.execute_async_script(
+            script, script_locator, condition, text, int(timeout * 1000)
+        )
+    finally:
+        if script_timeout < needed_timeout:
+            browser.set_script_timeout(script_timeout)
+
+
+def polling_intervals(interval: float) -> Iterator[float]:
+    """Generate the pauses between polls, following the ``POLLING_POLICY``.
+
+    Args:
+        interval: the first (and, for the fixed policy, every) pause. It is
+            at least ``MIN_POLLING_INTERVAL``.
+    """
+    interval = max(interval, MIN_POLLING_INTERVAL)
+    if settings.POLLING_POLICY == "backoff":
+        while True:
+            yield min(interval, settings.POLLING_MAX)
+            interval *= settings.POLLING_BACKOFF_FACTOR
+    elif settings.POLLING_POLICY == "fast_then_slow":
+        fast_polls = max(1, int(settings.POLLING_FAST_FOR / interval))
+        yield from itertools.repeat(interval, fast_polls)
+        yield from itertools.repeat(settings.POLLING_MAX)
+    else:
+        yield from itertools.repeat(interval)
+
+
+def poll_until(
+    browser: WebDriver,
+    condition: Callable[[WebDriver], T],
+    timeout: float,
+    interval: float,
+) -> T:
+    """Ask the browser whether the condition is met until it is.
+
+    Behaves like Selenium's ``WebDriverWait.until``, except that the pause
+    between polls follows the ``POLLING_POLICY`` setting.
+
+    Returns:
+        The condition's first truthy value.
+
+    Raises:
+        TimeoutException: if the condition is not met in time.
+    """
+    end_time = time.monotonic() + timeout
+    last_exception = None
+    for pause in polling_intervals(interval):
+        try:
+            value = condition(browser)
+        except NoSuchElementException as exc:
+            last_exception = exc
+        else:
+            if value:
+                return value
+
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(pause, remaining))
+
+    msg = f"Condition was not met after {timeout} seconds."
+    raise TimeoutException(msg) from last_exception
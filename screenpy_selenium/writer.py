@@ -0,0 +1,143 @@
+"""
+Write files on background threads, so the Actor doesn't wait on the disk.
+
+Writing a screenshot to a slow disk (like a network share) can take longer
+than taking it. Files handed to the writer are written by a small pool of
+threads while the Actor carries on, and all of them are written before
+Python exits.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING
+
+from .configuration import settings
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+def _write_file(path: str, data: bytes) -> str:
+    """Write the data to the file, giving back its path."""
+    with open(path, "wb+") as the_file:
+        the_file.write(data)
+    return path
+
+
+class BackgroundWriter:
+    """Write files on a bounded pool of background threads.
+
+    Only ``max_pending`` files may wait to be written at once; any more, and
+    the caller waits for room, so a slow disk can't fill up the memory.
+    Errors from the writes are raised by :meth:`flush`.
+
+    Examples::
+
+        from screenpy_selenium import background_writer
+
+        written = background_writer.write("page.html", source)
+        path = written.result()  # waits for this file to be written
+
+        background_writer.flush()  # waits for every file to be written
+    """
+
+    max_workers: int | None
+    max_pending: int | None
+    _executor: ThreadPoolExecutor | None
+    _slots: threading.BoundedSemaphore
+    _pending: set[Future[str]]
+    _failures: list[BaseException]
+    _lock: threading.Lock
+
+    def write(self, path: str, data: bytes) -> Future[str]:
+        """Start writing the data to the file at the path.
+
+        Returns:
+            A future which gives the path, once the file is written.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._start()
+            slots = self._slots
+        slots.acquire()
+        with self._lock:
+            # the writer may have been closed while waiting for room.
+            executor = self._executor or self._start()
+            future = executor.submit(_write_file, path, data)
+            self._pending.add(future)
+        future.add_done_callback(lambda done: self._finished(done, slots))
+        return future
+
+    def flush(self) -> None:
+        """Wait for every file handed to the writer so far to be written.
+
+        Raises:
+            OSError: the first error from any write which failed since the
+                last flush.
+        """
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+
+        with self._lock:
+            failures, self._failures = self._failures, []
+        if failures:
+            raise failures[0]
+
+    def close(self) -> None:
+        """Write every waiting file, then stop the threads.
+
+        The writer starts them again if it is given another file.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        try:
+            self.flush()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def _start(self) -> ThreadPoolExecutor:
+        """Start the threads, reading any unset limits from the settings.
+
+        Must be called while holding the lock.
+        """
+        max_workers = self.max_workers or settings.BACKGROUND_WRITER_THREADS
+        max_pending = self.max_pending or settings.BACKGROUND_WRITER_MAX_PENDING
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="screenpy_selenium_writer"
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        return self._executor
+
+    def _finished(self, future: Future[str], slots: threading.BoundedSemaphore) -> None:
+        """Make room for the next file, remembering if this one failed."""
+        exception = future.exception()
+        with self._lock:
+            self._pending.discard(future)
+            if exception is not None:
+                self._failures.append(exception)
+        slots.release()
+
+    def __init__(
+        self, max_workers: int | None = None, max_pending: int | None = None
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._pending = set()
+        self._failures = []
+        self._lock = threading.Lock()
+
+
+# initialized instance
+background_writer = BackgroundWriter()
+
+
+@atexit.register
+def _write_everything_at_exit() -> None:
+    """Make sure every file handed to the writer is written."""
+    background_writer.close()
@@ -0,0 +1,87 @@
+"""
+Compare two saved benchmark runs, and fail if anything got slower.
+
+Usage::
+
+    SCREENPY_SELENIUM_BENCHMARK_ROUNDS=1000 \\
+        SCREENPY_SELENIUM_BENCHMARK_JSON=base.json pytest tests/benchmarks
+    # ... make a change, then save new.json the same way ...
+    python -m tests.benchmarks.compare base.json new.json --threshold 1.10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Any
+
+
+def load(path: str) -> dict[str, dict[str, Any]]:
+    """Load the benchmarks from a saved run."""
+    with open(path) as results_file:
+        return json.load(results_file)["benchmarks"]
+
+
+def compare(
+    base: dict[str, dict[str, Any]],
+    new: dict[str, dict[str, Any]],
+    threshold: float,
+    stat: str = "median_us",
+) -> tuple[list[str], list[str]]:
+    """Lay out the ratio of new to base for each benchmark, noting regressions.
+
+    Returns:
+        The report's lines, and the names of the benchmarks which regressed.
+    """
+    lines = [f"{'benchmark':<72} {'base':>10} {'new':>10} {'ratio':>7}"]
+    regressions = []
+    for name in sorted(base.keys() & new.keys()):
+        before, after = base[name][stat], new[name][stat]
+        ratio = after / before if before else float("inf")
+        flag = ""
+        if ratio > threshold:
+            flag = "  SLOWER"
+            regressions.append(name)
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        lines.append(f"{name:<72} {before:>10.1f} {after:>10.1f} {ratio:>7.2f}{flag}")
+
+    for name in sorted(base.keys() - new.keys()):
+        lines.append(f"{name:<72} (missing from the new run)")
+    for name in sorted(new.keys() - base.keys()):
+        lines.append(f"{name:<72} (new)")
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Compare the runs named on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("base", help="the saved run to compare against")
+    parser.add_argument("new", help="the saved run to check")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.10,
+        help="how many times slower counts as a regression (default: 1.10)",
+    )
+    parser.add_argument(
+        "--stat",
+        default="median_us",
+        choices=("min_us", "median_us", "mean_us", "p95_us"),
+        help="which statistic to compare (default: median_us)",
+    )
+    args = parser.parse_args(argv)
+
+    lines, regressions = compare(
+        load(args.base), load(args.new), args.threshold, args.stat
+    )
+    print("\n".join(lines))  # noqa: T201
+    if regressions:
+        print(f"\n{len(regressions)} benchmarks regressed.")  # noqa: T201
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+A small benchmark harness, so these run anywhere pytest does.
+
+Set ``SCREENPY_SELENIUM_BENCHMARK_ROUNDS`` to time more rounds (the default
+is only enough to make sure everything still runs), and
+``SCREENPY_SELENIUM_BENCHMARK_JSON`` to save the results for comparing with
+``python -m tests.benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import importlib.metadata
+import json
+import os
+import platform
+import statistics
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+import pytest
+from screenpy import AnActor
+from screenpy_pyotp.abilities import AuthenticateWith2FA
+
+from screenpy_selenium import BrowseTheWeb
+
+from .fake_webdriver import FakeWebDriver
+
+if TYPE_CHECKING:
+    from screenpy import Actor
+
+    Benchmark = Callable[[Callable[[], object]], dict[str, Any]]
+
+ROUNDS = int(os.getenv("SCREENPY_SELENIUM_BENCHMARK_ROUNDS", "5"))
+WARMUP_ROUNDS = max(1, ROUNDS // 10)
+RESULTS_PATH = os.getenv("SCREENPY_SELENIUM_BENCHMARK_JSON")
+
+results: dict[str, dict[str, Any]] = {}
+
+
+def summarize(timings_ns: list[int]) -> dict[str, Any]:
+    """Summarize the timings, in microseconds."""
+    timings = sorted(ns / 1000 for ns in timings_ns)
+    return {
+        "rounds": len(timings),
+        "min_us": round(timings[0], 3),
+        "median_us": round(statistics.median(timings), 3),
+        "mean_us": round(statistics.fmean(timings), 3),
+        "p95_us": round(timings[max(0, round(len(timings) * 0.95) - 1)], 3),
+        "stdev_us": round(statistics.pstdev(timings), 3),
+    }
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Benchmark:
+    """Time a function over many rounds, and keep the results."""
+
+    def run(func: Callable[[], object]) -> dict[str, Any]:
+        for _ in range(WARMUP_ROUNDS):
+            func()
+        timings_ns = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter_ns()
+            func()
+            timings_ns.append(time.perf_counter_ns() - start)
+
+        summary = summarize(timings_ns)
+        results[request.node.nodeid] = summary
+        return summary
+
+    return run
+
+
+@pytest.fixture
+def Perry() -> Actor:
+    """Provide an Actor who browses a fake, instantaneous browser."""
+    return AnActor.named("Perry").who_can(
+        BrowseTheWeb.using(FakeWebDriver()),
+        AuthenticateWith2FA.using_secret("JBSWY3DPEHPK3PXP"),
+    )
+
+
+def pytest_sessionfinish() -> None:
+    """Save the results, if asked to."""
+    if RESULTS_PATH is None or not results:
+        return
+    saved = {
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "versions": {
+            package: importlib.metadata.version(package)
+            for package in ("screenpy_selenium", "screenpy", "selenium")
+        },
+        "benchmarks": dict(sorted(results.items())),
+    }
+    with open(RESULTS_PATH, "w") as results_file:
+        json.dump(saved, results_file, indent=2)
@@ -0,0 +1,81 @@
+"""A WebDriver which answers every command instantly, with no browser."""
+
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from screenpy_selenium.scripts import COUNT, RESOLVE_ALL, selenium_atom
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+FAKE_PNG = base64.b64encode(b"\x89PNG\r\n\x1a\n").decode()
+
+
+def element_ref(number: int) -> dict[str, str]:
+    return {ELEMENT_KEY: f"fake-element-{number}"}
+
+
+class FakeExecutor:
+    """Answer each command with a plausible response, immediately."""
+
+    def __init__(self) -> None:
+        elements = [element_ref(n) for n in range(3)]
+        self.responses: dict[str, Any] = {
+            Command.NEW_SESSION: {"sessionId": "fake", "capabilities": {}},
+            Command.FIND_ELEMENT: elements[0],
+            Command.FIND_CHILD_ELEMENT: elements[0],
+            Command.FIND_ELEMENTS: elements,
+            Command.FIND_CHILD_ELEMENTS: elements,
+            Command.GET_ELEMENT_TEXT: "fake text",
+            Command.GET_ELEMENT_TAG_NAME: "select",
+            Command.GET_ELEMENT_ATTRIBUTE: "fake attribute",
+            Command.GET_ELEMENT_PROPERTY: None,
+            Command.IS_ELEMENT_SELECTED: True,
+            Command.IS_ELEMENT_ENABLED: True,
+            Command.GET_ELEMENT_RECT: {"x": 0, "y": 0, "width": 10, "height": 10},
+            Command.GET_TITLE: "Fake Title",
+            Command.GET_CURRENT_URL: "http://fake.example.com/",
+            Command.GET_ALL_COOKIES: [{"name": "fake", "value": "cookie"}],
+            Command.W3C_GET_WINDOW_HANDLES: ["window-1", "window-2"],
+            Command.W3C_GET_CURRENT_WINDOW_HANDLE: "window-1",
+            Command.W3C_GET_ALERT_TEXT: "fake alert",
+            Command.GET_TIMEOUTS: {"implicit": 0, "pageLoad": 300000, "script": 30000},
+            Command.SCREENSHOT: FAKE_PNG,
+            Command.W3C_EXECUTE_SCRIPT: True,
+            Command.W3C_EXECUTE_SCRIPT_ASYNC: True,
+        }
+        self.script_responses: dict[str, Any] = {
+            COUNT: len(elements),
+            RESOLVE_ALL: elements,
+            "var properties = arguments[1];": [
+                {"text": "fake text", "attribute:class": "fake"} for _ in elements
+            ],
+            "var fields = arguments[0];": [None for _ in elements],
+            "var selecting = arguments[3];": None,
+            selenium_atom("getAttribute.js"): "0",
+            selenium_atom("isDisplayed.js"): True,
+        }
+
+    def execute(self, command: str, params: dict[str, Any]) -> dict[str, Any]:
+        if command == Command.W3C_EXECUTE_SCRIPT:
+            for marker, value in self.script_responses.items():
+                if marker in params["script"]:
+                    return {"value": value}
+        return {"value": self.responses.get(command)}
+
+    def close(self) -> None:
+        pass
+
+
+class FakeWebDriver(WebDriver):
+    """A WebDriver whose commands cost no time at all."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            command_executor=FakeExecutor(),  # type: ignore[arg-type]
+            options=ArgOptions(),
+        )
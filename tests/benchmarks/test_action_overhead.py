@@ -0,0 +1,147 @@
+"""Measure the Python-side cost of every Action, against a fake browser."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+import pytest
+from screenpy import Describable
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from screenpy_selenium import (
+    AcceptAlert,
+    Chain,
+    Clear,
+    Click,
+    DismissAlert,
+    DoubleClick,
+    Enter,
+    Enter2FAToken,
+    FillForm,
+    GoBack,
+    GoForward,
+    HoldDown,
+    MoveMouse,
+    Open,
+    Pause,
+    RefreshPage,
+    Release,
+    RespondToThePrompt,
+    RightClick,
+    SaveConsoleLog,
+    SaveScreenshot,
+    Select,
+    SwitchTo,
+    SwitchToTab,
+    Target,
+    Wait,
+    WithinCommandBudget,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from screenpy import Actor, Performable
+
+    from .conftest import Benchmark
+
+    ActionFactory = Callable[[Path], Performable]
+
+BUTTON = Target.the("fake button").located_by("#button")
+CACHED_BUTTON = Target.the("fake cached button").located_by("#button").cached()
+FIELD = Target.the("fake field").located_by('//input[@name="field"]')
+DROPDOWN = Target.the("fake dropdown").located_by("#dropdown")
+FRAME = Target.the("fake frame").located_by("iframe")
+
+REUSED_CHAIN = Chain(
+    HoldDown(Keys.SHIFT),
+    MoveMouse.to_the(BUTTON).with_offset(1, 1),
+    Click.on_the(BUTTON),
+    Release(Keys.SHIFT),
+)
+
+ACTIONS: list[tuple[str, ActionFactory]] = [
+    ("AcceptAlert", lambda _: AcceptAlert()),
+    (
+        "Chain",
+        lambda _: Chain(
+            HoldDown(Keys.SHIFT),
+            MoveMouse.to_the(BUTTON).with_offset(1, 1),
+            Click.on_the(BUTTON),
+            Release(Keys.SHIFT),
+        ),
+    ),
+    ("Chain (reused)", lambda _: REUSED_CHAIN),
+    ("Clear", lambda _: Clear.the_text_from_the(FIELD)),
+    ("Click", lambda _: Click.on_the(BUTTON)),
+    ("Click (cached Target)", lambda _: Click.on_the(CACHED_BUTTON)),
+    ("DismissAlert", lambda _: DismissAlert()),
+    ("DoubleClick", lambda _: DoubleClick.on_the(BUTTON)),
+    ("Enter", lambda _: Enter.the_text("spam").into_the(FIELD)),
+    (
+        "Enter then_hit",
+        lambda _: Enter.the_text("spam").into_the(FIELD).then_hit(Keys.ENTER),
+    ),
+    ("Enter the_secret", lambda _: Enter.the_secret("eggs").into_the(FIELD)),
+    ("Enter instantly", lambda _: Enter.the_text("spam").into_the(FIELD).instantly()),
+    ("Enter2FAToken", lambda _: Enter2FAToken.into_the(FIELD)),
+    (
+        "FillForm",
+        lambda _: FillForm.with_the({FIELD: "spam", DROPDOWN: "fake", BUTTON: True}),
+    ),
+    ("GoBack", lambda _: GoBack()),
+    ("GoForward", lambda _: GoForward()),
+    ("HoldDown", lambda _: Chain(HoldDown.command_or_control_key())),
+    ("MoveMouse", lambda _: MoveMouse.to_the(BUTTON)),
+    ("MoveMouse by_offset", lambda _: MoveMouse.by_offset(10, 10)),
+    ("Open", lambda _: Open.their_browser_on("http://fake.example.com/")),
+    ("Pause", lambda _: Pause.for_(0).seconds_because("it's a benchmark")),
+    ("RefreshPage", lambda _: RefreshPage()),
+    ("Release", lambda _: Chain(Release.command_or_control_key())),
+    ("RespondToThePrompt", lambda _: RespondToThePrompt.with_("spam")),
+    ("RightClick", lambda _: RightClick.on_the(BUTTON)),
+    ("SaveScreenshot", lambda path: SaveScreenshot.as_(str(path / "fake.png"))),
+    (
+        "SaveScreenshot in_the_background",
+        lambda path: SaveScreenshot.as_(str(path / "fake.png")).in_the_background(),
+    ),
+    ("SelectByIndex", lambda _: Select.the_option_at_index(0).from_the(DROPDOWN)),
+    ("SelectByText", lambda _: Select.the_option_named("fake text").from_(DROPDOWN)),
+    (
+        "SelectByText in_the_browser",
+        lambda _: Select.the_option_named("fake text").from_(DROPDOWN).in_the_browser(),
+    ),
+    (
+        "SelectOptions",
+        lambda _: Select.the_options_named("a", "b", "c").from_the(DROPDOWN),
+    ),
+    ("SelectByValue", lambda _: Select.the_option_with_value("v").from_(DROPDOWN)),
+    ("SwitchTo", lambda _: SwitchTo.the(FRAME)),
+    ("SwitchTo default", lambda _: SwitchTo.default()),
+    ("SwitchToTab", lambda _: SwitchToTab(2)),
+    ("Wait", lambda _: Wait(1).seconds_for_the(BUTTON)),
+    ("Wait to_contain_text", lambda _: Wait.for_the(BUTTON).to_contain_text("fake")),
+    ("WithinCommandBudget", lambda _: WithinCommandBudget(5, Click.on_the(BUTTON))),
+]
+
+if hasattr(WebDriver, "get_log"):
+    ACTIONS.append(
+        ("SaveConsoleLog", lambda path: SaveConsoleLog.as_(str(path / "fake.txt")))
+    )
+
+ACTION_PARAMS = [pytest.param(factory, id=name) for name, factory in ACTIONS]
+
+
+@pytest.mark.parametrize("factory", ACTION_PARAMS)
+def test_perform(
+    factory: ActionFactory, benchmark: Benchmark, Perry: Actor, tmp_path: Path
+) -> None:
+    benchmark(lambda: Perry.attempts_to(factory(tmp_path)))
+
+
+@pytest.mark.parametrize("factory", ACTION_PARAMS)
+def test_describe(factory: ActionFactory, benchmark: Benchmark, tmp_path: Path) -> None:
+    action = factory(tmp_path)
+    assert isinstance(action, Describable)
+    benchmark(action.describe)
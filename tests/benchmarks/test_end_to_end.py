@@ -0,0 +1,157 @@
+"""
+Measure whole Tasks against a real browser, on a page served locally.
+
+These only run when ``SCREENPY_SELENIUM_BENCHMARK_BROWSER`` names a browser
+to launch headlessly ("chrome" or "firefox").
+"""
+
+from __future__ import annotations
+
+import functools
+import http.server
+import os
+import threading
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+from screenpy import AnActor, See
+from screenpy.resolutions import ContainsTheText, IsEqualTo
+from selenium import webdriver
+
+from screenpy_selenium import (
+    BrowseTheWeb,
+    Clear,
+    Click,
+    Element,
+    Enter,
+    IsVisible,
+    Number,
+    Open,
+    Select,
+    Target,
+    Text,
+    Wait,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from screenpy import Actor
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    from .conftest import Benchmark
+
+BROWSER = os.getenv("SCREENPY_SELENIUM_BENCHMARK_BROWSER")
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Benchmark</title></head>
+<body>
+  <form onsubmit="event.preventDefault();
+      document.getElementById('greeting').innerText = 'Hello, '
+      + document.getElementById('name').value + '!';">
+    <input id="name" type="text">
+    <select id="color">
+      <option value="red">Red</option>
+      <option value="green">Green</option>
+      <option value="blue">Blue</option>
+    </select>
+    <button id="submit" type="submit">Submit</button>
+  </form>
+  <p id="greeting"></p>
+  <ul>
+    <li class="item">One</li><li class="item">Two</li><li class="item">Three</li>
+  </ul>
+</body>
+</html>
+"""
+
+NAME_FIELD = Target.the("name field").located_by("#name")
+COLOR_DROPDOWN = Target.the("color dropdown").located_by("#color")
+SUBMIT_BUTTON = Target.the("submit button").located_by("#submit")
+GREETING = Target.the("greeting").located_by("#greeting")
+ITEMS = Target.the("list items").located_by(".item")
+
+pytestmark = pytest.mark.skipif(
+    BROWSER is None, reason="SCREENPY_SELENIUM_BENCHMARK_BROWSER is not set."
+)
+
+
+def launch_headless(browser_name: str) -> WebDriver:
+    """Launch a headless browser, by name."""
+    if browser_name == "chrome":
+        chrome_options = webdriver.ChromeOptions()
+        chrome_options.add_argument("--headless=new")
+        return webdriver.Chrome(options=chrome_options)
+    if browser_name == "firefox":
+        firefox_options = webdriver.FirefoxOptions()
+        firefox_options.add_argument("-headless")
+        return webdriver.Firefox(options=firefox_options)
+    msg = f'Can\'t benchmark with "{browser_name}"; use "chrome" or "firefox".'
+    raise ValueError(msg)
+
+
+@pytest.fixture(scope="module")
+def page_url(tmp_path_factory: pytest.TempPathFactory) -> Iterator[str]:
+    """Serve the benchmark page from a local server."""
+    site: Path = tmp_path_factory.mktemp("site")
+    (site / "index.html").write_text(PAGE)
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler, directory=str(site)
+    )
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/index.html"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def browser() -> Iterator[WebDriver]:
+    """Launch one headless browser for the whole module."""
+    assert BROWSER is not None
+    driver = launch_headless(BROWSER)
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture
+def Bree(browser: WebDriver) -> Actor:
+    """Provide an Actor who browses the real, headless browser."""
+    return AnActor.named("Bree").who_can(BrowseTheWeb.using(browser))
+
+
+def test_open_page(benchmark: Benchmark, Bree: Actor, page_url: str) -> None:
+    benchmark(lambda: Bree.attempts_to(Open.their_browser_on(page_url)))
+
+
+def test_fill_and_submit(benchmark: Benchmark, Bree: Actor, page_url: str) -> None:
+    Bree.attempts_to(Open.their_browser_on(page_url))
+
+    def fill_and_submit() -> None:
+        Bree.attempts_to(
+            Wait.for_the(NAME_FIELD).to_appear(),
+            Enter.the_text("Perry").into_the(NAME_FIELD),
+            Select.the_option_named("Green").from_the(COLOR_DROPDOWN),
+            Click.on_the(SUBMIT_BUTTON),
+        )
+        Bree.should(See.the(Text.of_the(GREETING), ContainsTheText("Perry")))
+        Bree.attempts_to(Clear.the_text_from_the(NAME_FIELD))
+
+    benchmark(fill_and_submit)
+
+
+def test_read_page(benchmark: Benchmark, Bree: Actor, page_url: str) -> None:
+    Bree.attempts_to(Open.their_browser_on(page_url))
+
+    def read_page() -> None:
+        Bree.should(
+            See.the(Number.of(ITEMS), IsEqualTo(3)),
+            See.the(Element(SUBMIT_BUTTON), IsVisible()),
+            See.the(
+                Text.of_all(ITEMS).all_at_once(), IsEqualTo(["One", "Two", "Three"])
+            ),
+        )
+
+    benchmark(read_page)
@@ -0,0 +1,88 @@
+"""Measure the Python-side cost of every Question, against a fake browser."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+import pytest
+from screenpy import Describable, IsNot, See
+
+from screenpy_selenium import (
+    Attribute,
+    BrowserTitle,
+    BrowserURL,
+    Cookies,
+    Element,
+    IsClickable,
+    IsInvisible,
+    IsPresent,
+    IsVisible,
+    List,
+    Number,
+    Selected,
+    Target,
+    Text,
+    TextOfTheAlert,
+)
+
+if TYPE_CHECKING:
+    from screenpy import Actor, Answerable
+
+    from .conftest import Benchmark
+
+BUTTON = Target.the("fake button").located_by("#button")
+BUTTONS = Target.the("fake buttons").located_by("button")
+CACHED_BUTTONS = Target.the("fake cached buttons").located_by("button").cached()
+DROPDOWN = Target.the("fake dropdown").located_by("#dropdown")
+
+QUESTIONS: list[tuple[str, Callable[[], Answerable]]] = [
+    ("Attribute", lambda: Attribute("class").of_the(BUTTON)),
+    ("Attribute of_all", lambda: Attribute("class").of_all(BUTTONS)),
+    (
+        "Attribute of_all all_at_once",
+        lambda: Attribute("class").of_all(BUTTONS).all_at_once(),
+    ),
+    ("BrowserTitle", BrowserTitle),
+    ("BrowserURL", BrowserURL),
+    ("Cookies", Cookies),
+    ("Element", lambda: Element(BUTTON)),
+    ("List", lambda: List.of_all(BUTTONS)),
+    ("List (cached Target)", lambda: List.of_all(CACHED_BUTTONS)),
+    ("Number", lambda: Number.of(BUTTONS)),
+    ("Selected", lambda: Selected.option_from_the(DROPDOWN)),
+    ("Selected options", lambda: Selected.options_from_the(DROPDOWN)),
+    ("Text", lambda: Text.of_the(BUTTON)),
+    ("Text of_all", lambda: Text.of_all(BUTTONS)),
+    ("Text of_all all_at_once", lambda: Text.of_all(BUTTONS).all_at_once()),
+    ("TextOfTheAlert", TextOfTheAlert),
+]
+
+RESOLUTIONS: list[tuple[str, Callable[[], Any]]] = [
+    ("IsClickable", IsClickable),
+    ("IsInvisible", lambda: IsNot(IsInvisible())),
+    ("IsPresent", IsPresent),
+    ("IsVisible", IsVisible),
+]
+
+QUESTION_PARAMS = [pytest.param(factory, id=name) for name, factory in QUESTIONS]
+
+
+@pytest.mark.parametrize("factory", QUESTION_PARAMS)
+def test_answer(
+    factory: Callable[[], Answerable], benchmark: Benchmark, Perry: Actor
+) -> None:
+    benchmark(lambda: factory().answered_by(Perry))
+
+
+@pytest.mark.parametrize("factory", QUESTION_PARAMS)
+def test_describe(factory: Callable[[], Answerable], benchmark: Benchmark) -> None:
+    question = factory()
+    assert isinstance(question, Describable)
+    benchmark(question.describe)
+
+
+@pytest.mark.parametrize(
+    "resolution", [pytest.param(factory, id=name) for name, factory in RESOLUTIONS]
+)
+def test_see(resolution: Callable[[], Any], benchmark: Benchmark, Perry: Actor) -> None:
+    benchmark(lambda: Perry.should(See.the(Element(BUTTON), resolution())))
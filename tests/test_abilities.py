@@ -1,15 +1,26 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 from unittest import mock
 
 import pytest
 from screenpy import Forgettable
+from selenium.common.exceptions import StaleElementReferenceException
 
-from screenpy_selenium import BrowseTheWeb, BrowsingError
+from screenpy_selenium import (
+    BrowserPool,
+    BrowseTheWeb,
+    BrowsingError,
+    KeepRecentScreenshots,
+)
+from screenpy_selenium.configuration import ScreenPySeleniumSettings
 
 from .useful_mocks import get_mocked_webdriver
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestBrowseTheWeb:
     def test_can_be_instantiated(self) -> None:
@@ -22,26 +33,66 @@ class TestBrowseTheWeb:
 
         assert isinstance(b, Forgettable)
 
-    @mock.patch("screenpy_selenium.abilities.browse_the_web.Firefox", autospec=True)
+    @mock.patch("selenium.webdriver.Firefox", autospec=True)
     def test_using_firefox(self, mocked_firefox: mock.Mock) -> None:
         BrowseTheWeb.using_firefox()
 
         mocked_firefox.assert_called_once()
 
-    @mock.patch("screenpy_selenium.abilities.browse_the_web.Chrome", autospec=True)
+    @mock.patch("selenium.webdriver.Chrome", autospec=True)
     def test_using_chrome(self, mocked_chrome: mock.Mock) -> None:
         BrowseTheWeb.using_chrome()
 
         mocked_chrome.assert_called_once()
 
-    @mock.patch("screenpy_selenium.abilities.browse_the_web.Safari", autospec=True)
+    @mock.patch(
+        "screenpy_selenium.abilities.browse_the_web.BrowserLauncher", autospec=True
+    )
+    @mock.patch("selenium.webdriver.Chrome", autospec=True)
+    def test_using_prewarmed_chrome(
+        self, mocked_chrome: mock.Mock, mocked_launcher: mock.Mock
+    ) -> None:
+        launcher = mocked_launcher.return_value
+        BrowseTheWeb.prewarm("chrome", count=2)
+        try:
+            b = BrowseTheWeb.using_chrome()
+        finally:
+            BrowseTheWeb.stop_prewarming("chrome")
+
+        mocked_launcher.assert_called_once_with(mocked_chrome, 2)
+        assert b.browser is launcher.take.return_value
+        mocked_chrome.assert_not_called()
+        launcher.close.assert_called_once_with()
+
+    @mock.patch(
+        "screenpy_selenium.abilities.browse_the_web.BrowserLauncher", autospec=True
+    )
+    @mock.patch("selenium.webdriver.Firefox", autospec=True)
+    def test_using_prewarmed_firefox(
+        self, mocked_firefox: mock.Mock, mocked_launcher: mock.Mock
+    ) -> None:
+        launcher = mocked_launcher.return_value
+        BrowseTheWeb.prewarm("firefox")
+        try:
+            b = BrowseTheWeb.using_firefox()
+        finally:
+            BrowseTheWeb.stop_prewarming("firefox")
+
+        mocked_launcher.assert_called_once_with(mocked_firefox, 1)
+        assert b.browser is launcher.take.return_value
+
+    def test_prewarm_unsupported_browser(self) -> None:
+        with pytest.raises(BrowsingError):
+            BrowseTheWeb.prewarm("safari")
+
+    @mock.patch("selenium.webdriver.Safari", autospec=True)
     def test_using_safari(self, mocked_safari: mock.Mock) -> None:
         BrowseTheWeb.using_safari()
 
         mocked_safari.assert_called_once()
 
     @mock.patch.dict(os.environ, {"IOS_DEVICE_VERSION": "1"})
-    @mock.patch("screenpy_selenium.abilities.browse_the_web.Remote", autospec=True)
+    @mock.patch("selenium.webdriver.Remote", autospec=True)
     def test_using_ios(self, mocked_remote: mock.Mock) -> None:
         BrowseTheWeb.using_ios()
 
@@ -52,7 +103,7 @@ class TestBrowseTheWeb:
             BrowseTheWeb.using_ios()
 
     @mock.patch.dict(os.environ, {"ANDROID_DEVICE_VERSION": "1"})
-    @mock.patch("screenpy_selenium.abilities.browse_the_web.Remote", autospec=True)
+    @mock.patch("selenium.webdriver.Remote", autospec=True)
     def test_using_android(self, mocked_android: mock.Mock) -> None:
         BrowseTheWeb.using_android()
 
@@ -62,7 +113,7 @@ class TestBrowseTheWeb:
         with pytest.raises(BrowsingError):
             BrowseTheWeb.using_android()
 
-    @mock.patch("screenpy_selenium.abilities.browse_the_web.Chrome", autospec=True)
+    @mock.patch("selenium.webdriver.Chrome", autospec=True)
     def test_forget_calls_quit(self, mocked_chrome: mock.Mock) -> None:
         b = BrowseTheWeb(mocked_chrome)
 
@@ -70,6 +121,77 @@ class TestBrowseTheWeb:
 
         mocked_chrome.quit.assert_called_once()
 
+    def test_forget_clears_element_cache(self) -> None:
+        b = BrowseTheWeb(get_mocked_webdriver())
+        b.cache_element("key", "element")  # type: ignore[arg-type]
+
+        b.forget()
+
+        assert b.element_cache == {}
+
+    def test_cache_element(self) -> None:
+        b = BrowseTheWeb(get_mocked_webdriver())
+
+        b.cache_element("key", "element")  # type: ignore[arg-type]
+
+        assert b.cached_element("key") == "element"
+        assert b.cached_element("other key") is None
+
+    def test_cache_is_keyed_by_context(self) -> None:
+        b = BrowseTheWeb(get_mocked_webdriver())
+        b.cache_element("key", "element")  # type: ignore[arg-type]
+
+        b.window_handle = "another window"
+
+        assert b.cached_element("key") is None
+
+    def test_switched_to_clears_element_cache(self) -> None:
+        b = BrowseTheWeb(get_mocked_webdriver())
+        b.cache_element("key", "element")  # type: ignore[arg-type]
+
+        b.switched_to(window_handle="window", frame="frame")
+
+        assert b.element_cache == {}
+        assert b.window_handle == "window"
+        assert b.frame == "frame"
+
+    def test_stale_element_clears_element_cache(self) -> None:
+        browser = get_mocked_webdriver()
+        error_handler = browser.error_handler = mock.Mock()
+        error_handler.check_response.side_effect = StaleElementReferenceException
+        b = BrowseTheWeb(browser)
+        b.cache_element("key", "element")  # type: ignore[arg-type]
+
+        with pytest.raises(StaleElementReferenceException):
+            browser.error_handler.check_response({"status": 404})
+
+        assert b.element_cache == {}
+        b.cache_element("key", "element")  # type: ignore[arg-type]
+        assert browser.error_handler.error_handler is error_handler
+
+    def test_from_pool(self) -> None:
+        pool = mock.create_autospec(BrowserPool, instance=True)
+        browser = pool.acquire.return_value = get_mocked_webdriver()
+
+        b = BrowseTheWeb.from_pool(pool)
+
+        assert b.browser is browser
+        assert b.pool is pool
+
+    def test_forget_returns_browser_to_pool(self) -> None:
+        pool = mock.create_autospec(BrowserPool, instance=True)
+        browser = pool.acquire.return_value = get_mocked_webdriver()
+        error_handler = browser.error_handler = mock.Mock()
+        b = BrowseTheWeb.from_pool(pool)
+        b.cache_element("key", "element")  # type: ignore[arg-type]
+
+        b.forget()
+
+        pool.release.assert_called_once_with(browser)
+        browser.quit.assert_not_called()
+        assert b.element_cache == {}
+        assert browser.error_handler is error_handler
+
     def test_repr(self) -> None:
         assert repr(BrowseTheWeb(get_mocked_webdriver())) == "Browse the Web"
 
@@ -81,3 +203,105 @@ class TestBrowseTheWeb:
                 return True
 
         assert SubBrowseTheWeb.using(get_mocked_webdriver()).new_method() is True
+
+
+class TestKeepRecentScreenshots:
+    def test_can_be_instantiated(self) -> None:
+        k1 = KeepRecentScreenshots()
+        k2 = KeepRecentScreenshots.up_to(5)
+        k3 = KeepRecentScreenshots.up_to(5).using_at_most(1000).and_console_logs()
+
+        assert isinstance(k1, KeepRecentScreenshots)
+        assert isinstance(k2, KeepRecentScreenshots)
+        assert isinstance(k3, KeepRecentScreenshots)
+
+    def test_implements_protocol(self) -> None:
+        assert isinstance(KeepRecentScreenshots(), Forgettable)
+
+    def test_defaults_come_from_settings(self) -> None:
+        mock_settings = ScreenPySeleniumSettings(
+            KEPT_SCREENSHOTS=3, KEPT_SCREENSHOTS_MAX_BYTES=30
+        )
+        settings_path = "screenpy_selenium.abilities.keep_recent_screenshots.settings"
+
+        with mock.patch(settings_path, mock_settings):
+            keeper = KeepRecentScreenshots()
+
+        assert keeper.count == 3
+        assert keeper.max_bytes == 30
+
+    def test_keeps_only_the_most_recent(self) -> None:
+        keeper = KeepRecentScreenshots.up_to(2)
+
+        for i in range(5):
+            keeper.keep(f"{i}.png", b"png")
+
+        assert [kept.path for kept in keeper.kept] == ["3.png", "4.png"]
+        assert keeper.size == 6
+
+    def test_keeps_within_the_memory_cap(self) -> None:
+        keeper = KeepRecentScreenshots.up_to(10).using_at_most(10)
+
+        keeper.keep("first.png", b"1234")
+        keeper.keep("second.png", b"1234", "log")
+        keeper.keep("third.png", b"123")
+
+        assert [kept.path for kept in keeper.kept] == ["second.png", "third.png"]
+        assert keeper.size == 10
+
+    def test_lowering_the_cap_makes_room(self) -> None:
+        keeper = KeepRecentScreenshots.up_to(10)
+        keeper.keep("first.png", b"1234")
+        keeper.keep("second.png", b"1234")
+
+        keeper.using_at_most(5)
+
+        assert [kept.path for kept in keeper.kept] == ["second.png"]
+
+    def test_save_all(self, tmp_path: Path) -> None:
+        keeper = KeepRecentScreenshots.up_to(10)
+        keeper.keep(str(tmp_path / "first.png"), b"spam")
+        keeper.keep(str(tmp_path / "second.png"), b"eggs", "an error")
+
+        written = keeper.save_all()
+
+        assert written == [
+            str(tmp_path / "first.png"),
+            str(tmp_path / "second.png"),
+            str(tmp_path / "second.log"),
+        ]
+        assert (tmp_path / "first.png").read_bytes() == b"spam"
+        assert (tmp_path / "second.log").read_text() == "an error"
+        assert not keeper.kept
+        assert keeper.size == 0
+
+    def test_saved_on_failure(self, tmp_path: Path) -> None:
+        keeper = KeepRecentScreenshots.up_to(10)
+        keeper.keep(str(tmp_path / "spam.png"), b"spam")
+
+        with pytest.raises(AssertionError), keeper.saved_on_failure():
+            raise AssertionError
+
+        assert (tmp_path / "spam.png").exists()
+
+    def test_not_saved_on_success(self, tmp_path: Path) -> None:
+        keeper = KeepRecentScreenshots.up_to(10)
+        keeper.keep(str(tmp_path / "spam.png"), b"spam")
+
+        with keeper.saved_on_failure():
+            pass
+
+        assert not (tmp_path / "spam.png").exists()
+        assert len(keeper.kept) == 1
+
+    def test_forget(self) -> None:
+        keeper = KeepRecentScreenshots.up_to(10)
+        keeper.keep("spam.png", b"spam")
+
+        keeper.forget()
+
+        assert not keeper.kept
+        assert keeper.size == 0
+
+    def test_repr(self) -> None:
+        assert repr(KeepRecentScreenshots()) == "Keep Recent Screenshots"
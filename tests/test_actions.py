@@ -10,8 +10,11 @@ import pytest
 from screenpy import DeliveryError, Describable, Performable, UnableToAct, settings
 from screenpy.configuration import ScreenPySettings
 from screenpy_pyotp.abilities import AuthenticateWith2FA
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import JavascriptException, WebDriverException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 
@@ -21,13 +24,16 @@ from screenpy_selenium import (
     Chainable,
     Clear,
     Click,
+    Deselect,
     DismissAlert,
     DoubleClick,
     Enter,
     Enter2FAToken,
+    FillForm,
     GoBack,
     GoForward,
     HoldDown,
+    KeepRecentScreenshots,
     MoveMouse,
     Open,
     Pause,
@@ -41,17 +47,23 @@ from screenpy_selenium import (
     SelectByIndex,
     SelectByText,
     SelectByValue,
+    SelectOptions,
     SwitchTo,
     SwitchToTab,
     Target,
     Wait,
+    WithinCommandBudget,
 )
+from screenpy_selenium.configuration import ScreenPySeleniumSettings
+from screenpy_selenium.scripts import FILL_FORM, RESOLVE_ALL, SELECT_OPTIONS, SET_VALUE
 
 from .unittest_protocols import ChainableAction
 from .useful_mocks import (
     get_mock_target_class,
+    get_mocked_browse_the_web,
     get_mocked_browser,
     get_mocked_chain,
+    get_mocked_element,
     get_mocked_target_and_element,
 )
 
@@ -127,6 +139,188 @@ class TestChain:
         with pytest.raises(UnableToAct):
             Chain(AcceptAlert()).perform_as(Tester)  # type: ignore[arg-type]
 
+    def test_compiled_chain_sends_one_command(self, Tester: Actor) -> None:
+        target = Target.the("spam").located_by("#spam")
+        element = get_mocked_element()
+        element.id = "the-real-element"
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [element]
+        chain = Chain(MoveMouse.to_the(target), Click(), Enter.the_text("hi"))
+
+        chain.perform_as(Tester)
+
+        browser.execute.assert_called_once()
+        command, payload = browser.execute.call_args.args
+        assert command == Command.W3C_ACTIONS
+        assert "the-real-element" in str(payload)
+        assert "screenpy-chain-target" not in str(payload)
+        assert [device["type"] for device in payload["actions"]] == ["pointer", "key"]
+
+    def test_compiles_once(self, Tester: Actor) -> None:
+        target = Target.the("spam").located_by("#spam")
+        element = get_mocked_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [element]
+        chain = Chain(MoveMouse.to_the(target), Click.on_the(target))
+
+        with mock.patch.object(
+            Chain, "_compile", autospec=True, side_effect=Chain._compile
+        ) as mocked_compile:
+            chain.perform_as(Tester)
+            element.id = "a-new-element"
+            chain.perform_as(Tester)
+
+        mocked_compile.assert_called_once()
+        assert chain.compiled is not None
+        assert chain.compiled.targets == [target]
+        assert browser.execute.call_count == 2
+        assert "a-new-element" in str(browser.execute.call_args.args[1])
+
+    def test_recompiles_when_duration_changes(self, Tester: Actor) -> None:
+        chain = Chain(Pause.for_(1).second_because("it has to"))
+        chain.perform_as(Tester)
+        first_compiled = chain.compiled
+
+        mock_settings = ScreenPySeleniumSettings(CHAIN_DURATION=500)
+        with mock.patch("screenpy_selenium.actions.chain.settings", mock_settings):
+            chain.perform_as(Tester)
+
+        assert chain.compiled is not first_compiled
+
+    @mock.patch("screenpy_selenium.actions.chain.ActionChains", autospec=True)
+    def test_finds_all_targets_at_once(
+        self, mocked_chain: mock.Mock, Tester: Actor
+    ) -> None:
+        spam = Target.the("spam").located_by("#spam")
+        eggs = Target.the("eggs").located_by("#eggs")
+        spam_element, eggs_element = get_mocked_element(), get_mocked_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [spam_element, eggs_element]
+
+        Chain(
+            Click.on_the(spam), Enter2FAToken.into_the(eggs), DoubleClick.on_the(spam)
+        ).perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            RESOLVE_ALL, [[("css", "#spam")], [("css", "#eggs")]]
+        )
+        browser.find_element.assert_not_called()
+        the_chain = mocked_chain(browser)
+        the_chain.click.assert_called_once_with(on_element=spam_element)
+        the_chain.double_click.assert_called_once_with(on_element=spam_element)
+        the_chain.send_keys_to_element.assert_called_once_with(eggs_element, mock.ANY)
+
+    def test_waits_for_targets_which_are_not_there_yet(self, Tester: Actor) -> None:
+        target = Target.the("spam").located_by("#spam")
+        element = get_mocked_element()
+        element.id = "the-late-element"
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [None]
+        browser.find_element.return_value = element
+
+        Chain(MoveMouse.to_the(target), Click()).perform_as(Tester)
+
+        browser.find_element.assert_called_once_with(*target)
+        browser.execute.assert_called_once()
+        assert "the-late-element" in str(browser.execute.call_args.args[1])
+
+    def test_enter_2fa_token_is_not_compiled(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+        chain = Chain(Click.on_the(target), Enter2FAToken.into_the(target))
+
+        with mock.patch("screenpy_selenium.actions.chain.ActionChains", autospec=True):
+            chain.perform_as(Tester)
+
+        assert not chain.compilable
+        assert chain.compiled is None
+
+    def test_is_not_optimized_by_default(self) -> None:
+        actions = (MoveMouse.by_offset(1, 2), MoveMouse.by_offset(3, 4))
+
+        assert Chain(*actions).plan == list(actions)
+
+    def test_optimized_merges_mouse_nudges(self) -> None:
+        target = Target.the("spam").located_by("#spam")
+        to_target = MoveMouse.to_the(target)
+        chain = Chain(
+            MoveMouse.by_offset(1, 2),
+            MoveMouse.by_offset(3, 4),
+            MoveMouse.by_offset(5, 6),
+            to_target,
+            MoveMouse.by_offset(-1, -1),
+        ).optimized()
+
+        plan = chain.plan
+
+        assert len(plan) == 3
+        assert isinstance(plan[0], MoveMouse)
+        assert plan[0].offset == (9, 12)
+        assert plan[1] is to_target
+        assert len(chain.actions) == 5
+
+    def test_optimized_drops_instant_pauses(self) -> None:
+        pause = Pause.for_(1).second_because("it has to")
+        chain = Chain(
+            MoveMouse.by_offset(1, 1),
+            Pause.for_(0).seconds_because("it can"),
+            MoveMouse.by_offset(1, 1),
+            pause,
+        ).optimized()
+
+        plan = chain.plan
+
+        assert len(plan) == 2
+        assert isinstance(plan[0], MoveMouse)
+        assert plan[0].offset == (2, 2)
+        assert plan[1] is pause
+
+    def test_optimized_keeps_modifier_keys_held(self) -> None:
+        first_hold, click, last_release = (
+            HoldDown(Keys.SHIFT),
+            Click(),
+            Release(Keys.SHIFT),
+        )
+        chain = Chain(
+            first_hold,
+            Release(Keys.SHIFT),
+            HoldDown(Keys.SHIFT),
+            click,
+            HoldDown(Keys.SHIFT),
+            last_release,
+        ).optimized()
+
+        assert chain.plan == [first_hold, click, last_release]
+
+    def test_optimized_keeps_keys_which_were_not_held(self) -> None:
+        actions = (
+            Release(Keys.SHIFT),
+            HoldDown(Keys.SHIFT),
+            Click(),
+            Release(Keys.SHIFT),
+        )
+
+        assert Chain(*actions).optimized().plan == list(actions)
+
+    def test_optimized_keeps_repeated_keypresses(self) -> None:
+        actions = (
+            HoldDown(Keys.ENTER),
+            Release(Keys.ENTER),
+            HoldDown(Keys.ENTER),
+            Release(Keys.ENTER),
+        )
+
+        assert Chain(*actions).optimized().plan == list(actions)
+
+    def test_performs_the_optimized_plan(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        chain = Chain(*(MoveMouse.by_offset(1, 0) for _ in range(10))).optimized()
+
+        chain.perform_as(Tester)
+
+        pointer_actions = browser.execute.call_args.args[1]["actions"][0]["actions"]
+        assert len(pointer_actions) == 1
+        assert pointer_actions[0]["x"] == 10
+
     def test_describe(self) -> None:
         assert Chain().describe() == "Perform a thrilling chain of actions."
 
@@ -392,6 +586,69 @@ class TestEnter:
         assert text in call1_args
         assert additional in call2_args
 
+    def test_perform_instantly(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = True
+        text = '{"a": "very large payload"}'
+
+        Enter.the_text(text).into_the(target).instantly().perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(SET_VALUE, element, text)
+        element.send_keys.assert_not_called()
+
+    def test_perform_instantly_still_hits_keys(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = True
+
+        Enter.the_text("text").into_the(target).instantly().then_hit(
+            Keys.ENTER
+        ).perform_as(Tester)
+
+        element.send_keys.assert_called_once_with(Keys.ENTER)
+
+    def test_perform_instantly_types_if_value_cannot_be_set(
+        self, Tester: Actor
+    ) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = False
+
+        Enter.the_text("text").into_the(target).instantly().perform_as(Tester)
+
+        browser.execute_script.assert_called_once()
+        element.send_keys.assert_called_once_with("text")
+
+    def test_perform_instantly_types_file_paths(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = False
+        path = "/home/perry/bat_signal.png"
+
+        Enter.the_text(path).into_the(target).instantly().perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(SET_VALUE, element, path)
+        element.send_keys.assert_called_once_with(path)
+
+    def test_perform_instantly_types_special_keys(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        text = f"one{Keys.TAB}two"
+
+        Enter.the_text(text).into_the(target).instantly().perform_as(Tester)
+
+        browser.execute_script.assert_not_called()
+        element.send_keys.assert_called_once_with(text)
+
+    def test_perform_instantly_exception(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.side_effect = JavascriptException()
+
+        with pytest.raises(DeliveryError):
+            Enter.the_text("text").into_the(target).instantly().perform_as(Tester)
+
     def test_chain_enter_with_target(self, Tester: Actor) -> None:
         chain = get_mocked_chain()
         target, element = get_mocked_target_and_element()
@@ -544,6 +801,126 @@ class TestEnter2FAToken:
         assert SubEnter2FA.into(TARGET).new_method() is True
 
 
+class TestFillForm:
+    def test_can_be_instantiated(self) -> None:
+        ff1 = FillForm.with_the({TARGET: "text"})
+        ff2 = FillForm.using({TARGET: True})
+        ff3 = FillForm({TARGET: "text"}).field_by_field()
+
+        assert isinstance(ff1, FillForm)
+        assert isinstance(ff2, FillForm)
+        assert isinstance(ff3, FillForm)
+
+    def test_implements_protocol(self) -> None:
+        ff = FillForm({})
+
+        assert isinstance(ff, Performable)
+        assert isinstance(ff, Describable)
+
+    def test_perform_fill_form(self, Tester: Actor) -> None:
+        name_field = Target.the("name field").located_by("#name")
+        terms_checkbox = Target.the("terms checkbox").located_by("#terms")
+        name_element, terms_element = get_mocked_element(), get_mocked_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.side_effect = [
+            [name_element, terms_element],
+            [None, None],
+        ]
+
+        FillForm.with_the({name_field: "Perry", terms_checkbox: True}).perform_as(
+            Tester
+        )
+
+        assert browser.execute_script.call_count == 2
+        browser.execute_script.assert_called_with(
+            FILL_FORM, [[name_element, "Perry"], [terms_element, True]]
+        )
+
+    def test_perform_raises_for_unfilled_fields(self, Tester: Actor) -> None:
+        name_field = Target.the("name field").located_by("#name")
+        country_dropdown = Target.the("country dropdown").located_by("#country")
+        browser = get_mocked_browser(Tester)
+        problem = 'it has no option named "Atlantis"'
+        browser.execute_script.side_effect = [
+            [get_mocked_element(), get_mocked_element()],
+            [None, problem],
+        ]
+
+        with pytest.raises(DeliveryError) as excinfo:
+            FillForm.with_the(
+                {name_field: "Perry", country_dropdown: "Atlantis"}
+            ).perform_as(Tester)
+
+        assert str(country_dropdown) in str(excinfo.value)
+        assert problem in str(excinfo.value)
+        assert str(name_field) not in str(excinfo.value)
+
+    def test_exception(self, Tester: Actor) -> None:
+        name_field = Target.the("name field").located_by("#name")
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.side_effect = [
+            [get_mocked_element()],
+            JavascriptException(),
+        ]
+
+        with pytest.raises(DeliveryError):
+            FillForm.with_the({name_field: "Perry"}).perform_as(Tester)
+
+    def test_field_by_field_enters_text(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        element.tag_name = "input"
+
+        FillForm.with_the({target: "Perry"}).field_by_field().perform_as(Tester)
+
+        element.clear.assert_called_once()
+        element.send_keys.assert_called_once_with("Perry")
+        get_mocked_browser(Tester).execute_script.assert_not_called()
+
+    @mock.patch("screenpy_selenium.actions.select.SeleniumSelect", autospec=True)
+    def test_field_by_field_selects_option(
+        self, mocked_selenium_select: mock.Mock, Tester: Actor
+    ) -> None:
+        target, element = get_mocked_target_and_element()
+        element.tag_name = "select"
+
+        FillForm.with_the({target: "Canada"}).field_by_field().perform_as(Tester)
+
+        mocked_selenium_select.return_value.select_by_visible_text.assert_called_once_with(
+            "Canada"
+        )
+
+    def test_field_by_field_checks_boxes(self, Tester: Actor) -> None:
+        unchecked_target, unchecked_element = get_mocked_target_and_element()
+        unchecked_element.is_selected.return_value = False
+        checked_target, checked_element = get_mocked_target_and_element()
+        checked_element.is_selected.return_value = True
+
+        FillForm.with_the(
+            {unchecked_target: True, checked_target: True}
+        ).field_by_field().perform_as(Tester)
+
+        unchecked_element.click.assert_called_once()
+        checked_element.click.assert_not_called()
+
+    def test_describe(self) -> None:
+        name_field = Target.the("name field").located_by("#name")
+        password_field = Target.the("password field").located_by("#password")
+
+        ff = FillForm.with_the({name_field: "Perry", password_field: "s3cr3t"})
+
+        assert ff.describe() == "Fill in the name field, the password field."
+        assert "s3cr3t" not in ff.describe()
+
+    def test_subclass(self) -> None:
+        """test code for mypy to scan without issue"""
+
+        class SubFillForm(FillForm):
+            def new_method(self) -> bool:
+                return True
+
+        assert SubFillForm.with_the({}).new_method() is True
+
+
 class TestGoBack:
     def test_can_be_instantiated(self) -> None:
         gb = GoBack()
@@ -563,6 +940,11 @@ class TestGoBack:
 
         browser.back.assert_called_once()
 
+    def test_perform_go_back_clears_element_cache(self, Tester: Actor) -> None:
+        GoBack().perform_as(Tester)
+
+        get_mocked_browse_the_web(Tester).clear_element_cache.assert_called_once()
+
     def test_describe(self) -> None:
         assert GoBack().describe() == "Go back."
 
@@ -586,6 +968,11 @@ class TestGoForward:
 
         browser.forward.assert_called_once()
 
+    def test_perform_go_forward_clears_element_cache(self, Tester: Actor) -> None:
+        GoForward().perform_as(Tester)
+
+        get_mocked_browse_the_web(Tester).clear_element_cache.assert_called_once()
+
     def test_describe(self) -> None:
         assert GoForward().describe() == "Go forward."
 
@@ -809,6 +1196,11 @@ class TestOpen:
 
         browser.get.assert_called_once_with(url)
 
+    def test_perform_open_clears_element_cache(self, Tester: Actor) -> None:
+        Open.their_browser_on("https://localtest.test").perform_as(Tester)
+
+        get_mocked_browse_the_web(Tester).clear_element_cache.assert_called_once()
+
     def test_describe(self) -> None:
         assert Open("place.com").describe() == "Visit place.com."
 
@@ -877,6 +1269,11 @@ class TestRefreshPage:
 
         browser.refresh.assert_called_once()
 
+    def test_perform_refresh_clears_element_cache(self, Tester: Actor) -> None:
+        RefreshPage().perform_as(Tester)
+
+        get_mocked_browse_the_web(Tester).clear_element_cache.assert_called_once()
+
     def test_describe(self) -> None:
         assert RefreshPage().describe() == "Refresh the page."
 
@@ -1189,6 +1586,103 @@ class TestSaveScreenshot:
 
         mocked_atf.assert_called_once_with(test_path, **test_kwargs)
 
+    @mock.patch(
+        "screenpy_selenium.actions.save_screenshot.background_writer", autospec=True
+    )
+    def test_in_the_background(self, mocked_writer: mock.Mock, Tester: Actor) -> None:
+        test_path = "gotham/roofs/bat_signal.png"
+        browser = get_mocked_browser(Tester)
+
+        with mock.patch("builtins.open", new_callable=mock.mock_open) as mocked_open:
+            SaveScreenshot(test_path).in_the_background().perform_as(Tester)
+
+        mocked_open.assert_not_called()
+        mocked_writer.write.assert_called_once_with(
+            test_path, browser.get_screenshot_as_png.return_value
+        )
+        mocked_writer.write.return_value.result.assert_not_called()
+
+    @mock.patch(
+        "screenpy_selenium.actions.save_screenshot.AttachTheFile", autospec=True
+    )
+    @mock.patch(
+        "screenpy_selenium.actions.save_screenshot.background_writer", autospec=True
+    )
+    def test_in_the_background_attaches_once_written(
+        self, mocked_writer: mock.Mock, mocked_atf: mock.Mock, Tester: Actor
+    ) -> None:
+        test_path = "gotham/roofs/bat_signal.png"
+        written = mocked_writer.write.return_value
+        written.result.side_effect = mocked_atf.assert_not_called
+
+        SaveScreenshot(test_path).in_the_background().and_attach_it().perform_as(Tester)
+
+        written.result.assert_called_once_with()
+        mocked_atf.assert_called_once_with(test_path)
+
+    def test_kept_in_memory(self, Tester: Actor) -> None:
+        test_path = "gotham/roofs/bat_signal.png"
+        browser = get_mocked_browser(Tester)
+        keeper = KeepRecentScreenshots.up_to(5)
+        Tester.who_can(keeper)
+
+        with mock.patch("builtins.open", new_callable=mock.mock_open) as mocked_open:
+            SaveScreenshot(test_path).perform_as(Tester)
+
+        mocked_open.assert_not_called()
+        assert keeper.kept[0].path == test_path
+        assert keeper.kept[0].screenshot == browser.get_screenshot_as_png.return_value
+        assert keeper.kept[0].console_log is None
+
+    def test_kept_in_memory_with_console_log(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.get_log = mock.Mock(return_value=["spam", "eggs"])
+        keeper = KeepRecentScreenshots.up_to(5).and_console_logs()
+        Tester.who_can(keeper)
+
+        SaveScreenshot("bat_signal.png").perform_as(Tester)
+
+        browser.get_log.assert_called_once_with("browser")
+        assert keeper.kept[0].console_log == "spam\neggs"
+
+    def test_kept_without_console_log_if_browser_has_none(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        del browser.get_log
+        keeper = KeepRecentScreenshots.up_to(5).and_console_logs()
+        Tester.who_can(keeper)
+
+        SaveScreenshot("bat_signal.png").perform_as(Tester)
+
+        assert keeper.kept[0].screenshot == browser.get_screenshot_as_png.return_value
+        assert keeper.kept[0].console_log is None
+
+    @mock.patch(
+        "screenpy_selenium.actions.save_screenshot.AttachTheFile", autospec=True
+    )
+    def test_attached_screenshots_are_not_kept(
+        self, mocked_atf: mock.Mock, Tester: Actor
+    ) -> None:
+        keeper = KeepRecentScreenshots.up_to(5)
+        Tester.who_can(keeper)
+
+        with mock.patch("builtins.open", new_callable=mock.mock_open) as mocked_open:
+            SaveScreenshot("bat_signal.png").and_attach_it().perform_as(Tester)
+
+        mocked_open.assert_called_once_with("bat_signal.png", "wb+")
+        mocked_atf.assert_called_once_with("bat_signal.png")
+        assert not keeper.kept
+
+    def test_in_the_background_setting(self) -> None:
+        mock_settings = ScreenPySeleniumSettings(SAVE_SCREENSHOTS_IN_BACKGROUND=True)
+
+        with mock.patch(
+            "screenpy_selenium.actions.save_screenshot.settings", mock_settings
+        ):
+            ss = SaveScreenshot("pth")
+
+        assert ss.in_background
+        assert not SaveScreenshot("pth").in_background
+
     def test_describe(self) -> None:
         assert SaveScreenshot("pth").describe() == "Save screenshot as pth"
 
@@ -1224,6 +1718,24 @@ class TestSelect:
         assert isinstance(by_value2, SelectByValue)
         assert isinstance(by_value3, SelectByValue)
 
+    def test_many_options_can_be_instantiated(self) -> None:
+        by_text = Select.the_options_named("A", "B").from_the(TARGET)
+        by_index = Select.the_options_at_indexes(0, "1").from_the(TARGET)
+        by_value = Select.the_options_with_values("a", 2).from_(TARGET)
+        deselect_by_text = Deselect.the_options_named("A").from_the(TARGET)
+        deselect_by_index = Deselect.the_options_at_indexes(0).from_the(TARGET)
+        deselect_by_value = Deselect.the_options_with_values("a").from_the(TARGET)
+
+        assert isinstance(by_text, SelectOptions)
+        assert isinstance(by_index, SelectOptions)
+        assert by_index.options == [0, 1]
+        assert isinstance(by_value, SelectOptions)
+        assert by_value.options == ["a", "2"]
+        assert isinstance(deselect_by_text, SelectOptions)
+        assert not deselect_by_text.selecting
+        assert isinstance(deselect_by_index, SelectOptions)
+        assert isinstance(deselect_by_value, SelectOptions)
+
 
 class TestSelectByIndex:
     def test_can_be_instantiated(self) -> None:
@@ -1264,6 +1776,38 @@ class TestSelectByIndex:
 
         assert str(target) in str(excinfo.value)
 
+    def test_perform_in_the_browser(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = None
+
+        SelectByIndex(3).from_the(target).in_the_browser().perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            SELECT_OPTIONS, element, "index", [3], True
+        )
+
+    def test_in_the_browser_without_a_match(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = "it has no option with index 3"
+
+        with pytest.raises(DeliveryError) as excinfo:
+            SelectByIndex(3).from_the(target).in_the_browser().perform_as(Tester)
+
+        assert str(target) in str(excinfo.value)
+        assert "no option" in str(excinfo.value)
+
+    def test_in_the_browser_exception(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.side_effect = WebDriverException()
+
+        with pytest.raises(DeliveryError) as excinfo:
+            SelectByIndex(3).from_the(target).in_the_browser().perform_as(Tester)
+
+        assert str(target) in str(excinfo.value)
+
     def test_describe(self) -> None:
         assert (
             SelectByIndex(1, None).describe()
@@ -1321,6 +1865,38 @@ class TestSelectByText:
 
         assert str(target) in str(excinfo.value)
 
+    def test_perform_in_the_browser(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = None
+
+        SelectByText("Canada").from_the(target).in_the_browser().perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            SELECT_OPTIONS, element, "text", ["Canada"], True
+        )
+
+    def test_in_the_browser_without_a_match(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = 'it has no option with text "Canada"'
+
+        with pytest.raises(DeliveryError) as excinfo:
+            SelectByText("Canada").from_the(target).in_the_browser().perform_as(Tester)
+
+        assert str(target) in str(excinfo.value)
+        assert "no option" in str(excinfo.value)
+
+    def test_in_the_browser_exception(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.side_effect = WebDriverException()
+
+        with pytest.raises(DeliveryError) as excinfo:
+            SelectByText("Canada").from_the(target).in_the_browser().perform_as(Tester)
+
+        assert str(target) in str(excinfo.value)
+
     def test_describe(self) -> None:
         assert (
             SelectByText("bar", None).describe()
@@ -1375,6 +1951,38 @@ class TestSelectByValue:
 
         assert str(target) in str(excinfo.value)
 
+    def test_perform_in_the_browser(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = None
+
+        SelectByValue("ca").from_the(target).in_the_browser().perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            SELECT_OPTIONS, element, "value", ["ca"], True
+        )
+
+    def test_in_the_browser_without_a_match(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = 'it has no option with value "ca"'
+
+        with pytest.raises(DeliveryError) as excinfo:
+            SelectByValue("ca").from_the(target).in_the_browser().perform_as(Tester)
+
+        assert str(target) in str(excinfo.value)
+        assert "no option" in str(excinfo.value)
+
+    def test_in_the_browser_exception(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.side_effect = WebDriverException()
+
+        with pytest.raises(DeliveryError) as excinfo:
+            SelectByValue("ca").from_the(target).in_the_browser().perform_as(Tester)
+
+        assert str(target) in str(excinfo.value)
+
     def test_describe(self) -> None:
         assert (
             SelectByValue("baz", None).describe()
@@ -1391,6 +1999,95 @@ class TestSelectByValue:
         assert SubSelectByValue("").from_the(TARGET).new_method() is True
 
 
+class TestSelectOptions:
+    def test_can_be_instantiated(self) -> None:
+        so = SelectOptions("text", ["A", "B"])
+
+        assert isinstance(so, SelectOptions)
+
+    def test_implements_protocol(self) -> None:
+        so = SelectOptions("text", ["A", "B"])
+
+        assert isinstance(so, Performable)
+        assert isinstance(so, Describable)
+
+    def test_perform_select_options(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = None
+
+        Select.the_options_named("Retail", "Banking").from_the(target).perform_as(
+            Tester
+        )
+
+        target.found_by.assert_called_once_with(Tester)
+        browser.execute_script.assert_called_once_with(
+            SELECT_OPTIONS, element, "text", ["Retail", "Banking"], True
+        )
+
+    def test_perform_deselect_options(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = None
+
+        Deselect.the_options_at_indexes(1, 3).from_the(target).perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            SELECT_OPTIONS, element, "index", [1, 3], False
+        )
+
+    def test_perform_complains_for_no_target(self, Tester: Actor) -> None:
+        with pytest.raises(UnableToAct):
+            Select.the_options_named("A").perform_as(Tester)
+
+    def test_missing_option(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = 'it has no option with value "z"'
+
+        with pytest.raises(DeliveryError) as excinfo:
+            Select.the_options_with_values("a", "z").from_the(target).perform_as(Tester)
+
+        assert str(target) in str(excinfo.value)
+        assert '"z"' in str(excinfo.value)
+
+    def test_describe(self) -> None:
+        assert (
+            Select.the_options_named("A", "B").from_the(TARGET).describe()
+            == f'Select the options "A", "B" from the {TARGET}.'
+        )
+        assert (
+            Deselect.the_options_with_values("a").from_the(TARGET).describe()
+            == f'Deselect the options with values "a" from the {TARGET}.'
+        )
+        assert (
+            Select.the_options_at_indexes(0, 2).from_the(TARGET).describe()
+            == f"Select the options at indexes 0, 2 from the {TARGET}."
+        )
+
+    def test_beat_logging(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        target, _ = get_mocked_target_and_element()
+        get_mocked_browser(Tester).execute_script.return_value = None
+        caplog.set_level(logging.INFO)
+
+        Deselect.the_options_named("A").from_the(target).perform_as(Tester)
+
+        assert [r.msg for r in caplog.records] == [
+            f'Tester deselects the options "A" from the {target}.'
+        ]
+
+    def test_subclass(self) -> None:
+        """test code for mypy to scan without issue"""
+
+        class SubSelectOptions(SelectOptions):
+            def new_method(self) -> bool:
+                return True
+
+        assert SubSelectOptions("text", []).from_the(TARGET).new_method() is True
+
+
 class TestSwitchTo:
     def test_can_be_instantiated(self) -> None:
         st1 = SwitchTo.the(TARGET)
@@ -1420,6 +2117,15 @@ class TestSwitchTo:
 
         browser.switch_to.default_content.assert_called_once()
 
+    def test_perform_switch_to_records_frame(self, Tester: Actor) -> None:
+        target, _ = get_mocked_target_and_element()
+
+        SwitchTo.the(target).perform_as(Tester)
+
+        get_mocked_browse_the_web(Tester).switched_to.assert_called_once_with(
+            frame=target
+        )
+
     def test_describe(self) -> None:
         assert SwitchTo.default().describe() == "Switch to the default frame."
 
@@ -1454,12 +2160,23 @@ class TestSwitchToTab:
 
         browser.switch_to.window.assert_called_once_with(number - 1)
 
+    def test_perform_switch_to_tab_records_window(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.window_handles = ["first", "second"]
+
+        SwitchToTab(2).perform_as(Tester)
+
+        get_mocked_browse_the_web(Tester).switched_to.assert_called_once_with(
+            window_handle="second"
+        )
+
     def test_describe(self) -> None:
         assert SwitchToTab(2).describe() == "Switch to tab #2."
 
 
 class TestWait:
     settings_path = "screenpy_selenium.actions.wait.settings"
+    selenium_settings_path = "screenpy_selenium.actions.wait.selenium_settings"
 
     def test_can_be_instantiated(self) -> None:
         def foo() -> None:
@@ -1583,6 +2300,121 @@ class TestWait:
 
         assert str(test_target) in str(excinfo.value)
 
+    @mock.patch("screenpy_selenium.actions.wait.wait_in_browser", autospec=True)
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_in_the_browser(
+        self,
+        mocked_webdriverwait: mock.Mock,
+        mocked_wait_in_browser: mock.Mock,
+        Tester: Actor,
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+        test_target = Target.the("foo").located_by("//bar")
+        mocked_wait_in_browser.return_value = True
+
+        Wait(4).seconds_for(test_target).to_contain_text(
+            "baz"
+        ).in_the_browser().perform_as(Tester)
+
+        mocked_wait_in_browser.assert_called_once_with(
+            browser, 4, [("xpath", "//bar")], "contain_text", "baz"
+        )
+        mocked_webdriverwait.assert_not_called()
+
+    @mock.patch("screenpy_selenium.actions.wait.wait_in_browser", autospec=True)
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_in_the_browser_with_tuple_locator(
+        self,
+        mocked_webdriverwait: mock.Mock,
+        mocked_wait_in_browser: mock.Mock,
+        Tester: Actor,
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+        mocked_wait_in_browser.return_value = True
+
+        Wait(4).using(EC.invisibility_of_element_located).with_(
+            (By.ID, "bar")
+        ).in_the_browser().perform_as(Tester)
+
+        mocked_wait_in_browser.assert_called_once_with(
+            browser, 4, [("css", '[id="bar"]')], "disappear", ""
+        )
+        mocked_webdriverwait.assert_not_called()
+
+    @mock.patch("screenpy_selenium.actions.wait.wait_in_browser", autospec=True)
+    def test_in_the_browser_timeout(
+        self, mocked_wait_in_browser: mock.Mock, Tester: Actor
+    ) -> None:
+        test_target = Target.the("foo").located_by("//bar")
+        mocked_wait_in_browser.return_value = False
+
+        with pytest.raises(DeliveryError) as excinfo:
+            Wait.for_the(test_target).in_the_browser().perform_as(Tester)
+
+        assert "visibility_of_element_located" in str(excinfo.value)
+        assert "TimeoutException" in str(excinfo.value)
+
+    @mock.patch("screenpy_selenium.actions.wait.wait_in_browser", autospec=True)
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_in_the_browser_falls_back_after_navigation(
+        self,
+        mocked_webdriverwait: mock.Mock,
+        mocked_wait_in_browser: mock.Mock,
+        Tester: Actor,
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+        test_target = Target.the("foo").located_by("//bar")
+        mocked_wait_in_browser.side_effect = JavascriptException("document unloaded")
+
+        Wait(4).seconds_for(test_target).in_the_browser().perform_as(Tester)
+
+        mocked_webdriverwait.assert_called_once()
+        assert mocked_webdriverwait.call_args[0][0] is browser
+        assert 0 <= mocked_webdriverwait.call_args[0][1] <= 4
+
+    @mock.patch("screenpy_selenium.actions.wait.wait_in_browser", autospec=True)
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_in_the_browser_unsupported_polls(
+        self,
+        mocked_webdriverwait: mock.Mock,
+        mocked_wait_in_browser: mock.Mock,
+        Tester: Actor,
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+        link_target = Target.the("foo").located_by((By.LINK_TEXT, "bar"))
+        test_func = mock.Mock()
+        test_func.__name__ = "foo"
+
+        Wait.for_the(link_target).in_the_browser().perform_as(Tester)
+        Wait().using(test_func).with_(TARGET).in_the_browser().perform_as(Tester)
+
+        mocked_wait_in_browser.assert_not_called()
+        assert mocked_webdriverwait.call_count == 2
+        mocked_webdriverwait.assert_called_with(
+            browser, settings.TIMEOUT, settings.POLLING
+        )
+
+    @mock.patch("screenpy_selenium.actions.wait.poll_until", autospec=True)
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_polling_policy(
+        self,
+        mocked_webdriverwait: mock.Mock,
+        mocked_poll_until: mock.Mock,
+        Tester: Actor,
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+        test_func = mock.Mock()
+        test_func.__name__ = "foo"
+        mock_settings = ScreenPySeleniumSettings(POLLING_POLICY="backoff")
+
+        with mock.patch(self.selenium_settings_path, mock_settings):
+            Wait(4).using(test_func).perform_as(Tester)
+
+        mocked_poll_until.assert_called_once_with(
+            browser, test_func(), 4, settings.POLLING
+        )
+        mocked_webdriverwait.assert_not_called()
+
     def test_helpful_methods(self) -> None:
         assert Wait(1).to_appear().condition == EC.visibility_of_element_located
         assert Wait(1).to_be_clickable().condition == EC.element_to_be_clickable
@@ -1607,3 +2439,70 @@ class TestWait:
                 return True
 
         assert SubWait.for_the(TARGET).new_method() is True
+
+
+class SendCommands:
+    def __init__(self, count: int) -> None:
+        self.count = count
+
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = get_mocked_browser(the_actor)
+        for _ in range(self.count):
+            browser.command_executor.execute("getTitle", {})
+
+
+class TestWithinCommandBudget:
+    def test_can_be_instantiated(self) -> None:
+        w = WithinCommandBudget(3, SendCommands(1))
+
+        assert isinstance(w, WithinCommandBudget)
+
+    def test_implements_protocol(self) -> None:
+        w = WithinCommandBudget(3)
+
+        assert isinstance(w, Performable)
+        assert isinstance(w, Describable)
+
+    def test_within_budget(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        executor = mock.create_autospec(RemoteConnection, instance=True)
+        browser.command_executor = executor
+
+        WithinCommandBudget(3, SendCommands(1), SendCommands(2)).perform_as(Tester)
+
+        assert executor.execute.call_count == 3
+
+    def test_over_budget(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.command_executor = mock.create_autospec(RemoteConnection, instance=True)
+
+        with pytest.raises(AssertionError, match="sent 4 commands"):
+            WithinCommandBudget(3, SendCommands(4)).perform_as(Tester)
+
+    def test_only_counts_commands_inside(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.command_executor = mock.create_autospec(RemoteConnection, instance=True)
+        SendCommands(1).perform_as(Tester)
+        WithinCommandBudget(1, SendCommands(1)).perform_as(Tester)
+
+        SendCommands(5).perform_as(Tester)
+
+        WithinCommandBudget(1, SendCommands(1)).perform_as(Tester)
+
+    def test_without_command_executor(self, Tester: Actor) -> None:
+        with pytest.raises(UnableToAct):
+            WithinCommandBudget(1, SendCommands(1)).perform_as(Tester)
+
+    def test_describe(self) -> None:
+        w = WithinCommandBudget(20, SendCommands(1), SendCommands(2))
+
+        assert w.describe() == "Perform 2 Actions within 20 commands."
+
+    def test_subclass(self) -> None:
+        """test code for mypy to scan without issue"""
+
+        class SubWithinCommandBudget(WithinCommandBudget):
+            def new_method(self) -> bool:
+                return True
+
+        assert SubWithinCommandBudget(1).new_method() is True
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from screenpy_selenium.element_proxy import (
+    ElementProxy,
+    RefindingElement,
+    prefetch,
+    prefetch_script,
+)
+
+from .useful_mocks import get_mocked_element, get_mocked_webdriver
+
+
+def get_proxy(**prefetched: object) -> ElementProxy:
+    return ElementProxy(get_mocked_webdriver(), "element-id", prefetched)
+
+
+class TestElementProxy:
+    def test_is_a_webelement(self) -> None:
+        assert isinstance(get_proxy(), WebElement)
+
+    def test_of(self) -> None:
+        element = get_mocked_element()
+
+        proxy = ElementProxy.of(element, {"text": "spam"})
+
+        assert proxy.parent is element.parent
+        assert proxy.id is element.id
+        assert proxy.prefetched == {"text": "spam"}
+
+    def test_uses_prefetched_values(self) -> None:
+        rect = {"x": 1, "y": 2, "width": 3, "height": 4}
+        proxy = get_proxy(
+            text="spam", is_displayed=False, rect=rect, **{"attribute:href": "/eggs"}
+        )
+
+        assert proxy.text == "spam"
+        assert proxy.is_displayed() is False
+        assert proxy.rect == rect
+        assert proxy.get_attribute("href") == "/eggs"
+        proxy.parent.execute.assert_not_called()
+        proxy.parent.execute_script.assert_not_called()
+
+    def test_fetches_other_values_lazily(self) -> None:
+        proxy = get_proxy(text="spam")
+
+        proxy.get_attribute("href")
+        proxy.is_displayed()
+
+        assert proxy.parent.execute_script.call_count == 2
+
+
+class TestRefindingElement:
+    def test_of(self) -> None:
+        element = get_mocked_element()
+        refind = mock.Mock()
+
+        refinding = RefindingElement.of(element, refind)
+
+        assert isinstance(refinding, WebElement)
+        assert refinding.parent is element.parent
+        assert refinding.id is element.id
+        assert refinding.refind is refind
+
+    def test_finds_itself_again_when_stale(self) -> None:
+        browser = get_mocked_webdriver()
+        browser.execute.side_effect = [StaleElementReferenceException, {"value": None}]
+        refind = mock.Mock(return_value=WebElement(browser, "new-id"))
+        refinding = RefindingElement(browser, "old-id", refind)
+
+        refinding.click()
+
+        refind.assert_called_once_with()
+        assert refinding.id == "new-id"
+        assert browser.execute.call_args[0][1]["id"] == "new-id"
+
+    def test_only_tries_again_once(self) -> None:
+        browser = get_mocked_webdriver()
+        browser.execute.side_effect = StaleElementReferenceException
+        refind = mock.Mock(return_value=WebElement(browser, "new-id"))
+        refinding = RefindingElement(browser, "old-id", refind)
+
+        with pytest.raises(StaleElementReferenceException):
+            refinding.click()
+
+        assert browser.execute.call_count == 2
+
+
+class TestPrefetch:
+    def test_fetches_in_one_round_trip(self) -> None:
+        browser = get_mocked_webdriver()
+        elements: list[WebElement] = [get_mocked_element(), get_mocked_element()]
+        browser.execute_script.return_value = [{"text": "spam"}, {"text": "eggs"}]
+
+        proxies = prefetch(browser, elements, ["text"])
+
+        browser.execute_script.assert_called_once_with(
+            prefetch_script(["text"]), elements, ["text"]
+        )
+        assert [proxy.text for proxy in proxies] == ["spam", "eggs"]
+
+    def test_no_properties_gives_lazy_proxies(self) -> None:
+        browser = get_mocked_webdriver()
+        elements: list[WebElement] = [get_mocked_element()]
+
+        proxies = prefetch(browser, elements, [])
+
+        browser.execute_script.assert_not_called()
+        assert proxies[0].prefetched == {}
+
+    def test_no_elements_skips_round_trip(self) -> None:
+        browser = get_mocked_webdriver()
+
+        assert prefetch(browser, [], ["text"]) == []
+        browser.execute_script.assert_not_called()
+
+    def test_complains_about_unknown_properties(self) -> None:
+        with pytest.raises(ValueError, match="cannot be prefetched"):
+            prefetch(get_mocked_webdriver(), [], ["spam"])
+
+    @mock.patch("screenpy_selenium.element_proxy.selenium_atom", autospec=True)
+    def test_only_includes_needed_atoms(self, mocked_atom: mock.Mock) -> None:
+        prefetch_script(["rect"])
+        mocked_atom.assert_not_called()
+
+        prefetch_script(["text"])
+        mocked_atom.assert_called_once_with("isDisplayed.js")
+
+        mocked_atom.reset_mock()
+        prefetch_script(["attribute:href"])
+        mocked_atom.assert_called_once_with("getAttribute.js")
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Generator
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from screenpy_selenium import BrowseTheWeb
+from screenpy_selenium.configuration import ScreenPySeleniumSettings
+from screenpy_selenium.instrumentation import (
+    NO_PERFORMER,
+    CommandRecorder,
+    InstrumentedExecutor,
+    _save_report_at_exit,
+    current_performer,
+    instrument,
+)
+
+from .useful_mocks import get_mocked_webdriver
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SETTINGS_PATH = "screenpy_selenium.instrumentation.settings"
+INSTRUMENTED = ScreenPySeleniumSettings(INSTRUMENT_COMMANDS=True)
+
+
+@pytest.fixture
+def recorder() -> Generator[CommandRecorder, None, None]:
+    new_recorder = CommandRecorder()
+    with mock.patch("screenpy_selenium.instrumentation.command_recorder", new_recorder):
+        yield new_recorder
+
+
+def get_executor() -> mock.Mock:
+    executor = mock.create_autospec(RemoteConnection, instance=True)
+    executor.execute.return_value = {"value": "spam"}
+    return executor
+
+
+class SendsCommands:
+    def perform_as(self, executor: InstrumentedExecutor) -> None:
+        executor.execute("findElement", {"using": "css selector", "value": "#a"})
+
+
+class TestCurrentPerformer:
+    def test_finds_innermost_performer(self) -> None:
+        class Inner:
+            def answered_by(self) -> str:
+                return current_performer()
+
+        class Outer:
+            def perform_as(self) -> str:
+                return Inner().answered_by()
+
+        assert Outer().perform_as() == "Inner"
+
+    def test_outside_any_performer(self) -> None:
+        assert current_performer() == NO_PERFORMER
+
+
+class TestInstrumentedExecutor:
+    def test_counts_commands_when_turned_off(self, recorder: CommandRecorder) -> None:
+        executor = get_executor()
+        instrumented = InstrumentedExecutor(executor)
+
+        with mock.patch(SETTINGS_PATH, ScreenPySeleniumSettings()):
+            response = instrumented.execute("getTitle", {})
+
+        assert response == {"value": "spam"}
+        assert instrumented.commands_sent == 1
+        assert recorder.totals == {}
+
+    def test_records_commands(self, recorder: CommandRecorder) -> None:
+        instrumented = InstrumentedExecutor(get_executor())
+
+        with mock.patch(SETTINGS_PATH, INSTRUMENTED):
+            SendsCommands().perform_as(instrumented)
+            SendsCommands().perform_as(instrumented)
+
+        [row] = recorder.stats()
+        assert row["performer"] == "SendsCommands"
+        assert row["command"] == "findElement"
+        assert row["count"] == 2
+        assert row["bytes_out"] == 2 * len('{"using": "css selector", "value": "#a"}')
+        assert row["bytes_in"] == 2 * len('{"value": "spam"}')
+
+    def test_records_failed_commands(self, recorder: CommandRecorder) -> None:
+        executor = get_executor()
+        executor.execute.side_effect = WebDriverException
+        instrumented = InstrumentedExecutor(executor)
+
+        with mock.patch(SETTINGS_PATH, INSTRUMENTED), pytest.raises(WebDriverException):
+            instrumented.execute("getTitle", {})
+
+        assert recorder.stats()[0]["count"] == 1
+
+    def test_passes_along_attributes(self) -> None:
+        executor = get_executor()
+
+        assert InstrumentedExecutor(executor).close is executor.close
+
+
+class TestInstrument:
+    def test_wraps_once(self) -> None:
+        browser = get_mocked_webdriver()
+        executor = browser.command_executor = get_executor()
+
+        instrumented = instrument(browser)
+
+        assert isinstance(instrumented, InstrumentedExecutor)
+        assert instrumented.executor is executor
+        assert instrument(browser) is instrumented
+
+    def test_browse_the_web_instruments_when_turned_on(self) -> None:
+        browser = get_mocked_webdriver()
+        browser.command_executor = get_executor()
+
+        with mock.patch(
+            "screenpy_selenium.abilities.browse_the_web.settings", INSTRUMENTED
+        ):
+            BrowseTheWeb.using(browser)
+
+        assert isinstance(browser.command_executor, InstrumentedExecutor)
+
+
+class TestCommandRecorder:
+    def test_prometheus(self) -> None:
+        recorder = CommandRecorder()
+        recorder.record(("Click", "clickElement"), 0.25, 10, 20)
+        recorder.record(("Click", "clickElement"), 0.25, 10, 20)
+        recorder.record(('Say "hi"', "getTitle"), 0.5, 1, 2)
+
+        metrics = recorder.prometheus()
+
+        assert "# TYPE screenpy_selenium_commands_total counter" in metrics
+        assert (
+            'screenpy_selenium_commands_total{performer="Click",'
+            'command="clickElement"} 2'
+        ) in metrics
+        assert (
+            'screenpy_selenium_command_seconds_total{performer="Click",'
+            'command="clickElement"} 0.5'
+        ) in metrics
+        assert 'performer="Say \\"hi\\""' in metrics
+
+    def test_save(self, tmp_path: Path) -> None:
+        recorder = CommandRecorder()
+        recorder.record(("Click", "clickElement"), 0.25, 10, 20)
+
+        recorder.save(str(tmp_path / "commands.json"))
+
+        saved = json.loads((tmp_path / "commands.json").read_text())
+        assert saved == recorder.stats()
+        assert (tmp_path / "commands.prom").read_text() == recorder.prometheus()
+
+    def test_reset(self) -> None:
+        recorder = CommandRecorder()
+        recorder.record(("Click", "clickElement"), 0.25, 10, 20)
+
+        recorder.reset()
+
+        assert recorder.stats() == []
+
+    def test_saves_report_at_exit(
+        self, recorder: CommandRecorder, tmp_path: Path
+    ) -> None:
+        recorder.record(("Click", "clickElement"), 0.25, 10, 20)
+        report_path = str(tmp_path / "commands-{pid}.json")
+        mock_settings = ScreenPySeleniumSettings(INSTRUMENT_COMMANDS_REPORT=report_path)
+
+        with mock.patch(SETTINGS_PATH, mock_settings):
+            _save_report_at_exit()
+
+        assert len(list(tmp_path.glob("commands-*.json"))) == 1
+        assert len(list(tmp_path.glob("commands-*.prom"))) == 1
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
 import screenpy_selenium
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
 
 def test_screenpy_selenium() -> None:
     expected = (
         "AcceptAlert",
         "AcceptsAlert",
         "Attribute",
+        "background_writer",
+        "BrowserPool",
         "BrowserTitle",
         "BrowserURL",
         "BrowseTheWeb",
@@ -20,9 +31,12 @@ def test_screenpy_selenium() -> None:
         "Click",
         "Clickable",
         "Clicks",
+        "command_recorder",
         "ContextClick",
         "ContextClicks",
         "Cookies",
+        "Deselect",
+        "Deselects",
         "DismissAlert",
         "DismissesAlert",
         "Displayed",
@@ -36,6 +50,8 @@ def test_screenpy_selenium() -> None:
         "Enters2FAToken",
         "Exist",
         "Exists",
+        "FillForm",
+        "FillsForm",
         "GoBack",
         "GoesBack",
         "GoesForward",
@@ -52,6 +68,7 @@ def test_screenpy_selenium() -> None:
         "IsNotDisplayed",
         "IsPresent",
         "IsVisible",
+        "KeepRecentScreenshots",
         "List",
         "MoveMouse",
         "MovesMouse",
@@ -89,10 +106,14 @@ def test_screenpy_selenium() -> None:
         "SelectByText",
         "SelectByValue",
         "Selected",
+        "SelectOptions",
         "Selects",
         "SelectsByIndex",
         "SelectsByText",
         "SelectsByValue",
+        "SelectsOptions",
+        "settings",
+        "StaysWithinCommandBudget",
         "SwitchesTo",
         "SwitchesToTab",
         "SwitchesToWindow",
@@ -102,6 +123,7 @@ def test_screenpy_selenium() -> None:
         "TakeScreenshot",
         "TakesScreenshot",
         "Target",
+        "target_profiler",
         "TargetingError",
         "Text",
         "TextOfTheAlert",
@@ -120,7 +142,7 @@ def test_screenpy_selenium() -> None:
         "Visits",
         "Wait",
         "Waits",
-        "settings",
+        "WithinCommandBudget",
     )
 
     assert sorted(screenpy_selenium.__all__) == sorted(expected)
@@ -128,7 +150,7 @@ def test_screenpy_selenium() -> None:
 
 
 def test_abilities() -> None:
-    expected = ("BrowseTheWeb",)
+    expected = ("BrowseTheWeb", "KeepRecentScreenshots")
     assert sorted(screenpy_selenium.abilities.__all__) == sorted(expected)
 
 
@@ -144,6 +166,8 @@ def test_actions() -> None:
         "Clicks",
         "ContextClick",
         "ContextClicks",
+        "Deselect",
+        "Deselects",
         "DismissAlert",
         "DismissesAlert",
         "DoubleClick",
@@ -152,6 +176,8 @@ def test_actions() -> None:
         "Enter2FAToken",
         "Enters",
         "Enters2FAToken",
+        "FillForm",
+        "FillsForm",
         "GoBack",
         "GoesBack",
         "GoesForward",
@@ -192,10 +218,13 @@ def test_actions() -> None:
         "SelectByIndex",
         "SelectByText",
         "SelectByValue",
+        "SelectOptions",
         "Selects",
         "SelectsByIndex",
         "SelectsByText",
         "SelectsByValue",
+        "SelectsOptions",
+        "StaysWithinCommandBudget",
         "SwitchesTo",
         "SwitchesToTab",
         "SwitchesToWindow",
@@ -208,6 +237,7 @@ def test_actions() -> None:
         "Visits",
         "Wait",
         "Waits",
+        "WithinCommandBudget",
     )
     assert sorted(screenpy_selenium.actions.__all__) == sorted(expected)
 
@@ -258,3 +288,43 @@ def test_resolutions() -> None:
         "Visible",
     ]
     assert sorted(screenpy_selenium.resolutions.__all__) == sorted(expected)
+
+
+@pytest.mark.parametrize(
+    "package",
+    [
+        screenpy_selenium,
+        screenpy_selenium.abilities,
+        screenpy_selenium.actions,
+        screenpy_selenium.questions,
+        screenpy_selenium.resolutions,
+    ],
+)
+def test_every_name_can_be_imported(package: ModuleType) -> None:
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+
+def test_aliases_are_the_same_objects() -> None:
+    assert screenpy_selenium.Clicks is screenpy_selenium.actions.Click
+    assert screenpy_selenium.TheText is screenpy_selenium.questions.Text
+    assert screenpy_selenium.Visible is screenpy_selenium.resolutions.IsVisible
+    assert screenpy_selenium.resolutions.IsEnabled is screenpy_selenium.IsClickable
+
+
+def test_unknown_names_raise_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="Clack"):
+        screenpy_selenium.Clack  # noqa: B018
+
+
+def test_importing_is_lazy() -> None:
+    script = (
+        "import sys\n"
+        "from screenpy_selenium import Click, Target\n"
+        "eager = [name for name in sys.modules if name.startswith(("
+        "'selenium.webdriver.chrome', 'selenium.webdriver.support', "
+        "'screenpy_pyotp', 'screenpy_selenium.actions.wait'))]\n"
+        "assert not eager, eager\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
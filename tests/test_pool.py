@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from screenpy_selenium import BrowserPool, BrowsingError
+from screenpy_selenium.pool import (
+    CLEAR_STORAGE,
+    BrowserLauncher,
+    is_healthy,
+    reset_browser,
+)
+
+from .useful_mocks import get_mocked_webdriver
+
+
+def get_pool(
+    max_size: int = 2, timeout: float | None = None
+) -> tuple[BrowserPool, list[mock.Mock]]:
+    browsers = [get_mocked_webdriver() for _ in range(3)]
+    factory = mock.Mock(side_effect=browsers)
+    return BrowserPool(factory, max_size=max_size, timeout=timeout), browsers
+
+
+class TestResetBrowser:
+    def test_resets_state(self) -> None:
+        browser = get_mocked_webdriver()
+        browser.window_handles = ["first", "second", "third"]
+
+        reset_browser(browser)
+
+        assert browser.switch_to.window.call_args_list == [
+            mock.call("second"),
+            mock.call("third"),
+            mock.call("first"),
+        ]
+        assert browser.close.call_count == 2
+        browser.delete_all_cookies.assert_called_once_with()
+        browser.execute_script.assert_called_once_with(CLEAR_STORAGE)
+        browser.get.assert_called_once_with("about:blank")
+
+    def test_is_healthy(self) -> None:
+        healthy_browser = get_mocked_webdriver()
+        crashed_browser = get_mocked_webdriver()
+        type(crashed_browser).window_handles = mock.PropertyMock(
+            side_effect=WebDriverException
+        )
+
+        assert is_healthy(healthy_browser)
+        assert not is_healthy(crashed_browser)
+
+
+class TestBrowserPool:
+    def test_launches_on_demand(self) -> None:
+        pool, browsers = get_pool()
+
+        assert pool.acquire() is browsers[0]
+        assert pool.acquire() is browsers[1]
+        assert pool.size == 2
+
+    def test_reuses_released_browsers(self) -> None:
+        pool, browsers = get_pool()
+        pool.acquire()
+
+        pool.release(browsers[0])
+
+        assert pool.acquire() is browsers[0]
+        browsers[0].get.assert_called_once_with("about:blank")
+        assert pool.size == 1
+
+    def test_discards_browsers_which_fail_to_reset(self) -> None:
+        pool, browsers = get_pool()
+        pool.acquire()
+        browsers[0].delete_all_cookies.side_effect = WebDriverException
+
+        pool.release(browsers[0])
+
+        browsers[0].quit.assert_called_once_with()
+        assert pool.size == 0
+        assert pool.acquire() is browsers[1]
+
+    def test_discards_unhealthy_browsers(self) -> None:
+        pool, browsers = get_pool()
+        pool.health_check = mock.Mock(side_effect=[False, True])
+        pool.release(pool.acquire())
+
+        assert pool.acquire() is browsers[1]
+        browsers[0].quit.assert_called_once_with()
+        assert pool.size == 1
+
+    def test_is_bounded(self) -> None:
+        pool, _ = get_pool(max_size=1, timeout=0)
+        pool.acquire()
+
+        with pytest.raises(BrowsingError):
+            pool.acquire()
+
+    def test_waits_for_a_released_browser(self) -> None:
+        pool, browsers = get_pool(max_size=1, timeout=5)
+        pool.acquire()
+        acquired = []
+
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+        waiter.start()
+        pool.release(browsers[0])
+        waiter.join(timeout=5)
+
+        assert acquired == [browsers[0]]
+
+    def test_frees_slot_when_launch_fails(self) -> None:
+        pool, _ = get_pool(max_size=1)
+        pool.factory = mock.Mock(side_effect=WebDriverException)
+
+        with pytest.raises(WebDriverException):
+            pool.acquire()
+
+        assert pool.size == 0
+
+    def test_close(self) -> None:
+        pool, (idle_browser, busy_browser, _) = get_pool()
+        with pool:
+            pool.acquire()
+            pool.acquire()
+            pool.release(idle_browser)
+
+        idle_browser.quit.assert_called_once_with()
+        busy_browser.quit.assert_not_called()
+        with pytest.raises(BrowsingError):
+            pool.acquire()
+
+        pool.release(busy_browser)
+
+        busy_browser.quit.assert_called_once_with()
+        assert pool.size == 0
+
+
+class TestBrowserLauncher:
+    def test_launches_ahead(self) -> None:
+        browsers = [get_mocked_webdriver() for _ in range(4)]
+        first_browser = browsers[0]
+        launched = threading.Semaphore(0)
+
+        def factory() -> mock.Mock:
+            launched.release()
+            return browsers.pop(0)
+
+        launcher = BrowserLauncher(factory, count=2)
+        assert launcher.take() is first_browser
+
+        assert launched.acquire(timeout=5)
+        assert launched.acquire(timeout=5)
+        assert launched.acquire(timeout=5)
+        launcher.close()
+        first_browser.quit.assert_not_called()
+
+    def test_close_quits_untaken_browsers(self) -> None:
+        browser = get_mocked_webdriver()
+        started = threading.Event()
+
+        def factory() -> mock.Mock:
+            started.set()
+            return browser
+
+        launcher = BrowserLauncher(factory, count=1)
+        assert started.wait(timeout=5)
+
+        launcher.close()
+
+        browser.quit.assert_called_once_with()
+        with pytest.raises(BrowsingError):
+            launcher.take()
+
+    def test_launch_errors_are_raised_on_take(self) -> None:
+        launcher = BrowserLauncher(mock.Mock(side_effect=WebDriverException))
+
+        with pytest.raises(WebDriverException):
+            launcher.take()
+
+        launcher.close()
+
+    def test_needs_at_least_one_browser(self) -> None:
+        with pytest.raises(ValueError, match="at least one"):
+            BrowserLauncher(get_mocked_webdriver, count=0)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Generator
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from screenpy_selenium import Target, TargetingError
+from screenpy_selenium.configuration import ScreenPySeleniumSettings
+from screenpy_selenium.profiling import TargetProfiler, _save_report_at_exit
+
+from .useful_mocks import get_mocked_browser
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from screenpy import Actor
+
+SETTINGS_PATH = "screenpy_selenium.profiling.settings"
+
+
+@pytest.fixture
+def profiler() -> Generator[TargetProfiler, None, None]:
+    new_profiler = TargetProfiler()
+    with mock.patch("screenpy_selenium.target.target_profiler", new_profiler):
+        yield new_profiler
+
+
+class TestTargetProfiler:
+    def test_does_not_record_when_turned_off(
+        self, profiler: TargetProfiler, Tester: Actor
+    ) -> None:
+        with mock.patch(SETTINGS_PATH, ScreenPySeleniumSettings()):
+            Target.the("spam").located_by("#spam").found_by(Tester)
+
+        assert profiler.durations == {}
+
+    def test_records_lookups(self, profiler: TargetProfiler, Tester: Actor) -> None:
+        target = Target.the("spam").located_by("#spam")
+
+        with mock.patch(SETTINGS_PATH, ScreenPySeleniumSettings(PROFILE_TARGETS=True)):
+            target.found_by(Tester)
+            target.all_found_by(Tester)
+
+        [stats] = profiler.stats()
+        assert stats["target"] == "spam"
+        assert stats["strategy"] == "css selector"
+        assert stats["locator"] == "#spam"
+        assert stats["count"] == 2
+        assert stats["failures"] == 0
+
+    def test_records_failures(self, profiler: TargetProfiler, Tester: Actor) -> None:
+        get_mocked_browser(Tester).find_element.side_effect = WebDriverException
+        target = Target.the("spam").located_by("#spam")
+
+        mock_settings = ScreenPySeleniumSettings(PROFILE_TARGETS=True)
+
+        with mock.patch(SETTINGS_PATH, mock_settings), pytest.raises(TargetingError):
+            target.found_by(Tester)
+
+        [stats] = profiler.stats()
+        assert stats["count"] == 1
+        assert stats["failures"] == 1
+
+    def test_records_batched_lookups_once(
+        self, profiler: TargetProfiler, Tester: Actor
+    ) -> None:
+        get_mocked_browser(Tester).execute_script.return_value = ["spam", "eggs"]
+        spam = Target.the("spam").located_by("#spam")
+        eggs = Target.the("eggs").located_by("#eggs")
+
+        with mock.patch(SETTINGS_PATH, ScreenPySeleniumSettings(PROFILE_TARGETS=True)):
+            Target.resolve_all(Tester, spam, eggs)
+
+        [stats] = profiler.stats()
+        assert stats["target"] == "(batched lookup)"
+        assert stats["count"] == 1
+
+    def test_stats(self) -> None:
+        profiler = TargetProfiler()
+        slow = ("slow", "xpath", "//slow")
+        fast = ("fast", "css selector", "#fast")
+        for duration in (0.001, 0.002, 0.003, 0.004):
+            profiler.record(slow, duration, failed=False)
+        profiler.record(fast, 0.001, failed=True)
+
+        slow_stats, fast_stats = profiler.stats()
+
+        assert slow_stats["target"] == "slow"
+        assert slow_stats["total_ms"] == 10
+        assert slow_stats["p50_ms"] == 2
+        assert slow_stats["p95_ms"] == 4
+        assert slow_stats["max_ms"] == 4
+        assert fast_stats["target"] == "fast"
+        assert fast_stats["failures"] == 1
+
+    def test_report(self) -> None:
+        profiler = TargetProfiler()
+        profiler.record(("spam", "xpath", "//spam"), 0.5, failed=False)
+
+        header, row = profiler.report().splitlines()
+
+        assert header.split()[:2] == ["Target", "Strategy"]
+        assert row.split() == ["spam", "xpath", "1", "0"] + ["500.0"] * 4
+
+    def test_save(self, tmp_path: Path) -> None:
+        profiler = TargetProfiler()
+        profiler.record(("spam", "xpath", "//spam"), 0.5, failed=False)
+
+        profiler.save(str(tmp_path / "profile.json"))
+
+        saved = json.loads((tmp_path / "profile.json").read_text())
+        assert saved == profiler.stats()
+        assert (tmp_path / "profile.txt").read_text() == profiler.report() + "\n"
+
+    def test_reset(self) -> None:
+        profiler = TargetProfiler()
+        profiler.record(("spam", "xpath", "//spam"), 0.5, failed=False)
+
+        profiler.reset()
+
+        assert profiler.stats() == []
+
+    @mock.patch(
+        "screenpy_selenium.profiling.target_profiler", new_callable=TargetProfiler
+    )
+    def test_saves_report_at_exit(
+        self, profiler: TargetProfiler, tmp_path: Path
+    ) -> None:
+        profiler.record(("spam", "xpath", "//spam"), 0.5, failed=False)
+        report_path = str(tmp_path / "profile-{pid}.json")
+        mock_settings = ScreenPySeleniumSettings(PROFILE_TARGETS_REPORT=report_path)
+
+        with mock.patch(SETTINGS_PATH, mock_settings):
+            _save_report_at_exit()
+
+        assert len(list(tmp_path.glob("profile-*.json"))) == 1
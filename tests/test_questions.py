@@ -8,6 +8,7 @@ import pytest
 from screenpy import Answerable, Describable, ErrorKeeper, UnableToAnswer
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.alert import Alert as SeleniumAlert
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
 from screenpy_selenium import (
@@ -24,6 +25,7 @@ from screenpy_selenium import (
     Text,
     TextOfTheAlert,
 )
+from screenpy_selenium.scripts import COUNT
 
 from .useful_mocks import get_mock_target_class, get_mocked_browser, get_mocked_element
 
@@ -81,6 +83,28 @@ class TestAttribute:
         mocked_browser.find_elements.assert_called_once_with(*fake_target)
         element.get_attribute.assert_called_once_with(attr)
 
+    def test_all_at_once_sets_batched(self) -> None:
+        assert Attribute("").of_all(TARGET).all_at_once().batched
+        assert not Attribute("").of_all(TARGET).batched
+
+    def test_ask_for_attribute_multi_all_at_once(self, Tester: Actor) -> None:
+        fake_target = Target.the("fake").located_by("//html")
+        attr = "foo"
+        values = ["bar", None]
+        mocked_browser = get_mocked_browser(Tester)
+        elements = [get_mocked_element(), get_mocked_element()]
+        mocked_browser.find_elements.return_value = elements
+        mocked_browser.execute_script.return_value = [
+            {f"attribute:{attr}": value} for value in values
+        ]
+
+        answer = Attribute(attr).of_all(fake_target).all_at_once().answered_by(Tester)
+
+        assert answer == values
+        mocked_browser.execute_script.assert_called_once()
+        for element in elements:
+            element.get_attribute.assert_not_called()
+
     def test_describe(self) -> None:
         assert Attribute("foo").describe() == 'The "foo" attribute of the None.'
 
@@ -252,12 +276,33 @@ class TestNumber:
 
     def test_ask_for_number(self, Tester: Actor) -> None:
         fake_target = Target.the("fake").located_by("//xpath")
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = 3
+
+        assert Number.of(fake_target).answered_by(Tester) == 3
+        mocked_browser.execute_script.assert_called_once_with(
+            COUNT, [("xpath", "//xpath")]
+        )
+        mocked_browser.find_elements.assert_not_called()
+
+    def test_ask_for_number_falls_back(self, Tester: Actor) -> None:
+        fake_target = Target.the("fake").located_by((By.LINK_TEXT, "spam"))
         return_value = [1, 2, 3]
         mocked_browser = get_mocked_browser(Tester)
         mocked_browser.find_elements.return_value = return_value
 
         assert Number.of(fake_target).answered_by(Tester) == len(return_value)
         mocked_browser.find_elements.assert_called_once_with(*fake_target)
+        mocked_browser.execute_script.assert_not_called()
+
+    def test_ask_for_number_waits_when_none_are_counted(self, Tester: Actor) -> None:
+        fake_target = Target.the("fake").located_by("//xpath")
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = 0
+        mocked_browser.find_elements.return_value = [1, 2]
+
+        assert Number.of(fake_target).answered_by(Tester) == 2
+        mocked_browser.find_elements.assert_called_once_with(*fake_target)
 
     def test_describe(self) -> None:
         assert Number(TARGET).describe() == f"The number of {TARGET}."
@@ -370,6 +415,27 @@ class TestText:
         assert Text.of_all(fake_target).answered_by(Tester) == expected_texts
         mocked_browser.find_elements.assert_called_once_with(*fake_target)
 
+    def test_all_at_once_sets_batched(self) -> None:
+        assert Text.of_all(TARGET).all_at_once().batched
+        assert not Text.of_all(TARGET).batched
+
+    def test_ask_for_all_text_all_at_once(self, Tester: Actor) -> None:
+        fake_target = Target.the("fakes").located_by("//xpath")
+        mocked_browser = get_mocked_browser(Tester)
+        expected_texts = ["spam", "eggs", "baked beans"]
+        mocked_browser.find_elements.return_value = [
+            get_mocked_element() for _ in expected_texts
+        ]
+        mocked_browser.execute_script.return_value = [
+            {"text": text} for text in expected_texts
+        ]
+
+        answer = Text.of_all(fake_target).all_at_once().answered_by(Tester)
+
+        assert answer == expected_texts
+        mocked_browser.find_elements.assert_called_once_with(*fake_target)
+        mocked_browser.execute_script.assert_called_once()
+
     def test_describe(self) -> None:
         assert Text(TARGET).describe() == f"The text from the {TARGET}."
 
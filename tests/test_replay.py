@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from screenpy import AnActor
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from screenpy_selenium import BrowseTheWeb, BrowsingError, Open, Target, Text
+from screenpy_selenium.replay import Recording, RecordingExecutor, ReplayDriver, record
+
+from .useful_mocks import get_mocked_webdriver
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+def get_recording() -> Recording:
+    return Recording(
+        [
+            {
+                "command": "get",
+                "params": {"url": "https://example.com"},
+                "response": {"value": None},
+            },
+            {
+                "command": "findElement",
+                "params": {"using": "css selector", "value": "#spam"},
+                "response": {"value": {ELEMENT_KEY: "spam-id"}},
+            },
+            {
+                "command": "getElementText",
+                "params": {"id": "spam-id"},
+                "response": {"value": "eggs"},
+            },
+        ],
+        {"browserName": "chrome"},
+    )
+
+
+class TestRecord:
+    def test_records_commands(self) -> None:
+        browser = get_mocked_webdriver()
+        executor = browser.command_executor = mock.create_autospec(
+            RemoteConnection, instance=True
+        )
+        executor.execute.return_value = {"value": "spam"}
+        browser.caps = {"browserName": "firefox"}
+
+        recording = record(browser)
+        browser.command_executor.execute("getTitle", {})
+        browser.command_executor.execute("quit", {})
+
+        assert isinstance(browser.command_executor, RecordingExecutor)
+        assert recording.capabilities == {"browserName": "firefox"}
+        assert recording.commands == [
+            {"command": "getTitle", "params": {}, "response": {"value": "spam"}}
+        ]
+
+    def test_without_command_executor(self) -> None:
+        with pytest.raises(BrowsingError):
+            record(get_mocked_webdriver())
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        recording = get_recording()
+
+        recording.save(str(tmp_path / "recording.json"))
+        loaded = Recording.load(str(tmp_path / "recording.json"))
+
+        assert loaded.commands == recording.commands
+        assert loaded.capabilities == recording.capabilities
+
+
+class TestReplayDriver:
+    def test_replays_a_test(self) -> None:
+        Perry = AnActor.named("Perry").who_can(
+            BrowseTheWeb.using(ReplayDriver(get_recording()))
+        )
+
+        Perry.attempts_to(Open.their_browser_on("https://example.com"))
+        text = Text.of_the(Target.the("spam").located_by("#spam")).answered_by(Perry)
+        Perry.exit()
+
+        assert text == "eggs"
+
+    def test_replays_errors(self) -> None:
+        recording = Recording(
+            [
+                {
+                    "command": "findElement",
+                    "params": {},
+                    "response": {
+                        "status": 404,
+                        "value": json.dumps(
+                            {"value": {"error": "no such element", "message": ""}}
+                        ),
+                    },
+                }
+            ]
+        )
+
+        with pytest.raises(NoSuchElementException):
+            ReplayDriver(recording).find_element("css selector", "#spam")
+
+    def test_can_be_recorded_again(self) -> None:
+        driver = ReplayDriver(get_recording())
+
+        recording = record(driver)
+        driver.get("https://example.com")
+        driver.find_element("css selector", "#spam").text  # noqa: B018
+
+        assert [(c["command"], c["response"]) for c in recording.commands] == [
+            (c["command"], c["response"]) for c in get_recording().commands
+        ]
+
+    def test_wrong_command(self) -> None:
+        driver = ReplayDriver(get_recording())
+
+        with pytest.raises(BrowsingError, match='Expected a "get" command'):
+            driver.refresh()
+
+    def test_recording_ran_out(self) -> None:
+        driver = ReplayDriver(Recording())
+
+        with pytest.raises(BrowsingError, match="ran out"):
+            driver.refresh()
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from screenpy_selenium.scripts import to_script_locator
+
+
+class TestToScriptLocator:
+    @pytest.mark.parametrize(
+        ("locator", "expected"),
+        [
+            ((By.XPATH, "//div"), ("xpath", "//div")),
+            ((By.CSS_SELECTOR, "div.spam"), ("css", "div.spam")),
+            ((By.TAG_NAME, "div"), ("css", "div")),
+            ((By.ID, "spam"), ("css", '[id="spam"]')),
+            ((By.NAME, "spam"), ("css", '[name="spam"]')),
+            ((By.CLASS_NAME, "spam"), ("css", ".spam")),
+        ],
+    )
+    def test_translates_locators(
+        self, locator: tuple[str, str], expected: tuple[str, str]
+    ) -> None:
+        assert to_script_locator(locator) == expected
+
+    @pytest.mark.parametrize("how", [By.LINK_TEXT, By.PARTIAL_LINK_TEXT])
+    def test_cannot_translate_link_text(self, how: str) -> None:
+        assert to_script_locator((how, "spam")) is None
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
-from selenium.common.exceptions import WebDriverException
+from screenpy import AnActor
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
 
-from screenpy_selenium import Target, TargetingError
+from screenpy_selenium import BrowseTheWeb, Click, Target, TargetingError
+from screenpy_selenium.element_proxy import ElementProxy
+from screenpy_selenium.scripts import COUNT, RESOLVE_ALL
 
-from .useful_mocks import get_mocked_browser
+from .useful_mocks import get_mocked_browser, get_mocked_element, get_mocked_webdriver
 
 if TYPE_CHECKING:
     from screenpy import Actor
@@ -63,16 +72,19 @@ def test_get_locator() -> None:
     css_selector = "#id"
     xpath_locator = '//div[@id="id"]'
     xpath_locator_2 = "(//a)[5]"
+    xpath_locator_3 = ".//a"
     id_locator = "someID"
 
     css_target = Target.the("css element").located_by(css_selector)
     xpath_target = Target.the("xpath element").located_by(xpath_locator)
     xpath_target_2 = Target.the("xpath element 2").located_by(xpath_locator_2)
+    xpath_target_3 = Target.the("xpath element 3").located_by(xpath_locator_3)
     id_target = Target.the("id element").located_by((By.ID, id_locator))
 
     assert css_target.get_locator() == (By.CSS_SELECTOR, css_selector)
     assert xpath_target.get_locator() == (By.XPATH, xpath_locator)
     assert xpath_target_2.get_locator() == (By.XPATH, xpath_locator_2)
+    assert xpath_target_3.get_locator() == (By.XPATH, xpath_locator_3)
     assert id_target.get_locator() == (By.ID, id_locator)
 
 
@@ -129,6 +141,20 @@ def test_all_found_by(Tester: Actor) -> None:
     mocked_browser.find_elements.assert_called_once_with(*test_locator)
 
 
+def test_all_found_by_with_prefetch(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.find_elements.return_value = [get_mocked_element()]
+    mocked_browser.execute_script.return_value = [{"text": "spam"}]
+
+    elements = (
+        Target.the("test").located("#spam").all_found_by(Tester, prefetch=["text"])
+    )
+
+    assert isinstance(elements[0], ElementProxy)
+    assert elements[0].text == "spam"
+    mocked_browser.execute_script.assert_called_once()
+
+
 def test_all_found_by_raises(Tester: Actor) -> None:
     test_name = "transmogrifier"
     mocked_browser = get_mocked_browser(Tester)
@@ -139,6 +165,388 @@ def test_all_found_by_raises(Tester: Actor) -> None:
     assert test_name in str(excinfo.value)
 
 
+def test_cached_sets_cache() -> None:
+    assert Target.the("test").located_by("*").cached().cache
+    assert Target.the("test").located_by("*").remembered().cache
+    assert not Target.the("test").located_by("*").cache
+
+
+def test_cached_found_by_only_finds_once() -> None:
+    browser = get_mocked_webdriver()
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    target = Target.the("test").located_by("#eggs").cached()
+
+    first = target.found_by(Cachey)
+    second = target.found_by(Cachey)
+
+    assert first is second
+    browser.find_element.assert_called_once_with(*target)
+
+
+def test_cached_element_is_found_again_after_navigating() -> None:
+    browser = get_mocked_webdriver()
+    browser.find_element.side_effect = [
+        WebElement(browser, "old-link"),
+        WebElement(browser, "new-link"),
+    ]
+    clicked = []
+
+    def execute(command: str, params: dict) -> dict:
+        if command == Command.CLICK_ELEMENT:
+            if "old-link" in clicked and params["id"] == "old-link":
+                # the first click went to a new page, so the old link is gone
+                raise StaleElementReferenceException
+            clicked.append(params["id"])
+        return {"value": None}
+
+    browser.execute.side_effect = execute
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    link = Target.the("link").located_by("#link").cached()
+
+    Cachey.attempts_to(Click.on_the(link), Click.on_the(link), Click.on_the(link))
+
+    assert clicked == ["old-link", "new-link", "new-link"]
+    assert browser.find_element.call_count == 2
+
+
+def test_cached_elements_are_found_again_after_navigating() -> None:
+    browser = get_mocked_webdriver()
+    browser.find_elements.side_effect = [
+        [WebElement(browser, "old-spam"), WebElement(browser, "old-eggs")],
+        [WebElement(browser, "new-spam"), WebElement(browser, "new-eggs")],
+        [WebElement(browser, "new-spam"), WebElement(browser, "new-eggs")],
+    ]
+    browser.find_element.return_value = WebElement(browser, "link")
+
+    def execute(command: str, params: dict) -> dict:
+        if params.get("id", "").startswith("old-") and navigated:
+            raise StaleElementReferenceException
+        if command == Command.CLICK_ELEMENT:
+            navigated.append(params["id"])
+        return {"value": params.get("id")}
+
+    navigated: list[str] = []
+    browser.execute.side_effect = execute
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    items = Target.the("items").located_by(".item").cached()
+    link = Target.the("link").located_by("#link")
+
+    assert [element.text for element in items.all_found_by(Cachey)] == [
+        "old-spam",
+        "old-eggs",
+    ]
+    Cachey.attempts_to(Click.on_the(link))
+
+    assert [element.text for element in items.all_found_by(Cachey)] == [
+        "new-spam",
+        "new-eggs",
+    ]
+    assert browser.find_elements.call_count == 3
+
+
+def test_cached_element_which_is_gone_raises() -> None:
+    browser = get_mocked_webdriver()
+    browser.find_elements.side_effect = [
+        [WebElement(browser, "old-spam"), WebElement(browser, "old-eggs")],
+        [WebElement(browser, "new-spam")],
+    ]
+    browser.execute.side_effect = StaleElementReferenceException
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    items = Target.the("items").located_by(".item").cached()
+    _, eggs = items.all_found_by(Cachey)
+
+    with pytest.raises(TargetingError) as excinfo:
+        eggs.click()
+    assert "items" in str(excinfo.value)
+
+
+def test_cached_all_found_by_only_finds_once() -> None:
+    browser = get_mocked_webdriver()
+    browser.find_elements.return_value = ["spam", "eggs"]
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    target = Target.the("test").located_by("#eggs").cached()
+
+    first = target.all_found_by(Cachey)
+    second = target.all_found_by(Cachey)
+
+    assert first == second == ["spam", "eggs"]
+    browser.find_elements.assert_called_once_with(*target)
+
+
+def test_cached_all_found_by_does_not_cache_nothing() -> None:
+    browser = get_mocked_webdriver()
+    browser.find_elements.return_value = []
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    target = Target.the("test").located_by("#eggs").cached()
+
+    target.all_found_by(Cachey)
+    target.all_found_by(Cachey)
+
+    assert browser.find_elements.call_count == 2
+
+
+def test_uncached_found_by_finds_every_time() -> None:
+    browser = get_mocked_webdriver()
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    target = Target.the("test").located_by("#eggs")
+
+    target.found_by(Cachey)
+    target.found_by(Cachey)
+
+    assert browser.find_element.call_count == 2
+
+
+def test_cache_is_cleared_when_context_changes() -> None:
+    browser = get_mocked_webdriver()
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    target = Target.the("test").located_by("#eggs").cached()
+
+    target.found_by(Cachey)
+    Cachey.ability_to(BrowseTheWeb).switched_to(frame="the frame")
+    target.found_by(Cachey)
+
+    assert browser.find_element.call_count == 2
+
+
+def test_inside_sets_parent() -> None:
+    parent = Target.the("parent").located_by("#parent")
+
+    assert Target().located_by("a").inside_the(parent).parent is parent
+    assert Target().located_by("a").inside(parent).parent is parent
+    assert Target().located_by("a").within(parent).parent is parent
+    assert Target().located_by("a").parent is None
+
+
+def test_scoped_found_by_searches_inside_parent(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    parent = Target.the("parent").located_by("#parent")
+    child = Target.the("child").located_by("a").inside_the(parent)
+
+    element = child.found_by(Tester)
+
+    parent_element = mocked_browser.find_element.return_value
+    mocked_browser.find_element.assert_called_once_with(*parent)
+    parent_element.find_element.assert_called_once_with(*child)
+    assert element == parent_element.find_element.return_value
+
+
+def test_scoped_all_found_by_searches_inside_parent(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    parent = Target.the("parent").located_by("#parent")
+    child = Target.the("child").located_by("a").inside_the(parent)
+
+    child.all_found_by(Tester)
+
+    parent_element = mocked_browser.find_element.return_value
+    mocked_browser.find_element.assert_called_once_with(*parent)
+    mocked_browser.find_elements.assert_not_called()
+    parent_element.find_elements.assert_called_once_with(*child)
+
+
+def test_scoped_found_by_reuses_cached_parent() -> None:
+    browser = get_mocked_webdriver()
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    parent = Target.the("parent").located_by("#parent").cached()
+    first_child = Target.the("first").located_by("a").inside_the(parent)
+    second_child = Target.the("second").located_by("b").inside_the(parent)
+
+    first_child.found_by(Cachey)
+    second_child.found_by(Cachey)
+
+    browser.find_element.assert_called_once_with(*parent)
+
+
+def test_scoped_found_by_raises_when_parent_missing(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.find_element.side_effect = WebDriverException
+    parent = Target.the("parent").located_by("#parent")
+    child = Target.the("child").located_by("a").inside_the(parent)
+
+    with pytest.raises(TargetingError) as excinfo:
+        child.found_by(Tester)
+    assert "parent" in str(excinfo.value)
+
+
+def test_scoped_cache_key_includes_parent() -> None:
+    parent = Target.the("parent").located_by("#parent")
+    child = Target.the("child").located_by("a").inside_the(parent)
+
+    assert child.cache_key != Target.the("unscoped").located_by("a").cache_key
+
+
+def test_number_found_by(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = 42
+
+    assert Target.the("test").located("#spam").number_found_by(Tester) == 42
+    mocked_browser.execute_script.assert_called_once_with(COUNT, [("css", "#spam")])
+
+
+def test_number_found_by_uses_cache() -> None:
+    browser = get_mocked_webdriver()
+    browser.find_elements.return_value = ["spam", "eggs"]
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    target = Target.the("test").located_by("#eggs").cached()
+    target.all_found_by(Cachey)
+
+    assert target.number_found_by(Cachey) == 2
+    browser.execute_script.assert_not_called()
+
+
+def test_number_found_by_finds_all_when_none_are_counted(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = 0
+    mocked_browser.find_elements.return_value = ["spam", "eggs"]
+    target = Target.the("test").located("#spam")
+
+    assert target.number_found_by(Tester) == 2
+    mocked_browser.find_elements.assert_called_once_with(*target)
+
+
+def test_number_found_by_raises(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.side_effect = WebDriverException
+
+    with pytest.raises(TargetingError) as excinfo:
+        Target.the("frobnosticator").located("#spam").number_found_by(Tester)
+    assert "frobnosticator" in str(excinfo.value)
+
+
+def test_script_locator() -> None:
+    assert Target().located_by("#eggs").script_locator == [("css", "#eggs")]
+    assert Target().located_by("//eggs").script_locator == [("xpath", "//eggs")]
+    assert Target().located_by((By.LINK_TEXT, "eggs")).script_locator is None
+
+
+def test_scoped_script_locator() -> None:
+    parent = Target.the("parent").located_by("#parent")
+    link_parent = Target.the("link").located_by((By.LINK_TEXT, "spam"))
+
+    child = Target.the("child").located_by(".//a").inside_the(parent)
+    orphan = Target.the("orphan").located_by("a").inside_the(link_parent)
+
+    assert child.script_locator == [("css", "#parent"), ("xpath", ".//a")]
+    assert orphan.script_locator is None
+
+
+def test_resolve_all(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = ["spam", "eggs"]
+    spam = Target.the("spam").located_by("#spam")
+    eggs = Target.the("eggs").located_by("//eggs")
+
+    elements = Target.resolve_all(Tester, spam, eggs)
+
+    assert elements == ["spam", "eggs"]
+    mocked_browser.execute_script.assert_called_once_with(
+        RESOLVE_ALL, [[("css", "#spam")], [("xpath", "//eggs")]]
+    )
+    mocked_browser.find_element.assert_not_called()
+
+
+def test_resolve_all_falls_back_for_unscriptable_locators(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = ["spam"]
+    mocked_browser.find_element.return_value = "link"
+    spam = Target.the("spam").located_by("#spam")
+    link = Target.the("link").located_by((By.LINK_TEXT, "Click me!"))
+
+    elements = Target.resolve_all(Tester, link, spam)
+
+    assert elements == ["link", "spam"]
+    mocked_browser.find_element.assert_called_once_with(*link)
+
+
+def test_resolve_all_uses_and_fills_cache() -> None:
+    browser = get_mocked_webdriver()
+    browser.execute_script.return_value = ["eggs"]
+    Cachey = AnActor.named("Cachey").who_can(BrowseTheWeb.using(browser))
+    spam = Target.the("spam").located_by("#spam").cached()
+    eggs = Target.the("eggs").located_by("#eggs").cached()
+    spam_element = spam.found_by(Cachey)
+
+    elements = Target.resolve_all(Cachey, spam, eggs)
+
+    assert elements == [spam_element, "eggs"]
+    browser.execute_script.assert_called_once_with(RESOLVE_ALL, [[("css", "#eggs")]])
+    assert eggs.found_by(Cachey) == "eggs"
+
+
+def test_resolve_all_finds_missing_elements_the_usual_way(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = ["spam", None]
+    mocked_browser.find_element.return_value = "eggs"
+    spam = Target.the("spam").located_by("#spam")
+    eggs = Target.the("eggs").located_by("#eggs")
+
+    elements = Target.resolve_all(Tester, spam, eggs)
+
+    assert elements == ["spam", "eggs"]
+    mocked_browser.find_element.assert_called_once_with(*eggs)
+
+
+def test_resolve_all_raises_when_not_found(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = ["spam", None]
+    mocked_browser.find_element.side_effect = WebDriverException
+    spam = Target.the("spam").located_by("#spam")
+    eggs = Target.the("eggs").located_by("#eggs")
+
+    with pytest.raises(TargetingError) as excinfo:
+        Target.resolve_all(Tester, spam, eggs)
+    assert "eggs" in str(excinfo.value)
+
+
+def test_resolve_all_is_profiled(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = ["spam", "eggs"]
+    spam = Target.the("spam").located_by("#spam")
+    eggs = Target.the("eggs").located_by("#eggs")
+
+    with mock.patch("screenpy_selenium.target.target_profiler") as profiler:
+        Target.resolve_all(Tester, spam, eggs)
+
+    profiler.timing_batch.assert_called_once_with()
+    profiler.timing.assert_not_called()
+
+
+def test_resolve_all_raises_on_webdriver_exception(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.side_effect = WebDriverException
+    spam = Target.the("spam").located_by("#spam")
+
+    with pytest.raises(TargetingError) as excinfo:
+        Target.resolve_all(Tester, spam)
+    assert "spam" in str(excinfo.value)
+
+
+def test_bound_to_finds_the_bound_element(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    spam = Target.the("spam").located_by("#spam")
+    eggs = Target.the("eggs").located_by("#eggs")
+    element = get_mocked_element()
+
+    with Target.bound_to({spam: element}):
+        assert spam.found_by(Tester) is element
+        mocked_browser.find_element.assert_not_called()
+        eggs.found_by(Tester)
+        mocked_browser.find_element.assert_called_once_with("css selector", "#eggs")
+    spam.found_by(Tester)
+
+    assert mocked_browser.find_element.call_count == 2
+
+
+def test_bound_to_nests(Tester: Actor) -> None:
+    spam = Target.the("spam").located_by("#spam")
+    eggs = Target.the("eggs").located_by("#eggs")
+    spam_element = get_mocked_element()
+    eggs_element = get_mocked_element()
+
+    with Target.bound_to({spam: spam_element}), Target.bound_to({eggs: eggs_element}):
+        assert spam.found_by(Tester) is spam_element
+        assert eggs.found_by(Tester) is eggs_element
+
+
 def test_iterator() -> None:
     locator = (By.ID, "eggs")
     target = Target.the("test").located(locator)
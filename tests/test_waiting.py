@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import itertools
+from typing import Literal
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from screenpy_selenium.configuration import ScreenPySeleniumSettings
+from screenpy_selenium.waiting import (
+    MIN_POLLING_INTERVAL,
+    SCRIPT_TIMEOUT_MARGIN,
+    poll_until,
+    polling_intervals,
+    wait_in_browser,
+)
+
+SETTINGS_PATH = "screenpy_selenium.waiting.settings"
+
+
+def get_browser(script_timeout: float) -> mock.Mock:
+    browser = mock.create_autospec(WebDriver, instance=True)
+    browser.timeouts.script = script_timeout
+    return browser
+
+
+class TestWaitInBrowser:
+    def test_sends_the_condition(self) -> None:
+        browser = get_browser(script_timeout=60)
+        browser.execute_async_script.return_value = True
+        chain = [("css", "#spam")]
+
+        assert wait_in_browser(browser, 2.5, chain, "contain_text", "eggs") is True
+
+        script, *args = browser.execute_async_script.call_args[0]
+        assert "MutationObserver" in script
+        assert "var isDisplayed" in script
+        assert args == [chain, "contain_text", "eggs", 2500]
+        browser.set_script_timeout.assert_not_called()
+
+    def test_raises_and_restores_short_script_timeout(self) -> None:
+        browser = get_browser(script_timeout=1)
+        browser.execute_async_script.return_value = False
+
+        assert wait_in_browser(browser, 20, [("xpath", "//spam")], "appear") is False
+
+        assert browser.set_script_timeout.call_args_list == [
+            mock.call(20 + SCRIPT_TIMEOUT_MARGIN),
+            mock.call(1),
+        ]
+
+    def test_restores_script_timeout_after_error(self) -> None:
+        browser = get_browser(script_timeout=1)
+        browser.execute_async_script.side_effect = RuntimeError
+
+        with pytest.raises(RuntimeError):
+            wait_in_browser(browser, 20, [("xpath", "//spam")], "appear")
+
+        browser.set_script_timeout.assert_called_with(1)
+
+    def test_reads_script_timeout_for_every_wait(self) -> None:
+        browser = get_browser(script_timeout=60)
+
+        wait_in_browser(browser, 20, [("xpath", "//spam")], "appear")
+        browser.timeouts.script = 1
+        wait_in_browser(browser, 20, [("xpath", "//spam")], "appear")
+
+        assert browser.set_script_timeout.call_args_list == [
+            mock.call(20 + SCRIPT_TIMEOUT_MARGIN),
+            mock.call(1),
+        ]
+
+
+class TestPollingIntervals:
+    def first(
+        self, count: int, interval: float, mock_settings: ScreenPySeleniumSettings
+    ) -> list[float]:
+        with mock.patch(SETTINGS_PATH, mock_settings):
+            return list(itertools.islice(polling_intervals(interval), count))
+
+    def test_fixed(self) -> None:
+        mock_settings = ScreenPySeleniumSettings(POLLING_POLICY="fixed")
+
+        assert self.first(4, 0.5, mock_settings) == [0.5, 0.5, 0.5, 0.5]
+
+    def test_backoff(self) -> None:
+        mock_settings = ScreenPySeleniumSettings(
+            POLLING_POLICY="backoff", POLLING_BACKOFF_FACTOR=2, POLLING_MAX=1.5
+        )
+
+        assert self.first(6, 0.25, mock_settings) == [0.25, 0.5, 1, 1.5, 1.5, 1.5]
+
+    def test_fast_then_slow(self) -> None:
+        mock_settings = ScreenPySeleniumSettings(
+            POLLING_POLICY="fast_then_slow", POLLING_FAST_FOR=1, POLLING_MAX=3
+        )
+
+        assert self.first(6, 0.25, mock_settings) == [0.25, 0.25, 0.25, 0.25, 3, 3]
+
+    @pytest.mark.parametrize("policy", ["fixed", "backoff", "fast_then_slow"])
+    def test_never_polls_without_pausing(
+        self, policy: Literal["fixed", "backoff", "fast_then_slow"]
+    ) -> None:
+        mock_settings = ScreenPySeleniumSettings(POLLING_POLICY=policy)
+
+        intervals = self.first(3, 0, mock_settings)
+
+        assert intervals[0] == MIN_POLLING_INTERVAL
+        assert all(interval > 0 for interval in intervals)
+
+
+@mock.patch("screenpy_selenium.waiting.time.sleep", autospec=True)
+class TestPollUntil:
+    def test_returns_first_truthy_value(self, mocked_sleep: mock.Mock) -> None:
+        browser = get_browser(script_timeout=30)
+        condition = mock.Mock(side_effect=[False, None, "spam"])
+
+        assert poll_until(browser, condition, 30, 0.5) == "spam"
+        assert condition.call_count == 3
+        assert mocked_sleep.call_count == 2
+
+    def test_ignores_missing_elements(self, mocked_sleep: mock.Mock) -> None:
+        browser = get_browser(script_timeout=30)
+        condition = mock.Mock(side_effect=[NoSuchElementException, True])
+
+        assert poll_until(browser, condition, 30, 0.5) is True
+        mocked_sleep.assert_called_once_with(0.5)
+
+    def test_backs_off(self, mocked_sleep: mock.Mock) -> None:
+        browser = get_browser(script_timeout=30)
+        condition = mock.Mock(side_effect=[False, False, False, True])
+        mock_settings = ScreenPySeleniumSettings(POLLING_POLICY="backoff")
+
+        with mock.patch(SETTINGS_PATH, mock_settings):
+            poll_until(browser, condition, 30, 0.5)
+
+        assert mocked_sleep.call_args_list == [
+            mock.call(0.5),
+            mock.call(1),
+            mock.call(2),
+        ]
+
+    def test_times_out(self, mocked_sleep: mock.Mock) -> None:
+        browser = get_browser(script_timeout=30)
+        condition = mock.Mock(return_value=False)
+
+        with pytest.raises(TimeoutException):
+            poll_until(browser, condition, 0, 0.5)
+
+        mocked_sleep.assert_not_called()
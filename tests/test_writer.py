@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from screenpy_selenium import background_writer
+from screenpy_selenium.configuration import ScreenPySeleniumSettings
+from screenpy_selenium.writer import BackgroundWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestBackgroundWriter:
+    def test_writes_the_file(self, tmp_path: Path) -> None:
+        writer = BackgroundWriter(max_workers=1)
+        path = str(tmp_path / "spam.png")
+
+        written = writer.write(path, b"eggs")
+
+        assert written.result() == path
+        assert (tmp_path / "spam.png").read_bytes() == b"eggs"
+        writer.close()
+
+    def test_flush_waits_for_every_file(self, tmp_path: Path) -> None:
+        writer = BackgroundWriter(max_workers=2)
+
+        for i in range(10):
+            writer.write(str(tmp_path / f"{i}.png"), bytes([i]))
+        writer.flush()
+
+        assert len(list(tmp_path.iterdir())) == 10
+        writer.close()
+
+    def test_flush_raises_failed_writes_once(self, tmp_path: Path) -> None:
+        writer = BackgroundWriter()
+        writer.write(str(tmp_path / "missing" / "spam.png"), b"eggs")
+
+        with pytest.raises(FileNotFoundError):
+            writer.flush()
+        writer.flush()
+        writer.close()
+
+    def test_waits_for_room(self, tmp_path: Path) -> None:
+        writer = BackgroundWriter(max_workers=1, max_pending=1)
+        unblock = threading.Event()
+        with mock.patch(
+            "screenpy_selenium.writer._write_file",
+            side_effect=lambda path, _: unblock.wait() and path,
+        ):
+            writer.write(str(tmp_path / "first.png"), b"")
+            second = threading.Thread(
+                target=writer.write, args=(str(tmp_path / "second.png"), b"")
+            )
+            second.start()
+            second.join(timeout=0.1)
+
+            assert second.is_alive()
+
+            unblock.set()
+            second.join(timeout=1)
+            writer.flush()
+
+        assert not second.is_alive()
+        writer.close()
+
+    @mock.patch("screenpy_selenium.writer.ThreadPoolExecutor", autospec=True)
+    def test_limits_come_from_settings(self, mocked_executor: mock.Mock) -> None:
+        mock_settings = ScreenPySeleniumSettings(
+            BACKGROUND_WRITER_THREADS=3, BACKGROUND_WRITER_MAX_PENDING=5
+        )
+        writer = BackgroundWriter()
+
+        with mock.patch("screenpy_selenium.writer.settings", mock_settings):
+            writer.write("spam.png", b"")
+
+        mocked_executor.assert_called_once_with(
+            max_workers=3, thread_name_prefix="screenpy_selenium_writer"
+        )
+
+    def test_starts_again_after_closing(self, tmp_path: Path) -> None:
+        writer = BackgroundWriter()
+        writer.close()
+
+        written = writer.write(str(tmp_path / "spam.png"), b"eggs")
+
+        assert written.result() == str(tmp_path / "spam.png")
+        writer.close()
+
+    def test_initialized_instance(self) -> None:
+        assert isinstance(background_writer, BackgroundWriter)
@@ -42,5 +42,9 @@ def get_mocked_browser(actor: Actor) -> mock.Mock:
     return cast(mock.Mock, actor.ability_to(BrowseTheWeb).browser)
 
 
+def get_mocked_browse_the_web(actor: Actor) -> mock.Mock:
+    return cast("mock.Mock", actor.ability_to(BrowseTheWeb))
+
+
 def get_mocked_webdriver() -> mock.Mock:
     return mock.create_autospec(WebDriver, instance=True)